@@ -1,13 +1,38 @@
-"""Universal Intelligence package."""
+"""Universal Intelligence package.
 
-from . import community, core
-from .community.agents.default import UniversalAgent as Agent
-from .community.agents.default import UniversalAgent as OtherAgent
+Components are imported on first access (PEP 562), so that importing the package does not import engines (e.g. torch,
+transformers) until a component depending on them is used.
+"""
 
-# default models, tools, agents for playground
-from .community.models.local.default import UniversalModel as Model
-from .community.models.remote.default import UniversalModel as PaidRemoteModel
-from .community.models.remote.default__free import UniversalModel as RemoteModel
-from .community.tools.default import UniversalTool as Tool
+import importlib
+from typing import Any
+
+# default models, tools, agents for playground (attribute: module, name)
+_LAZY_ATTRIBUTES = {
+    "Agent": (".community.agents.default", "UniversalAgent"),
+    "OtherAgent": (".community.agents.default", "UniversalAgent"),
+    "Model": (".community.models.local.default", "UniversalModel"),
+    "PaidRemoteModel": (".community.models.remote.default", "UniversalModel"),
+    "RemoteModel": (".community.models.remote.default__free", "UniversalModel"),
+    "Tool": (".community.tools.default", "UniversalTool"),
+}
+
+_LAZY_MODULES = ("core", "community")
 
 __all__ = ["core", "community", "Model", "Tool", "Agent", "OtherAgent", "RemoteModel", "PaidRemoteModel"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_MODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _LAZY_ATTRIBUTES:
+        module, attribute = _LAZY_ATTRIBUTES[name]
+        value = getattr(importlib.import_module(module, __name__), attribute)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
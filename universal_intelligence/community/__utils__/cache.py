@@ -0,0 +1,12 @@
+import os
+
+
+def get_cache_dir(*parts: str) -> str:
+    """Get (and create) a cache directory for community components.
+
+    The cache root defaults to `~/.cache/universal_intelligence`, and can be set with the `UIN_CACHE_DIR` environment variable.
+    """
+    root = os.environ.get("UIN_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "universal_intelligence")
+    path = os.path.join(root, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
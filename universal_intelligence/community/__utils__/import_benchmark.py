@@ -0,0 +1,66 @@
+"""
+Import-time benchmark, guarding against regressions of the lazy imports of the package.
+
+Each import runs in a fresh interpreter, and fails if it imports heavy modules it does not need (e.g. torch for remote
+models and tools, transformers before loading a local model) or exceeds its time budget (median of the runs).
+
+To run the benchmark from the project root (exits with an error on regressions):
+   python -m universal_intelligence.community.__utils__.import_benchmark
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# Statement, modules it must not import, and time budget (seconds)
+IMPORTS = [
+    ("import universal_intelligence", ["torch", "transformers", "huggingface_hub", "psutil"], 0.5),
+    ("from universal_intelligence import RemoteModel, Tool", ["torch", "transformers", "huggingface_hub"], 1.5),
+    ("from universal_intelligence import Agent", ["torch", "transformers"], 1.5),
+    ("from universal_intelligence.community.models.remote import query; query()", ["torch", "transformers", "huggingface_hub", "requests"], 0.5),  # catalog only, models are not imported
+    ("from universal_intelligence import Model", ["transformers"], 10.0),  # torch detects devices at initialization, engines are imported by `load()`
+]
+
+HEAVY_MODULES = ("torch", "transformers", "huggingface_hub", "psutil", "requests", "llama_cpp", "mlx", "onnxruntime", "optimum")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+exec(sys.argv[1])
+print(json.dumps({"time": time.perf_counter() - start, "modules": [name for name in sys.argv[2:] if name in sys.modules]}))
+"""
+
+
+def measure(statement: str, runs: int = 3) -> dict:
+    """Measure the import time of a statement in fresh interpreters (median), and the heavy modules it imports."""
+    results = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", _PROBE, statement, *HEAVY_MODULES], capture_output=True, text=True, check=True).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    return {"time": statistics.median(result["time"] for result in results), "modules": results[-1]["modules"]}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the import time of the package, failing on regressions")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per import (median)")
+    parser.add_argument("--budget-scale", type=float, default=1.0, help="Scale of the time budgets (e.g. 2 on slow hosts)")
+    args = parser.parse_args(argv)
+
+    failures = []
+    for statement, forbidden, budget in IMPORTS:
+        result = measure(statement, args.runs)
+        unexpected = [name for name in result["modules"] if name in forbidden]
+        failed = unexpected or result["time"] > budget * args.budget_scale
+        print(f"{'FAIL' if failed else 'ok  '} {result['time']:.3f}s (budget: {budget * args.budget_scale:.1f}s) {statement} - imports: {', '.join(result['modules']) or 'none'}")
+        if unexpected:
+            failures.append(f"{statement} imports {', '.join(unexpected)}")
+        elif failed:
+            failures.append(f"{statement} takes {result['time']:.3f}s")
+    if failures:
+        sys.exit("Import regressions:\n" + "\n".join(failures))
+
+
+if __name__ == "__main__":
+    main()
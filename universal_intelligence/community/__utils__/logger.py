@@ -79,11 +79,20 @@ class Logger:
     def cleanup(self) -> None:
         """Clean up the logger and restore original stdout/stderr"""
         if not self._is_clean:
-            # Restore original stdout and stderr
-            sys.stdout = self._original_stdout
-            sys.stderr = self._original_stderr
             self._is_clean = True
 
+            # Restore original stdout and stderr, unless another logger has redirected them since (e.g. concurrent invocations),
+            # skipping the streams of loggers which have been cleaned up already
+            original_stdout, original_stderr = self._original_stdout, self._original_stderr
+            while isinstance(original_stdout, LoggerStream) and original_stdout.logger._is_clean:
+                original_stdout = original_stdout.logger._original_stdout
+            while isinstance(original_stderr, LoggerStream) and original_stderr.logger._is_clean:
+                original_stderr = original_stderr.logger._original_stderr
+            if sys.stdout is self._logger_stream:
+                sys.stdout = original_stdout
+            if sys.stderr is self._logger_stream:
+                sys.stderr = original_stderr
+
     def __del__(self):
         # Call cleanup for safety
         self.cleanup()
@@ -142,6 +151,19 @@ class Logger:
         self._original_stdout.write(text + ("\n" if newline else ""))
         self._original_stdout.flush()
 
+    def stream(self, text: str, color: Color | None = None) -> None:
+        """Print streamed text as is (e.g. generated tokens), without prefix nor newline
+
+        Args:
+            text: Text chunk to print
+            color: Optional color to use for the output
+        """
+        if self._log_level == LogLevel.NONE or not text:
+            return
+
+        self._original_stdout.write(f"{color.value}{text}{Color.RESET.value}" if color else text)
+        self._original_stdout.flush()
+
     def art(self, name: str, color: Color | None = None) -> None:
         """Print ASCII art with optional color
 
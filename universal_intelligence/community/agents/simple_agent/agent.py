@@ -3,7 +3,6 @@ from typing import Any, ClassVar
 import yaml
 
 from ....community.__utils__.logger import Color, Logger, LogLevel
-from ....community.models.local.default import UniversalModel
 from ....core.universal_agent import AbstractUniversalAgent
 from ....core.universal_model import AbstractUniversalModel
 from ....core.universal_tool import AbstractUniversalTool
@@ -282,7 +281,12 @@ class UniversalAgent(AbstractUniversalAgent):
             logger.print(message=f'* Initializing agent.. ({self._contract["name"]}) *\n', color=Color.WHITE)
 
             logger.print(prefix="Agent", message="Setting model..", color=Color.GRAY)
-            self.model = model if model is not None else UniversalModel(verbose=verbose if self._log_level == LogLevel.DEBUG else "NONE")
+            if model is None:
+                # Imported on demand, so that agents given a model do not import the default local model's engines
+                from ....community.models.local.default import UniversalModel
+
+                model = UniversalModel(verbose=verbose if self._log_level == LogLevel.DEBUG else "NONE")
+            self.model = model
             logger.print(prefix="Agent", message="Setting tools..", color=Color.GRAY)
             self.tools = self._default_tools + (expand_tools if expand_tools else [])
             logger.print(prefix="Agent", message="Setting team..", color=Color.GRAY)
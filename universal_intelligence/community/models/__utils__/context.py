@@ -0,0 +1,67 @@
+"""
+Shared pinned context utilities for Universal Models.
+
+Context items are rendered (and for local models, prefilled) once into a pinned block, which
+later calls reference by handle. Pinned blocks go first in the prompt so that their cached KV
+state can be reused as a prefix, and are never duplicated into history.
+"""
+
+import itertools
+from typing import Any
+
+from ....core.utils.types import Message
+
+_context_ids = itertools.count(1)
+
+
+class PinnedContext:
+    """Handle over a rendered context block, with its prefilled KV state (local models)."""
+
+    def __init__(self, model: Any, items: list[Any]) -> None:
+        """Initialize a pinned context block over a model (see `model.pin_context()`)."""
+        self.id: int = next(_context_ids)
+        self.model = model
+        self.messages: list[Message] = [{"role": "system", "content": str(item)} for item in items]
+        self._kv: Any | None = None  # engine-specific prefilled KV state, managed by the model
+        self._kv_adapter: str | None = None  # adapter the KV state was computed with
+
+    def cached(self) -> bool:
+        """Check if the context block holds prefilled KV state"""
+        return self._kv is not None
+
+    def evict(self) -> None:
+        """Evict the context block's prefilled KV state (it is prefilled again on next use)."""
+        self._kv = None
+
+
+def split_context(model: Any, context: PinnedContext | list[Any] | None) -> tuple[list[Message], list[Message]]:
+    """Split context into pinned and plain context messages.
+
+    Args:
+        model: Model processing the context, pinned blocks must have been pinned on it
+        context: Pinned context handle, or list of context items and/or pinned context handles
+
+    Returns:
+        Tuple of (pinned messages, context messages)
+    """
+    if context is None:
+        return [], []
+    if isinstance(context, PinnedContext):
+        context = [context]
+
+    pinned, messages = [], []
+    for item in context:
+        if isinstance(item, PinnedContext):
+            if item.model is not model:
+                raise ValueError("[UniversalModelMixin:process:context] Pinned context belongs to another model")
+            pinned.extend(item.messages)
+        else:
+            messages.append({"role": "system", "content": str(item)})
+    return pinned, messages
+
+
+def pinned_blocks(context: PinnedContext | list[Any] | None) -> list[PinnedContext]:
+    """Get the pinned context handles referenced by a context argument."""
+    if isinstance(context, PinnedContext):
+        return [context]
+    return [item for item in context or [] if isinstance(item, PinnedContext)]
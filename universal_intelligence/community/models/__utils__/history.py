@@ -0,0 +1,152 @@
+"""
+Shared chat history utilities for Universal Models.
+
+Chat history is windowed to a token budget before being prepended to new messages, so that
+long-running conversations keep a bounded prompt size, latency and cost.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+
+from ....core.utils.types import Message
+
+HISTORY_STRATEGIES = ("drop", "summarize")
+SUMMARY_PREFIX = "Summary of the earlier conversation:"
+
+
+def estimate_token_count(text: str) -> int:
+    """Estimate the number of tokens of a text (~4 characters per token)."""
+    return (len(text) + 3) // 4
+
+
+class HistoryWindow:
+    """Token-budgeted window over chat history.
+
+    System messages are pinned, the oldest turns are dropped (or summarized) first.
+    Token counts are cached per message (least recently used first out), so only new messages are counted on each call,
+    across the histories sharing the window (e.g. sessions of a model), which may be fitted concurrently.
+    """
+
+    def __init__(self, max_tokens: int, strategy: str = "drop", count_tokens: Callable[[str], int] | None = None, message_overhead: int = 4, summary_max_length: int = 1000, cache_size: int = 4096) -> None:
+        """Initialize the history window.
+
+        Args:
+            max_tokens: Token budget for the prompt (history and new messages)
+            strategy: How to handle turns outside of the budget (drop, summarize)
+            count_tokens: Function counting the tokens of a text (defaults to an estimate)
+            message_overhead: Tokens added per message by the chat template
+            summary_max_length: Maximum length of the summary of dropped turns (summarize strategy)
+            cache_size: Maximum number of message token counts cached
+        """
+        if max_tokens <= 0:
+            raise ValueError(f"Invalid history max_tokens value: {max_tokens} (must be a positive integer)")
+        if strategy not in HISTORY_STRATEGIES:
+            raise ValueError(f"Invalid history strategy: {strategy} (must be one of {HISTORY_STRATEGIES})")
+
+        self.max_tokens = max_tokens
+        self.strategy = strategy
+        self.count_tokens = count_tokens or estimate_token_count
+        self.message_overhead = message_overhead
+        self.summary_max_length = summary_max_length
+        self.cache_size = cache_size
+        self._counts: OrderedDict[tuple[str, str], int] = OrderedDict()
+        self._lock = threading.Lock()  # guards the cache, tokens are counted outside of it
+
+    def clear(self) -> None:
+        """Clear the cached token counts (e.g. once the tokenizer counting them changes)."""
+        with self._lock:
+            self._counts.clear()
+
+    def count(self, message: Message) -> int:
+        """Get the (cached) token count of a message."""
+        key = (message["role"], str(message["content"]))
+        with self._lock:
+            if key in self._counts:
+                self._counts.move_to_end(key)
+                return self._counts[key]
+        count = self.count_tokens(key[1]) + self.message_overhead
+        with self._lock:
+            self._counts[key] = count
+            self._counts.move_to_end(key)
+            if len(self._counts) > self.cache_size:
+                self._counts.popitem(last=False)
+        return count
+
+    def _summarize(self, messages: list[Message], max_tokens: int) -> Message | None:
+        """Summarize dropped turns into a single system message of at most `max_tokens` tokens."""
+        lines = []
+        for message in messages:
+            content = str(message["content"])
+            if message["role"] == "system" and content.startswith(SUMMARY_PREFIX):
+                # Fold the previous summary into the new one
+                lines.extend(content[len(SUMMARY_PREFIX) :].strip().splitlines())
+                continue
+            excerpt = " ".join(content.split())
+            lines.append(f"- {message['role']}: {excerpt[:100]}{'...' if len(excerpt) > 100 else ''}")
+
+        # Keep the most recent lines within the summary length and token budget
+        summary = None
+        for first_line in range(len(lines) - 1, -1, -1):
+            content = SUMMARY_PREFIX + "\n" + "\n".join(lines[first_line:])
+            if len(content) > self.summary_max_length or self.count_tokens(content) + self.message_overhead > max_tokens:
+                break
+            summary = {"role": "system", "content": content}
+
+        return summary
+
+    def _window_turns(self, history: list[Message], turns: list[int], budget: int) -> tuple[int, int]:
+        """Find the oldest turn to keep within the budget, so that the window starts with a user message.
+
+        Returns:
+            Tuple of (position of the first kept turn, tokens used by the kept turns)
+        """
+        first_kept, used = len(turns), 0
+        while first_kept > 0 and used + self.count(history[turns[first_kept - 1]]) <= budget:
+            first_kept -= 1
+            used += self.count(history[turns[first_kept]])
+
+        while first_kept < len(turns) and history[turns[first_kept]]["role"] != "user":
+            used -= self.count(history[turns[first_kept]])
+            first_kept += 1
+
+        return first_kept, used
+
+    def fit(self, history: list[Message], messages: list[Message] | None = None) -> list[Message]:
+        """Fit chat history within the token budget.
+
+        Args:
+            history: Chat history, oldest first
+            messages: New messages which will follow the history in the prompt
+
+        Returns:
+            Windowed chat history
+        """
+        messages = messages or []
+        is_pinned = [message["role"] == "system" and not str(message["content"]).startswith(SUMMARY_PREFIX) for message in history]
+        budget = self.max_tokens - sum(self.count(message) for message in messages)
+        budget -= sum(self.count(message) for message, pinned in zip(history, is_pinned, strict=True) if pinned)
+
+        # Keep the most recent turns within the budget
+        turns = [i for i, pinned in enumerate(is_pinned) if not pinned]
+        first_kept, used = self._window_turns(history, turns, budget)
+        summary = None
+        if self.strategy == "summarize" and first_kept > 0:
+            # Reserve a quarter of the budget to summarize the dropped turns
+            first_kept, used = self._window_turns(history, turns, budget - budget // 4)
+            summary = self._summarize([history[i] for i in turns[:first_kept]], budget - used)
+
+        dropped = set(turns[:first_kept])
+        window = []
+        for i, message in enumerate(history):
+            if i in dropped:
+                continue
+            if summary and not is_pinned[i]:
+                # Summary goes right after the pinned system messages, before the kept turns
+                window.append(summary)
+                summary = None
+            window.append(message)
+        if summary:
+            window.append(summary)
+
+        return window
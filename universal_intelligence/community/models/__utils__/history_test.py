@@ -0,0 +1,94 @@
+"""
+Test script for the token-budgeted chat history window (see `history.py`).
+
+To run this script from the project root run:
+   python -m universal_intelligence.community.models.__utils__.history_test
+"""
+
+import threading
+
+from .history import SUMMARY_PREFIX, HistoryWindow
+from .test import check
+
+
+def count_words(text: str) -> int:
+    return len(text.split())
+
+
+def conversation(turns: int) -> list[dict]:
+    history = [{"role": "system", "content": "You are helpful"}]
+    for i in range(turns):
+        history += [{"role": "user", "content": f"question {i} " + "word " * 8}, {"role": "assistant", "content": f"answer {i} " + "word " * 8}]
+    return history
+
+
+def run_history_tests() -> None:
+    """Test windowing to the token budget, summaries of dropped turns and the token count cache."""
+    print("\033[94m" + "\n\n================================================\n## Testing history window \n================================================\n" + "\033[0m")
+
+    # Invalid settings are rejected
+    for settings in ({"max_tokens": 0}, {"max_tokens": 10, "strategy": "truncate"}):
+        try:
+            HistoryWindow(**settings)
+            check(f"invalid settings rejected {settings}", False)
+        except ValueError:
+            check(f"invalid settings rejected {settings}", True)
+
+    # The oldest turns are dropped first, system messages are pinned and the window starts with a user message
+    window = HistoryWindow(max_tokens=40, count_tokens=count_words, message_overhead=0)
+    history = conversation(4)  # 3 + 4 * 2 * 10 tokens
+    fitted = window.fit(history, [{"role": "user", "content": "new question"}])
+    check("system message pinned", fitted[0] == history[0], fitted)
+    check("most recent turns kept", fitted[1:] == history[-2:], fitted)
+    check("window starts with a user message", window.fit(history, [{"role": "user", "content": "word " * 17}])[1:] == history[-2:])
+    check("history within budget kept", HistoryWindow(max_tokens=1000).fit(history) == history)
+
+    # The most recent dropped turns are summarized after the pinned messages, previous summaries are folded into new ones
+    window = HistoryWindow(max_tokens=80, strategy="summarize", count_tokens=count_words, message_overhead=0)
+    fitted = window.fit(history)
+    summary = fitted[1]
+    check("dropped turns summarized", summary["role"] == "system" and summary["content"].startswith(SUMMARY_PREFIX) and "question 1" in summary["content"], fitted)
+    check("summary within budget", sum(count_words(str(message["content"])) for message in fitted) <= 80, fitted)
+    refitted = window.fit([*fitted, *conversation(6)[-4:]])
+    summaries = [message["content"] for message in refitted if message["content"].startswith(SUMMARY_PREFIX)]
+    check("summaries folded", len(summaries) == 1 and summaries[0].count(SUMMARY_PREFIX) == 1 and "question 3" in summaries[0], refitted)
+
+    # Token counts are cached per message (least recently used first out), and cleared when the tokenizer changes
+    calls = []
+    window = HistoryWindow(max_tokens=1000, count_tokens=lambda text: calls.append(text) or count_words(text), cache_size=4)
+    window.fit(history[:3])
+    window.fit(history[:3])
+    check("token counts cached", len(calls) == 3, calls)
+    window.fit(history)
+    check("cache bounded", len(window._counts) == 4, len(window._counts))
+    calls.clear()
+    window.count(history[1])  # oldest turn, counted last
+    check("recently used counts kept", not calls, calls)
+    window.clear()
+    window.count(history[1])
+    check("cache cleared", calls == [history[1]["content"]], calls)
+
+    # Histories sharing the window are fitted concurrently
+    window = HistoryWindow(max_tokens=60, count_tokens=count_words, cache_size=16)
+    histories = [conversation(turns) for turns in range(1, 9)]
+    expected = [window.fit(history) for history in histories]
+    window.clear()
+    errors, results = [], {}
+
+    def fit(i: int) -> None:
+        try:
+            for _ in range(50):
+                results[i] = window.fit(histories[i])
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=fit, args=(i,)) for i in range(len(histories))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    check("concurrent fits", not errors and [results[i] for i in range(len(histories))] == expected, errors)
+
+
+if __name__ == "__main__":
+    run_history_tests()
@@ -0,0 +1,66 @@
+"""
+LoRA adapters served over one shared base model.
+
+Adapters are loaded once next to the base weights, and switched per call: transformers through PEFT
+(`set_adapter`), llama.cpp by applying an adapter to the context, llama-server with per-request adapter
+scales. Switching does not reload any weights.
+"""
+
+import os
+from typing import Any
+
+from huggingface_hub import hf_hub_download
+
+from .types import AdapterConfig
+
+# Engines supporting adapters
+ADAPTER_ENGINES = ("transformers", "llama.cpp", "llama.cpp-server")
+
+
+def adapter_config(adapter: str | AdapterConfig) -> AdapterConfig:
+    """Normalize an adapter source (local path, Hugging Face repository id, or adapter configuration)."""
+    if isinstance(adapter, str):
+        return {"path": adapter} if os.path.exists(adapter) else {"model_id": adapter}
+    if not adapter.get("path") and not adapter.get("model_id"):
+        raise ValueError("[UniversalModelMixin:add_adapter] Adapter path or model_id is required")
+    return adapter
+
+
+def adapter_path(adapter: AdapterConfig, engine: str) -> str:
+    """Get the local path of an adapter (llama.cpp: GGUF LoRA file, downloaded from its repository if needed), or its repository id (transformers)."""
+    if adapter.get("path"):
+        return adapter["path"]
+    if engine == "transformers":
+        return adapter["model_id"]
+    if not adapter.get("model_file"):
+        raise ValueError(f"[UniversalModelMixin:add_adapter] model_file is required to download a GGUF LoRA adapter from {adapter['model_id']}")
+    return hf_hub_download(repo_id=adapter["model_id"], filename=adapter["model_file"], repo_type="model")
+
+
+class LlamaLoraAdapters:
+    """GGUF LoRA adapters loaded once over a llama.cpp model, applied to its context on demand."""
+
+    def __init__(self, llama: Any) -> None:
+        import llama_cpp
+
+        self.llama = llama
+        self.adapters: dict[str, tuple[Any, float]] = {}
+
+        # llama.cpp renamed its adapter API (llama_lora_adapter_* before llama_adapter_lora_*)
+        self._init = getattr(llama_cpp, "llama_adapter_lora_init", None) or llama_cpp.llama_lora_adapter_init
+        self._set = getattr(llama_cpp, "llama_set_adapter_lora", None) or llama_cpp.llama_lora_adapter_set
+        self._clear = getattr(llama_cpp, "llama_clear_adapter_lora", None) or llama_cpp.llama_lora_adapter_clear
+
+    def add(self, name: str, path: str, scale: float = 1.0) -> None:
+        """Load a GGUF LoRA adapter next to the model weights."""
+        handle = self._init(self.llama._model.model, path.encode("utf-8"))
+        if not handle:
+            raise ValueError(f"[UniversalModelMixin:add_adapter] Failed to load LoRA adapter '{name}' from {path}")
+        self.adapters[name] = (handle, scale)
+
+    def activate(self, name: str | None) -> None:
+        """Apply an adapter to the model context (None: base model)."""
+        self._clear(self.llama._ctx.ctx)
+        if name is not None:
+            handle, scale = self.adapters[name]
+            self._set(self.llama._ctx.ctx, handle, scale)
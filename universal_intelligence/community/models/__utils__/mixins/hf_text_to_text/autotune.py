@@ -0,0 +1,123 @@
+"""
+Throughput autotuning of quantizations and runtime parameters.
+
+Candidate (quantization, n_threads, n_batch, n_ubatch) combinations are benchmarked on the host with a short
+synthetic workload: time to first token, then decode speed. Results are stored per host fingerprint (device,
+cpu model and features, cores, memory, gpus) and model, and reused by `quantization={"optimize": ...}`.
+"""
+
+import hashlib
+import itertools
+import json
+import os
+import platform
+import tempfile
+import time
+
+import psutil
+import torch
+
+from ......community.__utils__.cache import get_cache_dir
+from .profiles import detect_cpu_features
+from .types import AutotuneResult
+
+# Objectives of `quantization={"optimize": ...}`: result metric and whether higher is better
+OBJECTIVES = {"throughput": ("tokens_per_second", True), "latency": ("time_to_first_token", False)}
+
+# Runtime parameters benchmarked per engine (n_threads is tuned for every engine but mlx-lm)
+LLAMA_PARAMETERS = {"n_batch": [512, 2048], "n_ubatch": [256, 512]}
+
+# Synthetic workload sentence, repeated to the prompt length
+WORKLOAD_SENTENCE = "The quick brown fox jumps over the lazy dog while the committee reviews the quarterly report. "
+
+
+def host_fingerprint(device_type: str) -> tuple[str, dict]:
+    """Get the fingerprint of the host (short hash, and the hardware description it hashes)."""
+    cpu_model = platform.processor()
+    if os.path.exists("/proc/cpuinfo"):
+        with open("/proc/cpuinfo") as cpuinfo:
+            cpu_model = next((line.split(":", 1)[1].strip() for line in cpuinfo if line.startswith("model name")), cpu_model)
+    host = {
+        "device": device_type,
+        "machine": platform.machine(),
+        "cpu": cpu_model,
+        "cpu_features": sorted(detect_cpu_features()),
+        "cores": psutil.cpu_count(logical=False),
+        "memory": round(psutil.virtual_memory().total / (1024**3)),
+        "gpus": [torch.cuda.get_device_name(i) for i in range(torch.cuda.device_count())] if device_type == "cuda" else [],
+    }
+    return hashlib.sha256(json.dumps(host, sort_keys=True).encode()).hexdigest()[:16], host
+
+
+def results_path(device_type: str) -> str:
+    """Get the path of the autotuning results of the host."""
+    fingerprint, _ = host_fingerprint(device_type)
+    return os.path.join(get_cache_dir("autotune"), f"{fingerprint}.json")
+
+
+def load_results(device_type: str, model_name: str) -> list[AutotuneResult]:
+    """Load the stored autotuning results of a model on the host (empty if not tuned yet)."""
+    try:
+        with open(results_path(device_type)) as f:
+            return json.load(f)["models"].get(model_name, {}).get("results", [])
+    except (OSError, ValueError, KeyError):
+        return []
+
+
+def save_results(device_type: str, model_name: str, results: list[AutotuneResult]) -> None:
+    """Store the autotuning results of a model on the host, merged with its previous results (newer measurements win)."""
+    path = results_path(device_type)
+    try:
+        with open(path) as f:
+            stored = json.load(f)
+    except (OSError, ValueError):
+        stored = {"host": host_fingerprint(device_type)[1], "models": {}}
+
+    combinations = {}
+    for result in stored["models"].get(model_name, {}).get("results", []) + results:
+        combinations[combination_key(result)] = {**combinations.get(combination_key(result), {}), **result}
+    stored["models"][model_name] = {"updated": time.time(), "results": list(combinations.values())}
+
+    # Atomic write, concurrent tuning processes do not corrupt the file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(stored, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def combination_key(result: AutotuneResult) -> tuple:
+    """Get the identity of a benchmarked combination."""
+    return (result["quantization"], result["engine"], result["n_threads"], *sorted(result["parameters"].items()))
+
+
+def quality_filter(results: list[AutotuneResult], max_quality_loss: float) -> list[AutotuneResult]:
+    """Keep the results of quantizations whose benchmarked perplexity is within `max_quality_loss` (fraction) of the best one."""
+    perplexities = {result["quantization"]: result["perplexity"] for result in results if result.get("perplexity") is not None}
+    if not perplexities:
+        return []
+    max_perplexity = min(perplexities.values()) * (1 + max_quality_loss)
+    return [result for result in results if perplexities.get(result["quantization"], float("inf")) <= max_perplexity]
+
+
+def parameter_grid(engine: str, threads: int) -> list[tuple[int | None, dict]]:
+    """Get the (n_threads, engine parameters) combinations to benchmark for an engine."""
+    thread_counts = [None] if engine == "mlx-lm" else sorted({threads, max(1, threads // 2)}, reverse=True)
+    if engine not in ("llama.cpp", "llama.cpp-server"):
+        return [(n_threads, {}) for n_threads in thread_counts]
+    batches = [dict(zip(LLAMA_PARAMETERS, values, strict=True)) for values in itertools.product(*LLAMA_PARAMETERS.values())]
+    return [(n_threads, parameters) for n_threads in thread_counts for parameters in batches if parameters["n_ubatch"] <= parameters["n_batch"]]
+
+
+def best_result(results: list[AutotuneResult], objective: str) -> AutotuneResult | None:
+    """Get the best result for an objective (throughput: generated tokens per second, latency: time to first token)."""
+    metric, higher_is_better = OBJECTIVES[objective]
+    results = [result for result in results if result.get(metric) is not None]
+    if not results:
+        return None
+    return max(results, key=lambda result: result[metric]) if higher_is_better else min(results, key=lambda result: result[metric])
+
+
+def synthetic_prompt(prompt_tokens: int) -> str:
+    """Get a synthetic prompt of about `prompt_tokens` tokens."""
+    sentence_tokens = len(WORKLOAD_SENTENCE.split()) * 4 // 3
+    return "Summarize the following text.\n\n" + WORKLOAD_SENTENCE * max(1, prompt_tokens // sentence_tokens)
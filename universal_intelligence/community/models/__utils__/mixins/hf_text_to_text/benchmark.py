@@ -0,0 +1,143 @@
+"""
+Quality versus speed benchmark across the quantizations of a local model.
+
+Each runnable quantization is loaded in turn and measured: perplexity on a bundled text corpus, generation speed,
+load time and peak resident memory. Results are stored with the autotuning results of the host (see `autotune.py`),
+so that `quantization={"optimize": ..., "max_quality_loss": ...}` can trade quality for speed, and written as a
+Pareto table in JSON and Markdown.
+
+To benchmark a local model from the project root run:
+   python -m universal_intelligence.community.models.__utils__.mixins.hf_text_to_text.benchmark qwen2_5_7b_instruct --quantizations Q8_0 Q4_K_M
+"""
+
+import argparse
+import importlib
+import json
+import os
+import threading
+import time
+
+import psutil
+
+from ......community.__utils__.cache import get_cache_dir
+from .autotune import host_fingerprint
+from .types import BenchmarkResult
+
+# Text corpus bundled for perplexity measurements
+CORPUS_PATH = os.path.join(os.path.dirname(__file__), "corpus.txt")
+
+
+def load_corpus(path: str | None = None) -> str:
+    """Load a perplexity corpus (default: the bundled corpus)."""
+    with open(path or CORPUS_PATH, encoding="utf-8") as f:
+        return f.read()
+
+
+class PeakMemoryMonitor:
+    """Sample the resident memory of the process in the background, to record its peak."""
+
+    def __init__(self, interval: float = 0.05) -> None:
+        self.interval = interval
+        self.peak = 0
+        self._process = psutil.Process()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _sample(self) -> None:
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self._process.memory_info().rss)
+            self._stop.wait(self.interval)
+
+    def __enter__(self) -> "PeakMemoryMonitor":
+        self.peak = self._process.memory_info().rss
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self._process.memory_info().rss)
+
+    @property
+    def peak_gb(self) -> float:
+        return round(self.peak / (1024**3), 3)
+
+
+def mark_pareto(results: list[BenchmarkResult]) -> list[BenchmarkResult]:
+    """Flag the Pareto-optimal results: no other result has a lower or equal perplexity, higher or equal speed and lower or equal
+    peak memory (and is strictly better on one of them). Results without perplexity are not comparable."""
+
+    def dominates(a: BenchmarkResult, b: BenchmarkResult) -> bool:
+        at_least = a["perplexity"] <= b["perplexity"] and a["tokens_per_second"] >= b["tokens_per_second"] and a["peak_rss"] <= b["peak_rss"]
+        better = a["perplexity"] < b["perplexity"] or a["tokens_per_second"] > b["tokens_per_second"] or a["peak_rss"] < b["peak_rss"]
+        return at_least and better
+
+    comparable = [result for result in results if result.get("perplexity") is not None]
+    for result in results:
+        result["pareto"] = result in comparable and not any(dominates(other, result) for other in comparable if other is not result)
+    return results
+
+
+def to_markdown(model_name: str, results: list[BenchmarkResult]) -> str:
+    """Render benchmark results as a Markdown table (Pareto-optimal quantizations in bold)."""
+    lines = [
+        f"## {model_name}",
+        "",
+        "| Quantization | Engine | Precision | Perplexity | Tokens/s | Decode tokens/s | Time to first token (s) | Load time (s) | Peak RSS (GB) | Pareto |",
+        "|---|---|---|---|---|---|---|---|---|---|",
+    ]
+    for result in results:
+        quantization = f"**{result['quantization']}**" if result.get("pareto") else result["quantization"]
+        perplexity = f"{result['perplexity']:.3f}" if result.get("perplexity") is not None else "-"
+        lines.append(
+            f"| {quantization} | {result['engine']} | {result['precision']}-bit | {perplexity} | {result['tokens_per_second']} | {result['decode_tokens_per_second']} | {result['time_to_first_token']} | {result['load_time']} | {result['peak_rss']} | {'yes' if result.get('pareto') else ''} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def write_report(model_name: str, device_type: str, results: list[BenchmarkResult], output: str) -> tuple[str, str]:
+    """Write benchmark results as a Pareto table, in JSON and Markdown (`output` path without extension)."""
+    report = {
+        "model": model_name,
+        "host": host_fingerprint(device_type)[1],
+        "pareto": [result["quantization"] for result in results if result.get("pareto")],
+        "results": results,
+    }
+    with open(f"{output}.json", "w") as f:
+        json.dump(report, f, indent=2)
+    with open(f"{output}.md", "w") as f:
+        f.write(to_markdown(model_name, results))
+    return f"{output}.json", f"{output}.md"
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark quality (perplexity) versus speed across the quantizations of a local model")
+    parser.add_argument("model", help="Local model module (e.g. qwen2_5_7b_instruct) or dotted path to a module exposing UniversalModel")
+    parser.add_argument("--quantizations", nargs="+", help="Quantizations to benchmark (default: every quantization fitting in memory)")
+    parser.add_argument("--engine", help="Engine to benchmark with (default: the preferred engine of each quantization)")
+    parser.add_argument("--corpus", help="Text file to measure perplexity on (default: bundled corpus)")
+    parser.add_argument("--context-length", type=int, default=512, help="Perplexity window, in tokens")
+    parser.add_argument("--max-new-tokens", type=int, default=32, help="Tokens generated per speed measurement")
+    parser.add_argument("--output", help="Report path without extension (default: universal_intelligence cache)")
+    parser.add_argument("--no-save", action="store_true", help="Do not store the results for quantization selection")
+    args = parser.parse_args(argv)
+
+    module_path = args.model if "." in args.model else f"universal_intelligence.community.models.local.{args.model}.model"
+    model = importlib.import_module(module_path).UniversalModel(engine=args.engine, verbose=False)
+    results = model.benchmark(
+        quantizations=args.quantizations,
+        corpus=load_corpus(args.corpus) if args.corpus else None,
+        context_length=args.context_length,
+        max_new_tokens=args.max_new_tokens,
+        save=not args.no_save,
+    )
+
+    output = args.output or os.path.join(get_cache_dir("benchmarks"), f"{model._name}-{time.strftime('%Y%m%d-%H%M%S')}")
+    json_path, markdown_path = write_report(model._name, model._device_type, results, output)
+    print(to_markdown(model._name, results))
+    print(f"Report: {json_path}, {markdown_path}")
+
+
+if __name__ == "__main__":
+    main()
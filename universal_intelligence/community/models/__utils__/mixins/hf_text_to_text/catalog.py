@@ -0,0 +1,162 @@
+"""
+Compiled catalog of local models: sources, compatibility and contracts without instantiating the models.
+
+The `sources.yaml` file of each local model is compiled once (parsed, validated and expanded by `generate_sources_from_yaml()`,
+with the compatibility derived from the sources) into a single index cached on disk, keyed by the modification time and
+size of each file, and of the compiler (`meta.py`). Lookups only check the files they read, and return copies so that
+models can refine their sources (e.g. memory estimates) without altering the catalog.
+
+To list the local models and quantizations fitting a memory budget on a device from the project root run:
+   python -m universal_intelligence.community.models.__utils__.mixins.hf_text_to_text.catalog --device cpu --max-memory 12
+"""
+
+import argparse
+import copy
+import glob
+import json
+import os
+import threading
+from functools import lru_cache
+
+import yaml
+
+from ......community.__utils__.cache import get_cache_dir
+from ......core.utils.types import Compatibility, Contract
+from . import meta
+from .meta import generate_sources_from_yaml, generate_standard_compatibility, generate_standard_contract
+from .types import CatalogEntry, CatalogMatch, Sources
+
+# Local models, one package per model with its sources.yaml file
+LOCAL_MODELS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "local"))
+
+_entries: dict[str, CatalogEntry] = {}  # by sources.yaml path
+_loaded = False
+_lock = threading.Lock()
+
+
+def _file_key(path: str) -> list[int]:
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _catalog_path() -> str:
+    return os.path.join(get_cache_dir("catalog"), "catalog.json")
+
+
+def _load() -> None:
+    """Load the compiled catalog from disk once per process (discarded if compiled by another version of the compiler)."""
+    global _loaded
+    if _loaded:
+        return
+    _loaded = True
+    try:
+        with open(_catalog_path()) as f:
+            stored = json.load(f)
+    except (OSError, ValueError):
+        return
+    if stored.get("compiler") == _file_key(meta.__file__):
+        _entries.update(stored["entries"])
+
+
+def _save() -> None:
+    path = _catalog_path()
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "w") as f:
+        json.dump({"compiler": _file_key(meta.__file__), "entries": _entries}, f)
+    os.replace(temporary, path)
+
+
+def _compile(path: str, key: list[int]) -> CatalogEntry:
+    """Compile a sources.yaml file."""
+    sources = generate_sources_from_yaml(path)
+    with open(path) as f:
+        name = yaml.safe_load(f)["model_info"].get("name")
+    model = os.path.basename(os.path.dirname(path))
+    return {"model": model, "name": name or model, "key": key, "sources": sources, "compatibility": generate_standard_compatibility(sources)}
+
+
+def _compiled(paths: list[str]) -> list[CatalogEntry]:
+    """Get the catalog entries of sources.yaml files, compiling the files changed since they were last compiled."""
+    with _lock:
+        _load()
+        entries, changed = [], False
+        for path in map(os.path.abspath, paths):
+            key = _file_key(path)
+            entry = _entries.get(path)
+            if entry is None or entry["key"] != key:
+                entry, changed = _compile(path, key), True
+                _entries[path] = entry
+            entries.append(entry)
+        if changed:
+            _save()
+        return entries
+
+
+def catalog_sources(path: str) -> Sources:
+    """Get the sources of a model from the catalog (see `generate_sources_from_yaml()`).
+
+    Args:
+        path: Path to the sources.yaml file of the model
+    """
+    return copy.deepcopy(_compiled([path])[0]["sources"])
+
+
+def catalog_compatibility(path: str) -> list[Compatibility]:
+    """Get the compatibility of a model from the catalog (see `generate_standard_compatibility()`).
+
+    Args:
+        path: Path to the sources.yaml file of the model
+    """
+    return copy.deepcopy(_compiled([path])[0]["compatibility"])
+
+
+@lru_cache(maxsize=64)
+def _contract(name: str, description: str) -> Contract:
+    return generate_standard_contract(name, description)
+
+
+def catalog_contract(name: str, description: str) -> Contract:
+    """Get the contract of a model (see `generate_standard_contract()`), generated once per model."""
+    return copy.deepcopy(_contract(name, description))
+
+
+def catalog(models_dir: str = LOCAL_MODELS_DIR) -> list[CatalogEntry]:
+    """Get the catalog entries of the local models, sorted by model module name."""
+    return sorted(_compiled(glob.glob(os.path.join(models_dir, "*", "sources.yaml"))), key=lambda entry: entry["model"])
+
+
+def query(device: str = "cpu", max_memory: float | None = None, engine: str | None = None, models_dir: str = LOCAL_MODELS_DIR) -> list[CatalogMatch]:
+    """Find the local models and quantizations runnable on a device, within a memory budget.
+
+    Args:
+        device: Device type (cuda, mps, cpu)
+        max_memory: Memory budget, in GB (default: unbounded)
+        engine: Engine serving the quantizations (default: any)
+        models_dir: Directory of the local models
+
+    Returns:
+        Matching quantizations, by model and decreasing memory
+    """
+    matches: list[CatalogMatch] = []
+    for entry in catalog(models_dir):
+        for quantization, source in entry["sources"].get(device, {}).items():
+            engines = [engine_config["name"] for engine_config in source["available_engines"]]
+            if (max_memory is None or source["memory"] <= max_memory) and (engine is None or engine in engines):
+                matches.append({"model": entry["model"], "name": entry["name"], "device": device, "quantization": quantization, "engines": engines, "memory": source["memory"], "precision": source["precision"], "is_default": source["is_default"]})
+    return sorted(matches, key=lambda match: (match["model"], -match["memory"]))
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="List the local models and quantizations runnable on a device, within a memory budget")
+    parser.add_argument("--device", default="cpu", choices=["cuda", "mps", "cpu"], help="Device type")
+    parser.add_argument("--max-memory", type=float, help="Memory budget, in GB")
+    parser.add_argument("--engine", help="Engine serving the quantizations")
+    args = parser.parse_args(argv)
+
+    for match in query(args.device, args.max_memory, args.engine):
+        default = " (default)" if match["is_default"] else ""
+        print(f"{match['model']} {match['quantization']}{default}: {match['memory']:.1f}GB, {match['precision']}-bit, {', '.join(match['engines'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Chat template, stop tokens and context limits of GGUF models, from their header metadata.
+
+GGUF files embed the Jinja chat template of the model (`tokenizer.chat_template`), its special tokens and its training
+context length. They are read from the cached header summary (see `estimator.py`, cached by file hash), so that
+llama.cpp engines format prompts, stop generation and size their context as the model was trained, without a tokenizer
+download. Models can override each item (`chat_metadata` of the interface configuration, or of the user configuration).
+"""
+
+import json
+from datetime import datetime
+from functools import lru_cache
+from typing import Any
+
+from jinja2 import TemplateError
+from jinja2.ext import loopcontrols
+from jinja2.sandbox import ImmutableSandboxedEnvironment
+
+from ......core.utils.types import Message
+from .types import ChatMetadata, ChatMetadataOverrides, HeaderSummary
+
+
+def chat_metadata(summary: HeaderSummary | None, overrides: ChatMetadataOverrides | None = None) -> ChatMetadata | None:
+    """Get the chat metadata of a GGUF model from its header summary, with overrides (None if the model is not a GGUF file)."""
+    if summary is None or summary["format"] != "gguf":
+        return None
+    overrides = overrides or {}
+    special_tokens = summary.get("special_tokens") or {}
+    metadata: ChatMetadata = {
+        "chat_template": summary["metadata"].get("tokenizer.chat_template"),
+        "bos_token": special_tokens.get("bos", ""),
+        "eos_token": special_tokens.get("eos", ""),
+        "stop": list(dict.fromkeys(special_tokens[name] for name in ("eos", "eot", "eom") if special_tokens.get(name))),
+        "context_length": summary["context_length"],
+    }
+    for key, default in (("chat_template", None), ("stop", []), ("context_length", None)):
+        if key in overrides:
+            metadata[key] = default if overrides[key] is False else overrides[key]
+    return metadata
+
+
+def _raise_exception(message: str) -> None:
+    raise TemplateError(message)
+
+
+@lru_cache(maxsize=16)
+def _compile_template(template: str) -> Any:
+    environment = ImmutableSandboxedEnvironment(trim_blocks=True, lstrip_blocks=True, extensions=[loopcontrols])
+    # Same filters and globals as the chat templates of transformers tokenizers
+    environment.filters["tojson"] = lambda value, indent=None: json.dumps(value, ensure_ascii=False, indent=indent)
+    environment.globals.update(raise_exception=_raise_exception, strftime_now=lambda fmt: datetime.now().strftime(fmt))
+    return environment.from_string(template)
+
+
+def render_chat_template(metadata: ChatMetadata, messages: list[Message], add_generation_prompt: bool = True) -> str:
+    """Render messages with the Jinja chat template of a GGUF model.
+
+    The leading BOS token is removed, llama.cpp adds it when tokenizing the prompt.
+
+    Raises:
+        jinja2.TemplateError: If the template rejects the messages (e.g. roles not alternating)
+    """
+    prompt = _compile_template(metadata["chat_template"]).render(
+        messages=messages,
+        add_generation_prompt=add_generation_prompt,
+        bos_token=metadata["bos_token"],
+        eos_token=metadata["eos_token"],
+    )
+    if metadata["bos_token"] and prompt.startswith(metadata["bos_token"]):
+        prompt = prompt[len(metadata["bos_token"]) :]
+    return prompt
@@ -0,0 +1,353 @@
+"""
+Memory estimates of model variants from their GGUF and safetensors headers.
+
+Headers are read without loading tensors: tensor shapes and types give the size of the weights, architecture
+metadata (layers, attention heads, embedding size, vocabulary) the size of the KV cache for a context length and
+batch, and of the compute buffers. Header summaries are cached by file hash, so that estimates stay available
+without re-reading (or keeping) the files. Estimates replace the static `model_size` figures of `sources.yaml`.
+"""
+
+import hashlib
+import json
+import os
+import re
+import struct
+from typing import Any, BinaryIO
+
+from huggingface_hub import try_to_load_from_cache
+
+from ......community.__utils__.cache import get_cache_dir
+from .types import HeaderSummary, MemoryEstimate
+
+GGUF_MAGIC = b"GGUF"
+
+# GGUF metadata value types: struct format (scalars), 8: string, 9: array
+GGUF_SCALAR_TYPES = {0: "<B", 1: "<b", 2: "<H", 3: "<h", 4: "<I", 5: "<i", 6: "<f", 7: "<?", 10: "<Q", 11: "<q", 12: "<d"}
+GGUF_STRING, GGUF_ARRAY = 8, 9
+
+# Arrays longer than this (e.g. tokenizer vocabularies) are skipped, only their length and file offset are kept (`<key>.length`, `<key>.offset`)
+GGUF_MAX_ARRAY_LENGTH = 1024
+
+# Special tokens of the GGUF tokenizer metadata (`tokenizer.ggml.<name>_token_id`), resolved to their strings
+GGUF_SPECIAL_TOKENS = ("bos", "eos", "eot", "eom")
+
+# GGML tensor types: (block size in elements, block size in bytes)
+GGML_TYPES = {
+    0: (1, 4),  # F32
+    1: (1, 2),  # F16
+    2: (32, 18),  # Q4_0
+    3: (32, 20),  # Q4_1
+    6: (32, 22),  # Q5_0
+    7: (32, 24),  # Q5_1
+    8: (32, 34),  # Q8_0
+    9: (32, 36),  # Q8_1
+    10: (256, 84),  # Q2_K
+    11: (256, 110),  # Q3_K
+    12: (256, 144),  # Q4_K
+    13: (256, 176),  # Q5_K
+    14: (256, 210),  # Q6_K
+    15: (256, 292),  # Q8_K
+    16: (256, 66),  # IQ2_XXS
+    17: (256, 74),  # IQ2_XS
+    18: (256, 98),  # IQ3_XXS
+    19: (256, 50),  # IQ1_S
+    20: (32, 18),  # IQ4_NL
+    21: (256, 110),  # IQ3_S
+    22: (256, 82),  # IQ2_S
+    23: (256, 136),  # IQ4_XS
+    24: (1, 1),  # I8
+    25: (1, 2),  # I16
+    26: (1, 4),  # I32
+    27: (1, 8),  # I64
+    28: (1, 8),  # F64
+    29: (256, 56),  # IQ1_M
+    30: (1, 2),  # BF16
+    34: (256, 54),  # TQ1_0
+    35: (256, 66),  # TQ2_0
+    39: (32, 17),  # MXFP4
+}
+
+# Runtime overhead of the engines (allocator pools, CUDA context), in GB
+RUNTIME_OVERHEAD = {"cuda": 0.5, "mps": 0.3, "cpu": 0.2}
+
+# Tokens per compute batch (llama.cpp default n_ubatch), sizing the compute buffers
+COMPUTE_BATCH = 512
+
+# Context length planned when the engine configuration does not set one (capped to the training context length)
+DEFAULT_CONTEXT_LENGTH = 4096
+
+
+def _read(f: BinaryIO, fmt: str) -> Any:
+    return struct.unpack(fmt, f.read(struct.calcsize(fmt)))[0]
+
+
+def _read_string(f: BinaryIO) -> str:
+    return f.read(_read(f, "<Q")).decode("utf-8", errors="replace")
+
+
+def _read_value(f: BinaryIO, value_type: int) -> Any:
+    if value_type == GGUF_STRING:
+        return _read_string(f)
+    if value_type != GGUF_ARRAY:
+        return _read(f, GGUF_SCALAR_TYPES[value_type])
+    item_type, length = _read(f, "<I"), _read(f, "<Q")
+    if length <= GGUF_MAX_ARRAY_LENGTH:
+        return [_read_value(f, item_type) for _ in range(length)]
+    # Skip long arrays
+    if item_type == GGUF_STRING:
+        for _ in range(length):
+            f.seek(_read(f, "<Q"), os.SEEK_CUR)
+    elif item_type == GGUF_ARRAY:
+        for _ in range(length):
+            _read_value(f, item_type)
+    else:
+        f.seek(struct.calcsize(GGUF_SCALAR_TYPES[item_type]) * length, os.SEEK_CUR)
+    return None
+
+
+def read_gguf_header(path: str) -> tuple[dict, list[tuple[str, list[int], int]]]:
+    """Read the metadata and tensor infos (name, shape, GGML type) of a GGUF file, without reading tensor data."""
+    with open(path, "rb") as f:
+        if f.read(4) != GGUF_MAGIC:
+            raise ValueError(f"[UniversalModelMixin:estimator] Not a GGUF file: {path}")
+        version = _read(f, "<I")
+        if version < 2:
+            raise ValueError(f"[UniversalModelMixin:estimator] Unsupported GGUF version {version}: {path}")
+        tensor_count, kv_count = _read(f, "<Q"), _read(f, "<Q")
+
+        metadata = {}
+        for _ in range(kv_count):
+            key = _read_string(f)
+            value_type = _read(f, "<I")
+            if value_type == GGUF_ARRAY:
+                position = f.tell()
+                f.seek(4, os.SEEK_CUR)  # item type
+                length = _read(f, "<Q")
+                f.seek(position)
+                if length > GGUF_MAX_ARRAY_LENGTH:
+                    metadata[f"{key}.length"], metadata[f"{key}.offset"] = length, position
+                    _read_value(f, value_type)
+                    continue
+            metadata[key] = _read_value(f, value_type)
+
+        tensors = []
+        for _ in range(tensor_count):
+            name = _read_string(f)
+            shape = [_read(f, "<Q") for _ in range(_read(f, "<I"))]
+            tensor_type = _read(f, "<I")
+            _read(f, "<Q")  # offset
+            tensors.append((name, shape, tensor_type))
+    return metadata, tensors
+
+
+def read_gguf_strings(path: str, offset: int, indices: list[int]) -> dict[int, str]:
+    """Read items of a skipped GGUF string array (e.g. token strings of the vocabulary) from its file offset."""
+    wanted, strings = set(indices), {}
+    with open(path, "rb") as f:
+        f.seek(offset)
+        if _read(f, "<I") != GGUF_STRING:
+            return strings
+        length = _read(f, "<Q")
+        for index in range(min(length, max(wanted, default=-1) + 1)):
+            size = _read(f, "<Q")
+            if index in wanted:
+                strings[index] = f.read(size).decode("utf-8", errors="replace")
+            else:
+                f.seek(size, os.SEEK_CUR)
+    return strings
+
+
+def gguf_special_tokens(path: str, metadata: dict) -> dict[str, str]:
+    """Get the strings of the special tokens (bos, eos, eot, eom) of a GGUF tokenizer."""
+    ids = {name: metadata[f"tokenizer.ggml.{name}_token_id"] for name in GGUF_SPECIAL_TOKENS if f"tokenizer.ggml.{name}_token_id" in metadata}
+    tokens = metadata.get("tokenizer.ggml.tokens")
+    if tokens is not None:
+        strings = dict(enumerate(tokens))
+    elif "tokenizer.ggml.tokens.offset" in metadata:
+        strings = read_gguf_strings(path, metadata["tokenizer.ggml.tokens.offset"], list(ids.values()))
+    else:
+        return {}
+    return {name: strings[token_id] for name, token_id in ids.items() if token_id in strings}
+
+
+def _elements(shape: list[int]) -> int:
+    elements = 1
+    for dim in shape:
+        elements *= dim
+    return elements
+
+
+def gguf_tensor_size(shape: list[int], tensor_type: int) -> int:
+    """Get the size of a GGUF tensor, in bytes."""
+    block_elements, block_bytes = GGML_TYPES.get(tensor_type, (1, 2))
+    return -(-_elements(shape) // block_elements) * block_bytes
+
+
+def summarize_gguf(path: str) -> HeaderSummary:
+    """Summarize the header of a GGUF file: weights size, architecture dimensions and special tokens (metadata kept for later use)."""
+    metadata, tensors = read_gguf_header(path)
+    architecture = metadata.get("general.architecture", "llama")
+    n_heads = metadata.get(f"{architecture}.attention.head_count") or 0
+    if isinstance(n_heads, list):  # per-layer head counts
+        n_heads = max(n_heads)
+    n_kv_heads = metadata.get(f"{architecture}.attention.head_count_kv") or n_heads
+    if isinstance(n_kv_heads, list):
+        n_kv_heads = max(n_kv_heads)
+    hidden_size = metadata.get(f"{architecture}.embedding_length") or 0
+    return {
+        "format": "gguf",
+        "weights": sum(gguf_tensor_size(shape, tensor_type) for _, shape, tensor_type in tensors),
+        "parameters": sum(_elements(shape) for _, shape, _ in tensors),
+        "n_layers": metadata.get(f"{architecture}.block_count") or 0,
+        "n_heads": n_heads,
+        "n_kv_heads": n_kv_heads,
+        "head_dim": metadata.get(f"{architecture}.attention.key_length") or (hidden_size // n_heads if n_heads else 0),
+        "hidden_size": hidden_size,
+        "vocab_size": metadata.get("tokenizer.ggml.tokens.length") or len(metadata.get("tokenizer.ggml.tokens") or []),
+        "context_length": metadata.get(f"{architecture}.context_length"),
+        "special_tokens": gguf_special_tokens(path, metadata),
+        "metadata": {key: value for key, value in metadata.items() if not key.startswith("tokenizer.ggml.") or not isinstance(value, list)},
+    }
+
+
+def summarize_safetensors(paths: list[str], config: dict, total_size: int | None = None) -> HeaderSummary:
+    """Summarize the headers of the safetensors files of a checkpoint and its `config.json` (`total_size` of the shard index
+    is used if some shards are missing)."""
+    weights, parameters = 0, 0
+    for path in paths:
+        with open(path, "rb") as f:
+            (header_size,) = struct.unpack("<Q", f.read(8))
+            header = json.loads(f.read(header_size))
+        tensors = [info for name, info in header.items() if name != "__metadata__"]
+        weights += sum(info["data_offsets"][1] - info["data_offsets"][0] for info in tensors)
+        parameters += sum(_elements(info["shape"]) for info in tensors)
+    if total_size and weights:  # missing shards, assuming the same bytes per parameter
+        parameters = parameters * total_size // weights
+    config = config.get("text_config", config)  # multimodal checkpoints
+    n_heads = config.get("num_attention_heads") or 0
+    hidden_size = config.get("hidden_size") or 0
+    return {
+        "format": "safetensors",
+        "weights": total_size or weights,
+        "parameters": parameters,
+        "n_layers": config.get("num_hidden_layers") or 0,
+        "n_heads": n_heads,
+        "n_kv_heads": config.get("num_key_value_heads") or n_heads,
+        "head_dim": config.get("head_dim") or (hidden_size // n_heads if n_heads else 0),
+        "hidden_size": hidden_size,
+        "vocab_size": config.get("vocab_size") or 0,
+        "context_length": config.get("max_position_embeddings"),
+        "special_tokens": {},
+        "metadata": {},
+    }
+
+
+def local_file(model_id: str, filename: str) -> str | None:
+    """Get the local path of a model file: in a local model directory, or in the Hugging Face cache (None if not downloaded)."""
+    if os.path.isdir(model_id):
+        path = os.path.join(model_id, filename)
+        return path if os.path.exists(path) else None
+    path = try_to_load_from_cache(repo_id=model_id, filename=filename)
+    return path if isinstance(path, str) else None
+
+
+def file_key(path: str) -> str:
+    """Get the cache key of a file: its hash for files of the Hugging Face cache (blobs are named by hash), or a hash of its path, size and mtime."""
+    real_path = os.path.realpath(path)
+    blob = os.path.basename(real_path)
+    if re.fullmatch(r"[0-9a-f]{64}", blob):
+        return blob
+    stat = os.stat(real_path)
+    return hashlib.sha256(f"{real_path}:{stat.st_size}:{stat.st_mtime_ns}".encode()).hexdigest()
+
+
+def _cached_summary(source: str, path: str | None, summarize: Any) -> HeaderSummary | None:
+    """Get a header summary from the cache (by file hash, or by source when the file is not local anymore), summarizing the file on miss."""
+    cache_dir = get_cache_dir("headers")
+    refs_path = os.path.join(cache_dir, "refs.json")
+    try:
+        with open(refs_path) as f:
+            refs = json.load(f)
+    except (OSError, ValueError):
+        refs = {}
+
+    key = file_key(path) if path else refs.get(source)
+    if key is None:
+        return None
+    summary_path = os.path.join(cache_dir, f"{key}.json")
+    if os.path.exists(summary_path):
+        with open(summary_path) as f:
+            summary = json.load(f)
+        # Summaries cached before a field was added are refreshed when the file is local
+        if path is None or HeaderSummary.__annotations__.keys() <= summary.keys():
+            return summary
+    if path is None:
+        return None
+
+    summary = summarize()
+    with open(summary_path, "w") as f:
+        json.dump(summary, f)
+    refs[source] = key
+    with open(refs_path, "w") as f:
+        json.dump(refs, f)
+    return summary
+
+
+def header_summary(model_id: str, model_file: str | None = None, model_dir: str | None = None) -> HeaderSummary | None:
+    """Get the header summary of a GGUF file (`model_file`) or safetensors checkpoint (local, or cached), None if unavailable.
+    Files are looked up in `model_dir` if given (resolved by the model source), otherwise in the Hugging Face cache."""
+    location = model_dir or model_id
+    try:
+        if model_file:
+            return _cached_summary(f"{model_id}/{model_file}", local_file(location, model_file), lambda: summarize_gguf(local_file(location, model_file)))
+
+        config_path = local_file(location, "config.json")
+        index_path = local_file(location, "model.safetensors.index.json")
+        path = index_path or local_file(location, "model.safetensors")
+        if config_path is None or path is None:
+            return _cached_summary(f"{model_id}/config.json", None, None)
+
+        def summarize() -> HeaderSummary:
+            with open(config_path) as f:
+                config = json.load(f)
+            if index_path is None:
+                return summarize_safetensors([path], config)
+            with open(index_path) as f:
+                index = json.load(f)
+            shards = [local_file(location, shard) for shard in sorted(set(index["weight_map"].values()))]
+            return summarize_safetensors([shard for shard in shards if shard], config, index.get("metadata", {}).get("total_size"))
+
+        return _cached_summary(f"{model_id}/config.json", path, summarize)
+    except (OSError, ValueError, KeyError, struct.error):
+        return None
+
+
+def estimate_memory(summary: HeaderSummary, n_ctx: int, batch: int = 1, device_type: str = "cpu", weights_ratio: float = 1.0, kv_bytes: int = 2, load_weights_ratio: float | None = None) -> MemoryEstimate:
+    """Estimate the memory of a model variant, in GB: weights, KV cache for `n_ctx` tokens per sequence and `batch` sequences,
+    compute buffers (activations and logits of a compute batch, attention scores over the context) and runtime overhead.
+
+    Args:
+        summary: Header summary of the model files
+        n_ctx: Context length
+        batch: Number of sequences
+        device_type: Device the model runs on
+        weights_ratio: Ratio of the loaded weights to the files (e.g. weight quantization at load time)
+        kv_bytes: Bytes per KV cache element (2: f16)
+        load_weights_ratio: Ratio of the weights held while loading to the files (default: `weights_ratio`)
+    """
+    gb = 1024**3
+    tokens = min(n_ctx, COMPUTE_BATCH) * batch
+    weights = summary["weights"] * weights_ratio
+    kv_cache = 2 * summary["n_layers"] * summary["n_kv_heads"] * summary["head_dim"] * n_ctx * batch * kv_bytes
+    scratch = 4 * tokens * (summary["vocab_size"] + 4 * summary["hidden_size"]) + 4 * summary["n_heads"] * tokens * n_ctx
+    overhead = RUNTIME_OVERHEAD.get(device_type, RUNTIME_OVERHEAD["cpu"]) * gb
+    load = summary["weights"] * (weights_ratio if load_weights_ratio is None else load_weights_ratio) + overhead
+    return {
+        "weights": round(weights / gb, 3),
+        "kv_cache": round(kv_cache / gb, 3),
+        "scratch": round((scratch + overhead) / gb, 3),
+        "load": round(load / gb, 3),
+        "total": round(max(weights + kv_cache + scratch + overhead, load) / gb, 3),
+        "n_ctx": n_ctx,
+        "batch": batch,
+    }
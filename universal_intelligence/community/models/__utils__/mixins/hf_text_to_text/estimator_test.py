@@ -0,0 +1,117 @@
+"""
+Test script for the memory estimates of model variants from their file headers (see `estimator.py`), on generated files.
+
+To run this script from the project root run:
+   python -m universal_intelligence.community.models.__utils__.mixins.hf_text_to_text.estimator_test
+"""
+
+import json
+import os
+import shutil
+import struct
+import tempfile
+
+from ...test import check
+from .estimator import GGUF_MAX_ARRAY_LENGTH, estimate_memory, header_summary, read_gguf_header, summarize_gguf, summarize_safetensors
+
+MODEL_ID = "stub/model"
+VOCAB_SIZE = GGUF_MAX_ARRAY_LENGTH + 100  # long array, skipped when reading the header
+
+
+def _string(text: str) -> bytes:
+    data = text.encode()
+    return struct.pack("<Q", len(data)) + data
+
+
+def write_gguf(path: str) -> None:
+    """Write the header of a GGUF file (llama architecture, F16 embeddings and Q8_0 attention weights), without tensor data."""
+    metadata = [
+        ("general.architecture", 8, _string("llama")),
+        ("llama.block_count", 4, struct.pack("<I", 2)),
+        ("llama.attention.head_count", 4, struct.pack("<I", 4)),
+        ("llama.attention.head_count_kv", 4, struct.pack("<I", 2)),
+        ("llama.embedding_length", 4, struct.pack("<I", 64)),
+        ("llama.context_length", 4, struct.pack("<I", 2048)),
+        ("tokenizer.ggml.eos_token_id", 4, struct.pack("<I", 2)),
+        ("tokenizer.ggml.tokens", 9, struct.pack("<IQ", 8, VOCAB_SIZE) + b"".join(_string(f"<tok{i}>") for i in range(VOCAB_SIZE))),
+    ]
+    tensors = [("token_embd.weight", [64, VOCAB_SIZE], 1), ("blk.0.attn_q.weight", [64, 64], 8)]
+    with open(path, "wb") as f:
+        f.write(b"GGUF" + struct.pack("<IQQ", 3, len(tensors), len(metadata)))
+        for key, value_type, value in metadata:
+            f.write(_string(key) + struct.pack("<I", value_type) + value)
+        for name, shape, tensor_type in tensors:
+            f.write(_string(name) + struct.pack("<I", len(shape)) + b"".join(struct.pack("<Q", dim) for dim in shape) + struct.pack("<IQ", tensor_type, 0))
+
+
+def write_safetensors(path: str) -> None:
+    """Write a safetensors file of two F16 tensors (32 and 16 parameters)."""
+    header = json.dumps({"__metadata__": {}, "a": {"dtype": "F16", "shape": [4, 8], "data_offsets": [0, 64]}, "b": {"dtype": "F16", "shape": [16], "data_offsets": [64, 96]}}).encode()
+    with open(path, "wb") as f:
+        f.write(struct.pack("<Q", len(header)) + header + bytes(96))
+
+
+def run_estimator_tests(directory: str) -> None:
+    """Test reading GGUF and safetensors headers, estimating memory, and caching summaries once files are removed."""
+    print("\033[94m" + "\n\n================================================\n## Testing memory estimator \n================================================\n" + "\033[0m")
+
+    # GGUF headers: weights from tensor types, architecture from metadata, special tokens from the skipped vocabulary
+    gguf_dir = os.path.join(directory, "gguf")
+    os.makedirs(gguf_dir)
+    write_gguf(os.path.join(gguf_dir, "model.gguf"))
+    metadata, _ = read_gguf_header(os.path.join(gguf_dir, "model.gguf"))
+    check("long arrays skipped", "tokenizer.ggml.tokens" not in metadata and metadata["tokenizer.ggml.tokens.length"] == VOCAB_SIZE, list(metadata))
+    summary = summarize_gguf(os.path.join(gguf_dir, "model.gguf"))
+    check("gguf weights", summary["weights"] == 64 * VOCAB_SIZE * 2 + 64 * 64 // 32 * 34, summary["weights"])
+    check("gguf parameters", summary["parameters"] == 64 * VOCAB_SIZE + 64 * 64, summary["parameters"])
+    check(
+        "gguf architecture",
+        (summary["n_layers"], summary["n_heads"], summary["n_kv_heads"], summary["head_dim"], summary["vocab_size"], summary["context_length"]) == (2, 4, 2, 16, VOCAB_SIZE, 2048),
+        summary,
+    )
+    check("gguf special tokens", summary["special_tokens"] == {"eos": "<tok2>"}, summary["special_tokens"])
+    with open(os.path.join(directory, "model.bin"), "wb") as f:
+        f.write(b"GGML")
+    try:
+        read_gguf_header(os.path.join(directory, "model.bin"))
+        check("invalid gguf rejected", False)
+    except ValueError:
+        check("invalid gguf rejected", True)
+
+    # Safetensors headers, with the total size of the shard index when shards are missing
+    safetensors_dir = os.path.join(directory, "safetensors")
+    os.makedirs(safetensors_dir)
+    write_safetensors(os.path.join(safetensors_dir, "model.safetensors"))
+    config = {"num_hidden_layers": 2, "num_attention_heads": 4, "num_key_value_heads": 2, "hidden_size": 64, "vocab_size": 100, "max_position_embeddings": 512}
+    with open(os.path.join(safetensors_dir, "config.json"), "w") as f:
+        json.dump(config, f)
+    summary = summarize_safetensors([os.path.join(safetensors_dir, "model.safetensors")], config)
+    check("safetensors summary", (summary["weights"], summary["parameters"], summary["head_dim"], summary["context_length"]) == (96, 48, 16, 512), summary)
+    summary = summarize_safetensors([os.path.join(safetensors_dir, "model.safetensors")], {"text_config": config}, total_size=192)
+    check("missing shards extrapolated", (summary["weights"], summary["parameters"], summary["n_layers"]) == (192, 96, 2), summary)
+
+    # Estimates: KV cache per context length and batch, peak of the steady state and of loading
+    gb = 1024**3
+    summary = {**summary, "weights": gb, "n_layers": 32, "n_kv_heads": 8, "head_dim": 128}
+    estimate = estimate_memory(summary, n_ctx=4096, batch=2, device_type="cuda")
+    check("kv cache", estimate["kv_cache"] == round(2 * 32 * 8 * 128 * 4096 * 2 * 2 / gb, 3), estimate)
+    check("steady total", estimate["total"] == round(estimate["weights"] + estimate["kv_cache"] + estimate["scratch"], 3) and estimate["load"] == 1.5, estimate)
+    estimate = estimate_memory(summary, n_ctx=16, weights_ratio=0.25, load_weights_ratio=2.0)
+    check("loading peak", estimate["weights"] == 0.25 and estimate["total"] == estimate["load"] == 2.2, estimate)
+
+    # Summaries are cached by file, and served by model once the files are removed (e.g. evicted from the store)
+    check("header summary", header_summary(MODEL_ID, "model.gguf", model_dir=gguf_dir)["weights"] == 64 * VOCAB_SIZE * 2 + 64 * 64 // 32 * 34)
+    check("checkpoint summary", header_summary(MODEL_ID, model_dir=safetensors_dir)["parameters"] == 48)
+    shutil.rmtree(gguf_dir)
+    shutil.rmtree(safetensors_dir)
+    check("cached summaries", header_summary(MODEL_ID, "model.gguf")["vocab_size"] == VOCAB_SIZE and header_summary(MODEL_ID)["n_layers"] == 2)
+    check("unknown files", header_summary(MODEL_ID, "other.gguf") is None)
+
+
+if __name__ == "__main__":
+    directory = tempfile.mkdtemp()
+    os.environ["UIN_CACHE_DIR"] = os.path.join(directory, "cache")  # header summaries
+    try:
+        run_estimator_tests(directory)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
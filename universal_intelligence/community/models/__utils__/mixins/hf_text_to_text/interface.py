@@ -1,22 +1,96 @@
+import copy
 import gc
+import math
 import os
-from typing import Any
+import platform
+import threading
+import time
+import weakref
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from typing import TYPE_CHECKING, Any
 
 import psutil
 import torch
-from huggingface_hub import hf_hub_download, whoami
-from transformers import AutoModelForCausalLM, AutoTokenizer
+from huggingface_hub import constants, hf_hub_download, whoami
+from jinja2 import TemplateError
 
+from ......community.__utils__.cache import get_cache_dir
 from ......community.__utils__.logger import Color, Logger, LogLevel
 from ......core.universal_model import AbstractUniversalModel
 from ......core.utils.types import Message
-from .meta import extract_precision_from_descriptor
-from .types import ChatTemplate, InferenceConfiguration, ModelConfiguration, ProcessorConfiguration, QuantizationSettings, Sources
+from ...context import PinnedContext, pinned_blocks, split_context
+from ...history import HistoryWindow, estimate_token_count
+from ...reasoning import ReasoningTraceFilter, apply_reasoning_policy, split_reasoning
+from ...session import Session
+from .adapters import ADAPTER_ENGINES, LlamaLoraAdapters, adapter_config, adapter_path
+from .autotune import OBJECTIVES, best_result, load_results, parameter_grid, quality_filter, save_results, synthetic_prompt
+from .benchmark import PeakMemoryMonitor, load_corpus, mark_pareto
+from .chat_metadata import chat_metadata, render_chat_template
+from .estimator import DEFAULT_CONTEXT_LENGTH, estimate_memory, header_summary, local_file
+from .llama_server import LlamaServer, completion_logprob
+from .meta import CPU_WEIGHT_QUANTIZATIONS, FULL_PRECISION_QUANTIZATIONS, extract_precision_from_descriptor
+from .offload import OFFLOAD_DEFAULTS, OFFLOAD_ENGINES, LayerPrefetcher, offload_dir, weights_size
+from .prefetch import DOWNLOAD_DEFAULTS, WEIGHT_EXTENSIONS, ChunkedDownloader, load_shards
+from .profiles import profile_threads, resolve_profile
+from .resolver import ModelSource, resolve_source
+from .types import AdapterConfig, AutotuneResult, BenchmarkResult, ChatMetadata, ChatMetadataOverrides, ChatTemplate, InferenceConfiguration, MemoryEstimate, ModelConfiguration, PrefetchResult, ProcessorConfiguration, QuantizationSettings, ReasoningConfiguration, Sources
+
+if TYPE_CHECKING:
+    from transformers import CompileConfig, StaticCache, TextStreamer
 
 # Set CUDA memory allocation configuration to use expandable segments
 os.environ["PYTORCH_CUDA_ALLOC_CONF"] = "expandable_segments:True"
 
 
+def __getattr__(name: str) -> Any:
+    # Classes depending on transformers, imported on first access (transformers is imported when loading models)
+    if name == "ReasoningTraceStreamer":
+        from .streamers import ReasoningTraceStreamer
+
+        return ReasoningTraceStreamer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Engines sharing the processor and inference configurations of another engine
+ENGINE_CONFIGURATION_FALLBACKS = {"onnxruntime": "transformers", "llama.cpp-server": "llama.cpp"}
+
+# Engines sharing the model configuration of another engine
+MODEL_CONFIGURATION_FALLBACKS = {"llama.cpp-server": "llama.cpp"}
+
+# Error messages of allocation failures (besides MemoryError and torch's OutOfMemoryError), llama.cpp fails to create its context
+OUT_OF_MEMORY_MESSAGES = ("out of memory", "failed to allocate", "cannot allocate memory", "can't allocate memory", "unable to allocate", "failed to create llama_context")
+
+# Default settings of the out-of-memory recovery policy (downgrades to smaller quantizations)
+RECOVERY_DEFAULTS = {"max_downgrades": 2}
+
+# Loaded state of a model variant, switched over atomically by `swap()`
+VARIANT_STATE = (
+    "model",
+    "tokenizer",
+    "quantization",
+    "engine",
+    "engine_config",
+    "_precision",
+    "_n_parallel",
+    "_prefetcher",
+    "_lora",
+    "_active_adapter",
+    "_server_adapters",
+    "_static_caches",
+    "_compile",
+    "_compile_config",
+    "_offload_stats",
+    "_chat_metadata",
+    "_store_pin",
+)
+
+# Default settings of the compiled generation mode (transformers), static KV caches are sized to the smallest bucket
+# fitting the prompt and generation budget (max length, in tokens)
+COMPILE_DEFAULTS = {"buckets": [1024, 2048, 4096], "mode": None, "warmup": True, "cache_dir": None}
+
+
 class UniversalModelMixin(AbstractUniversalModel):
 
     def _get_available_memory(self, device_type: str) -> float:
@@ -108,17 +182,11 @@ class UniversalModelMixin(AbstractUniversalModel):
 
             logger.print(message=f'* Initializing model.. ({interface_config["name"]}) *\n', color=Color.WHITE)
 
-            # Check Hugging Face login status
-            logger.print(prefix="Credentials", message="Checking Hugging Face status..")
-            try:
-                whoami()
-                logger.print(prefix="Credentials", message="Hugging Face login found", color=Color.GREEN, replace_last_line=True)
-            except Exception:
-                message = "Hugging Face login not detected. Some models may require authentication to download.\n"
-                logger.print(prefix="Credentials", message="Hugging Face login not detected. Some models may require authentication to download.", color=Color.YELLOW, replace_last_line=True)
-                logger.print(prefix="Credentials", message="To login, run: huggingface-cli login", color=Color.YELLOW)
-                logger.print(prefix="Credentials", message="For more information, visit: https://huggingface.co/docs/huggingface_hub/quick-start#login", color=Color.YELLOW)
-                raise Exception(message) from None
+            # Source of the model files: Hugging Face Hub, local store only (offline), mirror or local directory (see `resolver.py`)
+            self._source: ModelSource = resolve_source((configuration or {}).get("source"))
+
+            # Check Hugging Face login status (Hugging Face Hub source)
+            self._check_credentials(logger)
 
             # Define the interface configuration
             self._name: str = interface_config["name"]
@@ -127,6 +195,9 @@ class UniversalModelMixin(AbstractUniversalModel):
             self._inference_configuration: InferenceConfiguration = interface_config["inference_configuration"]
             self._processor_configuration: ProcessorConfiguration = interface_config["processor_configuration"]
             self._chat_template: ChatTemplate = interface_config["chat_template"]
+            self._reasoning_configuration: ReasoningConfiguration | None = interface_config.get("reasoning_configuration")
+            # Overrides of the chat template, stop tokens and context length read from GGUF headers (per model, then per user)
+            self._chat_metadata_overrides: ChatMetadataOverrides = {**interface_config.get("chat_metadata", {}), **(configuration or {}).get("chat_metadata", {})}
 
             # Detect device type
             logger.print(prefix="Device", message="Checking device type..")
@@ -151,12 +222,37 @@ class UniversalModelMixin(AbstractUniversalModel):
                 )
                 logger.print(prefix="Device", message="See https://github.com/huggingface/universal_intelligence/ for installation instructions.", color=Color.YELLOW)
 
+            # Select the hardware profile (dtype, engine preference, quantization ranking, threads), unless pinned or overridden
+            self._device_type = device_type
+            self._profile = resolve_profile(device_type, (configuration or {}).get("profile"))
+            self._threads = profile_threads(self._profile)
+            logger.print(prefix="Device", message=f"Using hardware profile: {self._profile['name']} ({self._threads} threads)", color=Color.GREEN)
+
+            # Disk offload of weights beyond the memory budget (opt-in with {"offload": True} or settings), also used as a fallback
+            # when no quantization fits in memory (unless disabled with {"offload": False})
+            offload_configuration = (configuration or {}).get("offload")
+            self._offload: dict | None = {**OFFLOAD_DEFAULTS, **(offload_configuration if isinstance(offload_configuration, dict) else {})} if offload_configuration else None
+            self._offload_fallback: bool = offload_configuration is not False
+            self._offload_stats: dict | None = None
+            self._prefetcher: LayerPrefetcher | None = None
+
+            # Files missing from the Hugging Face cache are downloaded with parallel ranged requests (disable with {"download": False}, except from mirrors)
+            download_configuration = (configuration or {}).get("download", True)
+            self._download: dict | None = {**DOWNLOAD_DEFAULTS, **(download_configuration if isinstance(download_configuration, dict) else {})} if download_configuration else None
+
+            # Files of the local store are tracked with their last use, pinned while loaded and evicted beyond the store quota (see `store.py`)
+            self._store_quota: float | None = ((configuration or {}).get("store") or {}).get("quota")
+            self._store_pin: str | None = None
+
             # Get device-specific sources
             logger.print(prefix="Model", message="Checking availabilty..")
             device_sources = self._sources.get(device_type, self._sources["cpu"])  # fallback to CPU if device not found
             logger.print(prefix="Model", message=f"Checking available quantizations for {device_type}", color=Color.GRAY)
             logger.print(prefix="Model", message=f"Available quantizations for {device_type}: {list(device_sources.keys())}", color=Color.GRAY, debug=True)
 
+            # Estimate the memory of the quantizations from their file headers, when available locally (or cached)
+            self._estimate_memory(device_sources, configuration or {})
+
             # Set maximum memory allocation (default: 85% of available memory)
             logger.print(prefix="Model", message="Checking maximum allowed memory allocation..")
             self.usable_memory = 0.85
@@ -171,7 +267,9 @@ class UniversalModelMixin(AbstractUniversalModel):
 
             # Set quantization based on device-specific defaults or user input
             logger.print(prefix="Model", message="Setting model precision..")
-            self.quantization = quantization
+            # Use the stored autotuning results of the host when optimizing for throughput or latency (see `autotune()`)
+            self._tuned: dict = self._tuned_variant(device_sources, quantization, engine, logger) if isinstance(quantization, dict) and quantization.get("optimize") else {}
+            self.quantization = self._tuned.get("quantization", quantization)
             if self.quantization is None:
                 logger.print(prefix="Model", message="No quantization specified, using automatic selection", color=Color.GRAY)
                 # Default case - use current logic but cap minimum precision to 4 bit
@@ -181,8 +279,14 @@ class UniversalModelMixin(AbstractUniversalModel):
 
                 logger.print(prefix="Model", message=f"Default quantization '{default_quant}' requires {required_memory:.1f}GB, available: {available_memory:.1f}GB", color=Color.GRAY)
 
+                # Prefer the hardware profile's quantization ranking
+                ranked_quant = self._profile_quantization(device_sources, engine, available_memory)
+
+                if ranked_quant:
+                    self.quantization = ranked_quant
+                    logger.print(prefix="Model", message=f"Using quantization '{ranked_quant}' ranked by hardware profile '{self._profile['name']}'", color=Color.GREEN)
                 # If default quantization fits within 80% of available memory, use it
-                if required_memory <= available_memory:
+                elif required_memory <= available_memory:
                     self.quantization = default_quant
                     logger.print(prefix="Model", message=f"Using default quantization '{default_quant}' as it fits in available memory", color=Color.GREEN)
                 else:
@@ -205,7 +309,10 @@ class UniversalModelMixin(AbstractUniversalModel):
                         else:
                             logger.print(prefix="Model", message=f"Quantization '{quant}' does not meet minimum 4-bit precision", color=Color.GRAY)
                     else:
-                        raise ValueError(f"No quantization with minimum 4-bit precision found that fits within {self.usable_memory * 100}% of the available memory ({available_memory:.1f}GB)")
+                        # Offload the smallest quantization with minimum 4-bit precision
+                        candidates = [quant for quant, source in reversed(quantizations) if source.get("precision", 32) >= 4]
+                        error = f"No quantization with minimum 4-bit precision found that fits within {self.usable_memory * 100}% of the available memory ({available_memory:.1f}GB)"
+                        self.quantization = self._select_offload_quantization(candidates, device_sources, engine, error, logger)
             elif isinstance(self.quantization, str):
                 logger.print(prefix="Model", message=f"Using specified quantization: {self.quantization}", color=Color.BLUE)
                 # Check if specified quantization exists and fits in memory
@@ -216,9 +323,10 @@ class UniversalModelMixin(AbstractUniversalModel):
                 available_memory = self._get_available_memory(device_type) * self.usable_memory
 
                 if required_memory > available_memory:
-                    raise ValueError(f"Specified quantization '{self.quantization}' requires {required_memory:.1f}GB but only {available_memory:.1f}GB is available")
-
-                logger.print(prefix="Model", message=f"Confirmed quantization '{self.quantization}' fits within available memory ({required_memory:.1f}GB / {available_memory:.1f}GB)", color=Color.GREEN)
+                    error = f"Specified quantization '{self.quantization}' requires {required_memory:.1f}GB but only {available_memory:.1f}GB is available"
+                    self._select_offload_quantization([self.quantization], device_sources, engine, error, logger)
+                else:
+                    logger.print(prefix="Model", message=f"Confirmed quantization '{self.quantization}' fits within available memory ({required_memory:.1f}GB / {available_memory:.1f}GB)", color=Color.GREEN)
 
             elif isinstance(self.quantization, list):
                 logger.print(prefix="Model", message=f"Trying quantizations from priority list: {self.quantization}", color=Color.BLUE)
@@ -239,27 +347,28 @@ class UniversalModelMixin(AbstractUniversalModel):
                     logger.print(prefix="Model", message=f"Using quantization '{quant}' from provided list ({required_memory:.1f}GB / {available_memory:.1f}GB)", color=Color.GREEN)
                     break
                 else:
-                    raise ValueError(f"No quantization from the provided list {self.quantization} fits within available memory ({available_memory:.1f}GB)")
+                    error = f"No quantization from the provided list {self.quantization} fits within available memory ({available_memory:.1f}GB)"
+                    self.quantization = self._select_offload_quantization([quant for quant in self.quantization if quant in device_sources], device_sources, engine, error, logger)
             else:  # QuantizationSettings case
                 logger.print(prefix="Model", message="Using QuantizationSettings configuration", color=Color.BLUE)
                 # Get min and max precision from settings
                 min_precision = 4  # Default minimum
                 max_precision = 8  # Default maximum
 
-                if self.quantization.min_precision:
-                    min_precision = extract_precision_from_descriptor(self.quantization.min_precision)
+                if self.quantization.get("min_precision"):
+                    min_precision = extract_precision_from_descriptor(self.quantization["min_precision"])
                     logger.print(prefix="Model", message=f"Using custom min precision: {min_precision} bits", color=Color.BLUE)
-                elif self.quantization.default:
-                    default_quant = self.quantization.default
+                elif self.quantization.get("default"):
+                    default_quant = self.quantization["default"]
                     if default_quant in device_sources:
                         min_precision = min(4, device_sources[default_quant].get("precision", 32))
                         logger.print(prefix="Model", message=f"Using min precision from default quantization '{default_quant}': {min_precision} bits", color=Color.BLUE)
 
-                if self.quantization.max_precision:
-                    max_precision = extract_precision_from_descriptor(self.quantization.max_precision)
+                if self.quantization.get("max_precision"):
+                    max_precision = extract_precision_from_descriptor(self.quantization["max_precision"])
                     logger.print(prefix="Model", message=f"Using custom max precision: {max_precision} bits", color=Color.BLUE)
-                elif self.quantization.default:
-                    default_quant = self.quantization.default
+                elif self.quantization.get("default"):
+                    default_quant = self.quantization["default"]
                     if default_quant in device_sources:
                         max_precision = device_sources[default_quant].get("precision", 32)
                         logger.print(prefix="Model", message=f"Using max precision from default quantization '{default_quant}': {max_precision} bits", color=Color.BLUE)
@@ -268,8 +377,9 @@ class UniversalModelMixin(AbstractUniversalModel):
                 available_memory = self._get_available_memory(device_type) * self.usable_memory
                 logger.print(prefix="Model", message=f"Available memory for quantization: {available_memory:.1f}GB", color=Color.GRAY)
 
+                # Only consider quantizations served by the requested engine, if any
                 quantizations = sorted(
-                    device_sources.items(),
+                    ((quant, source) for quant, source in device_sources.items() if not engine or any(engine_config["name"] == engine for engine_config in source["available_engines"])),
                     key=lambda x: x[1].get("precision", 32),
                     reverse=True,
                 )
@@ -288,26 +398,32 @@ class UniversalModelMixin(AbstractUniversalModel):
                     else:
                         logger.print(prefix="Model", message=f"Quantization '{quant}' does not meet precision requirements", color=Color.GRAY)
                 else:
-                    raise ValueError(f"No quantization found with precision between {min_precision} and {max_precision} bits " f"that fits within {self.usable_memory * 100}% of the available memory ({available_memory:.1f}GB)")
+                    # Offload the smallest quantization within the precision range
+                    candidates = [quant for quant, source in sorted(quantizations, key=lambda x: x[1].get("memory", float("inf"))) if min_precision <= source.get("precision", 32) <= max_precision]
+                    error = f"No quantization found with precision between {min_precision} and {max_precision} bits " f"that fits within {self.usable_memory * 100}% of the available memory ({available_memory:.1f}GB)"
+                    self.quantization = self._select_offload_quantization(candidates, device_sources, engine, error, logger)
 
             # Validate quantization is supported for this device
             supported_quantizations = device_sources.keys()
             if self.quantization not in supported_quantizations:
                 raise ValueError(f"Quantization {self.quantization} not supported for {device_type}. Use one of {supported_quantizations}")
 
-            # Get available engines for the selected quantization
+            # Get available engines for the selected quantization (able to run with offloaded weights, when offloading)
             logger.print(prefix="Model", message="Setting engine..")
-            available_engines = device_sources[self.quantization]["available_engines"]
+            available_engines = [engine for engine in device_sources[self.quantization]["available_engines"] if not self._offload or self._can_offload(engine)]
             logger.print(prefix="Model", message=f"Available engines for quantization '{self.quantization}': {[engine['name'] for engine in available_engines]}", color=Color.GRAY)
 
-            # Set engine based on user input or default
-            self.engine = engine
+            # Set engine based on user input, autotuning results or default
+            self.engine = engine or self._tuned.get("engine")
             if not self.engine:
-                # Find the default engine for this quantization
-                default_engine = next(
-                    (engine["name"] for engine in available_engines if engine.get("is_default", False)),
-                    None,
-                )
+                # Prefer the hardware profile's engine preference, then the default engine for this quantization
+                supported_engines = {engine["name"] for engine in available_engines}
+                default_engine = next((engine_name for engine_name in self._profile.get("engines", []) if engine_name in supported_engines), None)
+                if not default_engine:
+                    default_engine = next(
+                        (engine["name"] for engine in available_engines if engine.get("is_default", False)),
+                        None,
+                    )
                 if not default_engine:
                     # If no default is marked, use the first available engine
                     default_engine = available_engines[0]["name"]
@@ -331,41 +447,698 @@ class UniversalModelMixin(AbstractUniversalModel):
             # Validate engine is supported for this device and quantization
             supported_engines = {engine["name"] for engine in available_engines}
             if self.engine not in supported_engines:
+                if self._offload:
+                    raise ValueError(f"[UniversalModelMixin:__init__:configuration] Offloading is not supported by engine {self.engine} with quantization {self.quantization}. Use one of {supported_engines}")
                 raise ValueError(f"Engine {self.engine} not supported for {device_type} device with quantization {self.quantization}. Use one of {supported_engines}")
 
             # Store the selected engine configuration for later use
             self.engine_config = next(engine for engine in available_engines if engine["name"] == self.engine)
+            self._precision: int = device_sources[self.quantization].get("precision", 32)
+            self._device_sources = device_sources
+            self._requested_engine = engine
+            self._chat_metadata: ChatMetadata | None = self._gguf_chat_metadata()
             # logger.print(prefix="Model", message=f"Using engine '{self.engine}' with quantization '{self.quantization}' on {device_type} device", color=Color.MAGENTA)
 
+            # Recover from allocation failures by downgrading to the next candidate of the selector (unless disabled with {"recovery": False})
+            recovery_configuration = (configuration or {}).get("recovery", True)
+            self._recovery: dict | None = {**RECOVERY_DEFAULTS, **(recovery_configuration if isinstance(recovery_configuration, dict) else {})} if recovery_configuration else None
+            self._downgrade_candidates: list[str] = self._build_downgrade_candidates(quantization)
+            self._downgrades: list[dict] = []
+
             self.config = configuration or {}
             self.model = None
             self.tokenizer = None
             self.history = []
+
+            # Window history to a token budget if configured (e.g. {"max_tokens": 4096, "strategy": "summarize"})
+            history_configuration = self.config.get("history")
+            self._history_window = HistoryWindow(count_tokens=self._count_tokens, **history_configuration) if history_configuration else None
+
+            # Sessions share the resident model, generation is serialized and idle session KV state is evicted
+            # beyond `max_cached` sessions or when available memory drops below `min_available_memory` (fraction)
+            session_configuration = self.config.get("sessions", {})
+            self._max_cached_sessions: int = session_configuration.get("max_cached", 8)
+            self._min_available_memory: float = session_configuration.get("min_available_memory", 0.1)
+            self._sessions: weakref.WeakSet[Session] = weakref.WeakSet()
+            self._pinned_contexts: weakref.WeakSet[PinnedContext] = weakref.WeakSet()
+            self._kv_owner: tuple[str, int] | None = None  # session or pinned context whose KV state is resident (llama.cpp)
+            self._lock = threading.RLock()
+            self._in_flight = 0
+
+            # In-process engines generate one output at a time, llama.cpp-server serves requests concurrently in its parallel slots
+            self._n_parallel: int = self.config.get("model", {}).get("n_parallel", 4) if self.engine == "llama.cpp-server" else 1
+            self._slots = threading.BoundedSemaphore(self._n_parallel) if self.engine == "llama.cpp-server" else self._lock
+
+            # Compiled generation (transformers, opt-in with {"compile": True} or settings), decode steps are compiled for static KV caches
+            compile_configuration = self.config.get("compile")
+            self._compile: dict | None = None
+            self._compile_config: CompileConfig | None = None
+            self._static_caches: dict[int, StaticCache] = {}
+            if compile_configuration and self.engine == "transformers":
+                self._compile = {**COMPILE_DEFAULTS, **(compile_configuration if isinstance(compile_configuration, dict) else {})}
+                self._compile["buckets"] = sorted(self._compile["buckets"])
+            elif compile_configuration:
+                logger.print(prefix="Model", message=f"Compiled generation is only supported by the transformers engine, generating eagerly with {self.engine}.", color=Color.YELLOW)
+
+            # LoRA adapters over the shared base model (e.g. {"adapters": {"name": "org/adapter"}}), selected per call or per session
+            self._adapters: dict[str, AdapterConfig] = {}
+            self._active_adapter: str | None = None
+            self._lora: LlamaLoraAdapters | None = None  # llama.cpp adapter handles
+            self._server_adapters: list[str] = []  # adapters the llama-server process was started with
+            for name, adapter in self.config.get("adapters", {}).items():
+                self.add_adapter(name, adapter)
+
             logger.print(prefix="Model", message=f"Initialized model: {self._name}", color=Color.MAGENTA)
             logger.print(prefix="Model", message=f"Device: {device_type}, Engine: {self.engine}, Quantization: {self.quantization}, Config: {self.config}\n", color=Color.MAGENTA)
             # logger.art("star", Color.WHITE)
 
+    def _profile_quantization(self, device_sources: dict, engine: str | list[str] | None, available_memory: float) -> str | None:
+        """Get the first quantization of the hardware profile's ranking that fits in memory, served by the requested engine (if any)."""
+        requested_engines = [engine] if isinstance(engine, str) else engine
+        for quant in self._profile.get("quantizations", []):
+            if quant not in device_sources or device_sources[quant].get("memory", float("inf")) > available_memory:
+                continue
+            if not requested_engines or any(engine_config["name"] in requested_engines for engine_config in device_sources[quant]["available_engines"]):
+                return quant
+        return None
+
+    def _check_credentials(self, logger: Logger) -> None:
+        """Check the Hugging Face login, when files are resolved from the Hugging Face Hub (skipped for offline, mirror and local sources)."""
+        if not self._source.credentials:
+            logger.print(prefix="Credentials", message=f"Skipping Hugging Face login check (model source: {self._source})", color=Color.GRAY)
+            return
+        logger.print(prefix="Credentials", message="Checking Hugging Face status..")
+        try:
+            whoami()
+            logger.print(prefix="Credentials", message="Hugging Face login found", color=Color.GREEN, replace_last_line=True)
+        except Exception:
+            message = "Hugging Face login not detected. Some models may require authentication to download.\n"
+            logger.print(prefix="Credentials", message="Hugging Face login not detected. Some models may require authentication to download.", color=Color.YELLOW, replace_last_line=True)
+            logger.print(prefix="Credentials", message="To login, run: huggingface-cli login", color=Color.YELLOW)
+            logger.print(prefix="Credentials", message="For more information, visit: https://huggingface.co/docs/huggingface_hub/quick-start#login", color=Color.YELLOW)
+            raise Exception(message) from None
+
+    def _estimate_memory(self, device_sources: dict, configuration: dict) -> None:
+        """Replace the static memory figures of quantizations with estimates from their GGUF or safetensors headers (weights,
+        KV cache for the planned context length, compute buffers and runtime overhead), when available (see `estimator.py`)."""
+        self._memory_estimates: dict[str, MemoryEstimate] = {}
+        for quant, source in device_sources.items():
+            engine_config = source["available_engines"][0]
+            summary = header_summary(engine_config["model_id"], engine_config.get("model_file"), model_dir=self._source.locate(engine_config))
+            if summary is None or not summary["weights"]:
+                continue
+
+            # Planned context length: configured (model or history window), otherwise the default capped to the training context length
+            n_ctx = configuration.get("model", {}).get("n_ctx") or (self._model_configuration.get(engine_config["name"]) or {}).get("n_ctx") or (configuration.get("history") or {}).get("max_tokens") or min(summary["context_length"] or DEFAULT_CONTEXT_LENGTH, DEFAULT_CONTEXT_LENGTH)
+            # Weights quantized at load time (relative to a 16-bit checkpoint), or exported to ONNX at the quantization's precision
+            weights_ratio, load_weights_ratio = 1.0, None
+            if engine_config.get("quantize"):
+                weights_ratio = CPU_WEIGHT_QUANTIZATIONS[quant]["memory_ratio"] * 2 * summary["parameters"] / summary["weights"]
+                load_weights_ratio = CPU_WEIGHT_QUANTIZATIONS[quant]["load_memory_ratio"] * 2 * summary["parameters"] / summary["weights"]
+            elif engine_config["name"] == "onnxruntime":
+                weights_ratio = source.get("precision", 32) / 8 * summary["parameters"] / summary["weights"]
+            self._memory_estimates[quant] = estimate_memory(summary, n_ctx, device_type=self._device_type, weights_ratio=weights_ratio, load_weights_ratio=load_weights_ratio)
+            source["memory"] = self._memory_estimates[quant]["total"]
+
+    def _tuned_variant(self, device_sources: dict, settings: QuantizationSettings, engine: str | list[str] | None, logger: Logger) -> dict:
+        """Get the best stored autotuning result of the host for the objective of quantization settings (`optimize`), within their
+        precision range (minimum 4-bit by default), benchmarked quality loss (`max_quality_loss`, see `benchmark()`) and the available
+        memory, served by the requested engine (if any).
+
+        The tuned number of threads is applied, tuned engine parameters are applied at load time (see `_translate_model_config()`).
+        """
+        objective = settings["optimize"]
+        if objective not in OBJECTIVES:
+            raise ValueError(f"[UniversalModelMixin:__init__:quantization] Invalid optimize value: {objective} (must be one of {list(OBJECTIVES)})")
+        min_precision = extract_precision_from_descriptor(settings["min_precision"]) if settings.get("min_precision") else 4
+        max_precision = extract_precision_from_descriptor(settings["max_precision"]) if settings.get("max_precision") else 32
+        available_memory = self._get_available_memory(self._device_type) * self.usable_memory
+        requested_engines = [engine] if isinstance(engine, str) else engine
+
+        results = [
+            result
+            for result in load_results(self._device_type, self._name)
+            if result["quantization"] in device_sources
+            and min_precision <= device_sources[result["quantization"]].get("precision", 32) <= max_precision
+            and device_sources[result["quantization"]].get("memory", float("inf")) <= available_memory
+            and any(engine_config["name"] == result["engine"] for engine_config in device_sources[result["quantization"]]["available_engines"])
+            and (not requested_engines or result["engine"] in requested_engines)
+        ]
+        if settings.get("max_quality_loss") is not None:
+            results = quality_filter(results, settings["max_quality_loss"])
+        tuned = best_result(results, objective)
+        if tuned is None:
+            logger.print(prefix="Model", message=f"No autotuning results for this host, selecting by precision (run `model.autotune()` to optimize for {objective})", color=Color.YELLOW)
+            return {}
+
+        if tuned["n_threads"]:
+            self._threads = tuned["n_threads"]
+        metric = OBJECTIVES[objective][0]
+        logger.print(prefix="Model", message=f"Using autotuned quantization '{tuned['quantization']}' ({tuned['engine']}, {metric}: {tuned[metric]})", color=Color.GREEN)
+        return tuned
+
+    def _build_downgrade_candidates(self, quantization: str | list[str] | QuantizationSettings | None) -> list[str]:
+        """Order the downgrade candidates like the quantization selector: the provided priority list, or the quantizations
+        meeting the minimum precision (4-bit by default) by decreasing precision and memory."""
+        if isinstance(quantization, list):
+            candidates = [quant for quant in quantization if quant in self._device_sources]
+        else:
+            min_precision = extract_precision_from_descriptor(quantization["min_precision"]) if isinstance(quantization, dict) and quantization.get("min_precision") else 4
+            ordered = sorted(self._device_sources.items(), key=lambda x: (x[1].get("precision", 32), x[1].get("memory", float("inf"))), reverse=True)
+            candidates = [quant for quant, source in ordered if source.get("precision", 32) >= min_precision]
+        return [quant for quant in candidates if quant != self.quantization]
+
+    def _select_engine(self, quantization: str, engine: str | list[str] | None = None) -> dict | None:
+        """Select the engine configuration serving a quantization: the requested engine(s) if any, otherwise the current engine,
+        the hardware profile's preference and the default engine (only engines supporting offloading and adapters, if used)."""
+        usable = {engine_config["name"]: engine_config for engine_config in self._device_sources[quantization]["available_engines"] if (not self._offload or self._can_offload(engine_config)) and (not self._adapters or (engine_config["name"] in ADAPTER_ENGINES and not engine_config.get("quantize")))}
+        requested_engines = [engine] if isinstance(engine, str) else engine
+        for name in requested_engines or [self.engine, *self._profile.get("engines", [])]:
+            if name in usable:
+                return usable[name]
+        if requested_engines:
+            return None
+        return next((engine_config for engine_config in usable.values() if engine_config.get("is_default")), next(iter(usable.values()), None))
+
+    def _set_variant(self, quantization: str, engine_config: dict) -> None:
+        """Switch the quantization and engine of the (unloaded) model."""
+        self.quantization = quantization
+        self.engine = engine_config["name"]
+        self.engine_config = engine_config
+        self._precision = self._device_sources[quantization].get("precision", 32)
+        self._chat_metadata = self._gguf_chat_metadata()
+
+    def _gguf_chat_metadata(self) -> ChatMetadata | None:
+        """Get the chat template, stop tokens and context length of the GGUF file of llama.cpp engines, from its cached header
+        (None for other engines, or if the file was never downloaded)."""
+        if self.engine not in ("llama.cpp", "llama.cpp-server"):
+            return None
+        summary = header_summary(self.engine_config["model_id"], self.engine_config["model_file"], model_dir=self._source.locate(self.engine_config))
+        return chat_metadata(summary, self._chat_metadata_overrides)
+
+    def _is_out_of_memory(self, error: BaseException) -> bool:
+        """Check if an error is an allocation failure."""
+        if isinstance(error, (MemoryError, torch.OutOfMemoryError)):
+            return True
+        return any(message in str(error).lower() for message in OUT_OF_MEMORY_MESSAGES)
+
+    def _recover(self, error: BaseException, quantization: str, stage: str, logger: Logger) -> bool:
+        """Recover from an allocation failure with a quantization, by downgrading to the next candidate with a smaller memory footprint.
+
+        The model is unloaded, and loaded again with the downgraded quantization on next use (session and pinned context KV state is evicted).
+
+        Args:
+            error: Error raised by the engine
+            quantization: Quantization the error was raised with
+            stage: Stage the error was raised at (load, generate)
+            logger: Logger
+
+        Returns:
+            Whether to retry (the quantization was downgraded, possibly by a concurrent request already)
+        """
+        if self._recovery is None or not self._is_out_of_memory(error):
+            return False
+
+        with self._lock:
+            if self.quantization != quantization:
+                return True
+            if len(self._downgrades) >= self._recovery["max_downgrades"]:
+                return False
+
+            # The engine serving the next candidate must share the concurrency model of the current engine (in-process or llama-server slots)
+            memory = self._device_sources[quantization].get("memory", float("inf"))
+            for candidate in self._downgrade_candidates:
+                engine_config = self._select_engine(candidate, self._requested_engine)
+                if engine_config and self._device_sources[candidate].get("memory", float("inf")) < memory and (engine_config["name"] == "llama.cpp-server") == (self.engine == "llama.cpp-server"):
+                    break
+            else:
+                return False
+
+            downgrade = {"stage": stage, "from": {"engine": self.engine, "quantization": quantization}, "to": {"engine": engine_config["name"], "quantization": candidate}, "error": str(error)[:500]}
+            logger.print(prefix="Model", message=f"Out of memory ({stage}) with quantization '{quantization}', downgrading to '{candidate}' ({engine_config['name']})", color=Color.YELLOW)
+            self.unload()
+            self._set_variant(candidate, engine_config)
+            self._downgrades.append(downgrade)
+            return True
+
+    def _resolve_model(self) -> tuple[str, dict[str, Future] | None]:
+        """Resolve the files of the engine from the model source (see `resolver.py`).
+
+        Missing files are downloaded with parallel ranged requests (see `prefetch.py`), small files first and weights in order.
+        Engines load the Hugging Face Hub model id themselves, and the local directory of the files for other sources.
+
+        Returns:
+            Model id or local directory to load from, and the downloads of missing files by filename (None if local, or
+            downloaded by the engine)
+        """
+        model_id = self.engine_config["model_id"]
+        if self._source.engine_resolution:
+            if not self._download or constants.HF_HUB_OFFLINE or os.path.isdir(model_id) or local_file(model_id, self.engine_config.get("model_file") or "config.json"):
+                return model_id, None
+            downloader = ChunkedDownloader(**self._download)
+            try:
+                downloads = downloader.prefetch(downloader.list_files(model_id, self.engine_config))
+            except OSError:  # files listing unavailable, the files are downloaded by the engine
+                return model_id, None
+            finally:
+                downloader.close(wait=False)
+            return model_id, downloads
+
+        if self._source.remote:
+            try:
+                return self._source.fetch(self.engine_config, self._download or DOWNLOAD_DEFAULTS)
+            except OSError:  # mirror unreachable, files are loaded from the local store
+                pass
+        model_dir = self._source.locate(self.engine_config)
+        if not model_dir:
+            raise ValueError(f"[UniversalModelMixin:_resolve_model] {model_id} ({self.engine_config.get('model_file') or 'checkpoint'}) is not available from model source {self._source}")
+        return model_dir, None
+
+    def _track_files(self, quantization: str | None = None, engine_config: dict | None = None, pin: bool = False) -> None:
+        """Record the use of the files of a variant (default: the current one) in the local store, enforcing the store quota
+        (see `store.py`). Pinned files are not evicted until the model is unloaded."""
+        engine_config = engine_config or self.engine_config
+        model_dir = self._source.locate(engine_config) if self._source.index else None
+        if model_dir:
+            token = self._source.index.record(engine_config, model_dir, f"{self._name}:{quantization or self.quantization}", pin=pin, quota=self._store_quota)
+            if pin:
+                self._store_pin = token
+
+    def prefetch(self, quantizations: list[str] | None = None) -> list[PrefetchResult]:
+        """Download the files of quantizations ahead of `load()`, with parallel ranged requests, resuming partial downloads and
+        verifying hashes (see `prefetch.py`), from the Hugging Face Hub or the mirror of the model source (local sources have
+        nothing to download). Memory estimates and GGUF metadata are refreshed from the downloaded headers.
+
+        Args:
+            quantizations: Quantizations to prefetch, with the engine they would be loaded with (default: every quantization
+                runnable on this host, i.e. fitting in the usable memory, and the selected quantization)
+
+        Returns:
+            Downloaded files per quantization
+        """
+        with Logger(self._log_level) as logger:
+            if quantizations is None:
+                available_memory = self._get_available_memory(self._device_type) * self.usable_memory
+                quantizations = [quant for quant, source in self._device_sources.items() if source.get("memory", float("inf")) <= available_memory or quant == self.quantization]
+            unsupported = [quant for quant in quantizations if quant not in self._device_sources]
+            if unsupported:
+                raise ValueError(f"[UniversalModelMixin:prefetch] Quantizations {unsupported} are not supported for {self._device_type}. Use any of {list(self._device_sources)}")
+
+            results: list[PrefetchResult] = []
+            downloader = ChunkedDownloader(**(self._download or DOWNLOAD_DEFAULTS))
+            try:
+                for quant in quantizations:
+                    engine_config = self._select_engine(quant, self._requested_engine) or self._device_sources[quant]["available_engines"][0]
+                    if os.path.isdir(engine_config["model_id"]) or not (self._source.engine_resolution or self._source.remote):
+                        continue
+                    start = time.perf_counter()
+                    if self._source.engine_resolution:
+                        paths = downloader.download(downloader.list_files(engine_config["model_id"], engine_config))
+                    else:
+                        paths = [download.result() for download in self._source.fetch(engine_config, self._download or DOWNLOAD_DEFAULTS)[1].values()]
+                    size = sum(os.path.getsize(path) for path in paths) / 1024**3
+                    self._track_files(quant, engine_config)
+                    results.append({"quantization": quant, "engine": engine_config["name"], "model_id": engine_config["model_id"], "files": paths, "size": round(size, 3), "time": round(time.perf_counter() - start, 2)})
+                    logger.print(prefix="Model", message=f"Prefetched {quant} ({engine_config['name']}): {len(paths)} files, {size:.2f}GB", color=Color.GREEN)
+            finally:
+                downloader.close()
+
+            self._estimate_memory(self._device_sources, self.config)
+            self._chat_metadata = self._gguf_chat_metadata()
+            return results
+
+    def metrics(self) -> dict:
+        """Get runtime metrics of the model: quantization downgrades after allocation failures (count and history), and the engine and quantization in use."""
+        with self._lock:
+            return {"engine": self.engine, "quantization": self.quantization, "memory": self._memory_estimates.get(self.quantization), "downgrades": len(self._downgrades), "downgrade_history": list(self._downgrades)}
+
+    def _detached(self) -> "UniversalModelMixin":
+        """Get a copy of the model sharing its configuration, but not its locks, sessions and pinned contexts (to load or unload a variant next to the serving one)."""
+        detached = copy.copy(self)
+        detached._lock = threading.RLock()
+        detached._slots = detached._lock
+        detached._sessions = weakref.WeakSet()
+        detached._pinned_contexts = weakref.WeakSet()
+        detached._kv_owner = None
+        detached._recovery = None
+        detached._static_caches = dict(self._static_caches)
+        detached._compile = dict(self._compile) if self._compile else None
+        return detached
+
+    @contextmanager
+    def _drained(self) -> Iterator[None]:
+        """Hold every generation slot of the model, waiting for in-flight requests to complete and holding new ones."""
+        slots = self._slots
+        count = 0 if slots is self._lock else self._n_parallel
+        for _ in range(count):
+            slots.acquire()
+        try:
+            with self._lock:
+                yield
+        finally:
+            for _ in range(count):
+                slots.release()
+
+    def _staged(self, quantization: str, engine_config: dict) -> "UniversalModelMixin":
+        """Get a detached, unloaded copy of the model switched to another quantization and engine (see `_detached()`)."""
+        staged = self._detached()
+        staged.model, staged.tokenizer = None, None
+        staged._prefetcher, staged._lora, staged._active_adapter, staged._server_adapters = None, None, None, []
+        staged._static_caches, staged._compile_config, staged._offload_stats, staged._store_pin = {}, None, None, None
+        staged._set_variant(quantization, engine_config)
+        staged._n_parallel = self.config.get("model", {}).get("n_parallel", 4) if staged.engine == "llama.cpp-server" else 1
+        if staged._compile and staged.engine != "transformers":
+            staged._compile = None
+        return staged
+
+    def swap(self, engine: str | None = None, quantization: str | None = None) -> None:
+        """Switch the engine and/or quantization of the model without downtime.
+
+        The new variant is loaded next to the serving one (within the memory budget), in-flight requests are drained
+        and the model switches over atomically, the previous variant is then unloaded. If the new variant fails to load,
+        the previous one keeps serving. Session and pinned context KV state is evicted (bound to the previous variant).
+
+        Args:
+            engine: Engine to switch to (default: the current engine if it serves the quantization, or the preferred engine)
+            quantization: Quantization to switch to (default: the current quantization)
+        """
+        with Logger(self._log_level) as logger:
+            quantization = quantization or self.quantization
+            if quantization not in self._device_sources:
+                raise ValueError(f"[UniversalModelMixin:swap] Quantization {quantization} not supported for {self._device_type} device. Use one of {list(self._device_sources)}")
+            engine_config = self._select_engine(quantization, engine)
+            if engine_config is None:
+                supported_engines = [engine_config["name"] for engine_config in self._device_sources[quantization]["available_engines"]]
+                raise ValueError(f"[UniversalModelMixin:swap] Engine {engine} not supported with quantization {quantization} (offloading and adapters permitting). Use one of {supported_engines}")
+            if engine_config["name"] == self.engine and quantization == self.quantization:
+                return
+
+            # Load the new variant next to the serving one (the model is loaded on next use if it is not loaded yet)
+            staged = self._staged(quantization, engine_config)
+            if self.model:
+                memory = self._device_sources[quantization].get("memory", 0)
+                available_memory = self._get_available_memory(self._device_type) * self.usable_memory
+                if not self._offload and memory > available_memory:
+                    raise ValueError(f"[UniversalModelMixin:swap] Not enough memory to load quantization {quantization} ({memory:.2f}GB) next to {self.quantization}, available: {available_memory:.2f}GB. Unload the model first.")
+                logger.print(prefix="Model", message=f"Loading '{quantization}' ({engine_config['name']}) next to '{self.quantization}' ({self.engine})..", color=Color.CYAN)
+                try:
+                    staged.load()
+                except Exception:
+                    staged.unload()
+                    logger.print(prefix="Model", message=f"Failed to load '{quantization}' ({engine_config['name']}), rolling back to '{self.quantization}' ({self.engine})", color=Color.RED)
+                    raise
+
+            # Drain in-flight requests and switch over, the retired variant is the one serving once drained
+            with self._drained():
+                retired = self._detached()
+                for session in self._sessions:
+                    session.evict()
+                for pinned in self._pinned_contexts:
+                    pinned.evict()
+                self._kv_owner = None
+                for attribute in VARIANT_STATE:
+                    setattr(self, attribute, getattr(staged, attribute))
+                if (self.engine == "llama.cpp-server") != (retired.engine == "llama.cpp-server"):
+                    self._slots = threading.BoundedSemaphore(self._n_parallel) if self.engine == "llama.cpp-server" else self._lock
+                self._requested_engine = engine or self._requested_engine
+                if self._history_window:
+                    self._history_window.clear()
+            logger.print(prefix="Model", message=f"Swapped to '{self.quantization}' ({self.engine})", color=Color.GREEN)
+
+            # Release the previous variant
+            retired.unload()
+
+    def autotune(self, quantizations: list[str] | None = None, prompt_tokens: int = 256, max_new_tokens: int = 32, save: bool = True) -> list[AutotuneResult]:
+        """Benchmark quantizations and runtime parameters (n_threads, and n_batch, n_ubatch for llama.cpp) on the host.
+
+        Each combination is loaded next to the serving model (within the memory budget) and measured on a synthetic
+        workload: time to first token, then decode speed. Results are stored per host fingerprint and model, and used by
+        `quantization={"optimize": "throughput" | "latency"}`.
+
+        Args:
+            quantizations: Quantizations to benchmark (default: the current quantization, the hardware profile's ranking and the default quantization)
+            prompt_tokens: Approximate prompt length of the synthetic workload
+            max_new_tokens: Number of tokens to generate per request
+            save: Whether to store the results
+
+        Returns:
+            Benchmark results, by decreasing throughput
+        """
+        with Logger(self._log_level) as logger:
+            if quantizations is None:
+                default_quant = next((quant for quant, source in self._device_sources.items() if source.get("is_default", False)), self.quantization)
+                quantizations = list(dict.fromkeys([self.quantization, *(quant for quant in self._profile.get("quantizations", []) if quant in self._device_sources), default_quant]))
+            unsupported = [quant for quant in quantizations if quant not in self._device_sources]
+            if unsupported:
+                raise ValueError(f"[UniversalModelMixin:autotune] Quantizations {unsupported} not supported for {self._device_type} device. Use one of {list(self._device_sources)}")
+
+            prompt = synthetic_prompt(prompt_tokens)
+            available_memory = self._get_available_memory(self._device_type) * self.usable_memory
+            results: list[AutotuneResult] = []
+            try:
+                for quantization in quantizations:
+                    engine_config = self._select_engine(quantization, self._requested_engine)
+                    memory = self._device_sources[quantization].get("memory", 0)
+                    if engine_config is None or (memory > available_memory and not self._offload):
+                        logger.print(prefix="Autotune", message=f"Skipping '{quantization}' (no usable engine, or {memory:.1f}GB does not fit in {available_memory:.1f}GB)", color=Color.GRAY)
+                        continue
+
+                    for n_threads, parameters in parameter_grid(engine_config["name"], self._threads):
+                        staged = self._staged(quantization, engine_config)
+                        staged._threads = n_threads or staged._threads
+                        staged._tuned = {"parameters": parameters}
+                        try:
+                            staged.load()
+                            metrics = staged._benchmark(prompt, max_new_tokens)
+                        except Exception as error:
+                            logger.print(prefix="Autotune", message=f"Failed to benchmark '{quantization}' ({engine_config['name']}, n_threads: {n_threads}, {parameters}): {error}", color=Color.RED)
+                            continue
+                        finally:
+                            staged.unload()
+                        results.append({"quantization": quantization, "engine": engine_config["name"], "n_threads": n_threads, "parameters": parameters, "memory": memory, **metrics})
+                        logger.print(prefix="Autotune", message=f"'{quantization}' ({engine_config['name']}, n_threads: {n_threads}, {parameters}): {metrics}", color=Color.BLUE)
+            finally:
+                # Loading sets the process-wide torch threads
+                if self._device_type == "cpu":
+                    torch.set_num_threads(self._threads)
+
+            if save and results:
+                save_results(self._device_type, self._name, results)
+            return sorted(results, key=lambda result: result["tokens_per_second"], reverse=True)
+
+    def _benchmark(self, prompt: str, max_new_tokens: int) -> dict:
+        """Measure the time to first token and the decode speed of the loaded model on a prompt (after a warmup request)."""
+        # Keep reasoning traces in the output, so that every generated token is counted
+        reasoning = {"reasoning": "keep"} if self._resolve_reasoning_configuration({}) else {}
+        self.process(prompt, configuration={"max_new_tokens": 2, **reasoning}, keep_alive=True)
+        start = time.perf_counter()
+        self.process(prompt, configuration={"max_new_tokens": 1, **reasoning}, keep_alive=True)
+        time_to_first_token = time.perf_counter() - start
+        start = time.perf_counter()
+        output, _ = self.process(prompt, configuration={"max_new_tokens": max_new_tokens, **reasoning}, keep_alive=True)
+        duration = time.perf_counter() - start
+        tokens = max(1, self._count_tokens(output))
+        decode_duration = duration - time_to_first_token
+        return {
+            "time_to_first_token": round(time_to_first_token, 4),
+            "decode_tokens_per_second": round((tokens - 1) / decode_duration, 2) if tokens > 1 and decode_duration > 0 else 0.0,
+            "tokens_per_second": round(tokens / duration, 2),
+        }
+
+    def benchmark(self, quantizations: list[str] | None = None, corpus: str | None = None, context_length: int = 512, max_new_tokens: int = 32, save: bool = True) -> list[BenchmarkResult]:
+        """Benchmark quality versus speed across quantizations: perplexity on a text corpus, generation speed, load time and peak resident memory.
+
+        Each quantization is loaded in turn next to the serving model (within the memory budget). Results are stored with the
+        autotuning results of the host, for `quantization={"optimize": ..., "max_quality_loss": ...}`.
+
+        Args:
+            quantizations: Quantizations to benchmark (default: every quantization fitting in memory)
+            corpus: Text to measure perplexity on (default: bundled corpus)
+            context_length: Perplexity window, in tokens
+            max_new_tokens: Number of tokens to generate per speed measurement
+            save: Whether to store the results
+
+        Returns:
+            Benchmark results by decreasing precision, Pareto-optimal results flagged (perplexity, tokens per second, peak memory)
+        """
+        with Logger(self._log_level) as logger:
+            available_memory = self._get_available_memory(self._device_type) * self.usable_memory
+            if quantizations is None:
+                quantizations = [quant for quant, source in self._device_sources.items() if self._offload or source.get("memory", float("inf")) <= available_memory]
+            unsupported = [quant for quant in quantizations if quant not in self._device_sources]
+            if unsupported:
+                raise ValueError(f"[UniversalModelMixin:benchmark] Quantizations {unsupported} not supported for {self._device_type} device. Use one of {list(self._device_sources)}")
+
+            text = corpus or load_corpus()
+            prompt = synthetic_prompt(256)
+            results: list[BenchmarkResult] = []
+            try:
+                for quantization in quantizations:
+                    engine_config = self._select_engine(quantization, self._requested_engine)
+                    if engine_config is None:
+                        logger.print(prefix="Benchmark", message=f"Skipping '{quantization}' (no usable engine)", color=Color.GRAY)
+                        continue
+
+                    staged = self._staged(quantization, engine_config)
+                    if staged.engine == "llama.cpp":
+                        # Keep the logits of every prompt position, for perplexity
+                        staged.config = {**staged.config, "model": {**staged.config.get("model", {}), "logits_all": True}}
+                    try:
+                        with PeakMemoryMonitor() as memory_monitor:
+                            start = time.perf_counter()
+                            staged.load()
+                            load_time = time.perf_counter() - start
+                            perplexity = staged._perplexity(text, context_length)
+                            metrics = staged._benchmark(prompt, max_new_tokens)
+                    except Exception as error:
+                        logger.print(prefix="Benchmark", message=f"Failed to benchmark '{quantization}' ({engine_config['name']}): {error}", color=Color.RED)
+                        continue
+                    finally:
+                        staged.unload()
+
+                    source = self._device_sources[quantization]
+                    result: BenchmarkResult = {
+                        "quantization": quantization,
+                        "engine": staged.engine,
+                        "n_threads": None if staged.engine == "mlx-lm" else staged._threads,
+                        "parameters": {},
+                        "memory": source.get("memory", 0),
+                        "precision": source.get("precision", 32),
+                        "perplexity": round(perplexity, 4) if perplexity is not None else None,
+                        "load_time": round(load_time, 3),
+                        "peak_rss": memory_monitor.peak_gb,
+                        **metrics,
+                    }
+                    results.append(result)
+                    logger.print(prefix="Benchmark", message=f"'{quantization}' ({staged.engine}): perplexity {result['perplexity']}, {result['tokens_per_second']} tokens/s, loaded in {result['load_time']}s, peak RSS {result['peak_rss']}GB", color=Color.BLUE)
+            finally:
+                # Loading sets the process-wide torch threads
+                if self._device_type == "cpu":
+                    torch.set_num_threads(self._threads)
+
+            results = mark_pareto(sorted(results, key=lambda result: (result["precision"], result["memory"]), reverse=True))
+            if save and results:
+                save_results(self._device_type, self._name, results)
+            return results
+
+    def _perplexity(self, text: str, context_length: int = 512) -> float | None:
+        """Compute the perplexity of the loaded model on a text, over consecutive windows of `context_length` tokens.
+
+        Returns:
+            Perplexity, or None if the engine does not expose the logits of prompt positions (llama.cpp-server, llama.cpp without `logits_all`)
+        """
+        if self.engine == "llama.cpp-server" or (self.engine == "llama.cpp" and not self.model.context_params.logits_all):
+            return None
+        if self.engine == "llama.cpp":
+            token_ids = self.model.tokenize(text.encode("utf-8"), add_bos=False, special=False)
+            context_length = min(context_length, self.model.n_ctx())
+        else:
+            token_ids = self.tokenizer.encode(text, add_special_tokens=False)
+
+        negative_log_likelihood, count = 0.0, 0
+        for start in range(0, len(token_ids) - 1, context_length):
+            window = token_ids[start : start + context_length]
+            if len(window) < 2:
+                break
+            log_probs = torch.log_softmax(self._window_logits(window)[:-1].float(), dim=-1)
+            targets = torch.tensor(window[1:], device=log_probs.device).unsqueeze(1)
+            negative_log_likelihood -= log_probs.gather(1, targets).sum().item()
+            count += len(window) - 1
+        return math.exp(negative_log_likelihood / count) if count else None
+
+    def _window_logits(self, token_ids: list[int]) -> torch.Tensor:
+        """Get the logits of every position of a token window (evaluated from an empty KV state)."""
+        if self.engine == "llama.cpp":
+            self.model.reset()
+            self._kv_owner = None
+            self.model.eval(token_ids)
+            return torch.from_numpy(self.model.scores[: len(token_ids)].copy())
+        if self.engine == "mlx-lm":
+            import mlx.core as mx
+
+            logits = self.model(mx.array(token_ids)[None])[0].astype(mx.float32)
+            return torch.tensor(logits.tolist())
+        input_ids = torch.tensor([token_ids], device=self.model.device)
+        with torch.no_grad():
+            return self.model(input_ids=input_ids, attention_mask=torch.ones_like(input_ids)).logits[0]
+
+    def _can_offload(self, engine_config: dict) -> bool:
+        """Check if an engine configuration can run with offloaded weights (not quantized at load time)."""
+        return engine_config["name"] in OFFLOAD_ENGINES and not engine_config.get("quantize")
+
+    def _select_offload_quantization(self, candidates: list[str], device_sources: dict, engine: str | list[str] | None, error: str, logger: Logger) -> str:
+        """Select the first candidate quantization able to run with offloaded weights, when none fits in memory.
+
+        Raises:
+            ValueError: With the `error` message, if offloading is disabled or no candidate can be offloaded
+        """
+        if not self._offload_fallback:
+            raise ValueError(error)
+
+        requested_engines = [engine] if isinstance(engine, str) else engine
+        for quant in candidates:
+            if any(self._can_offload(engine_config) and (not requested_engines or engine_config["name"] in requested_engines) for engine_config in device_sources[quant]["available_engines"]):
+                self._offload = self._offload or dict(OFFLOAD_DEFAULTS)
+                logger.print(prefix="Model", message=f"Quantization '{quant}' ({device_sources[quant].get('memory', float('inf')):.1f}GB) does not fit in memory, offloading weights beyond the memory budget to disk", color=Color.YELLOW)
+                return quant
+        raise ValueError(error)
+
+    def _offload_budget(self) -> float:
+        """Get the memory budget of resident weights when offloading, in GB."""
+        if self._offload.get("max_memory"):
+            return self._offload["max_memory"]
+        budget = psutil.virtual_memory().available / (1024**3) * self.usable_memory
+
+        # Reserve the estimated KV cache and compute buffers, keeping at least half of the budget for weights
+        estimate = self._memory_estimates.get(self.quantization)
+        return max(budget - (estimate["total"] - estimate["weights"]), budget / 2) if estimate else budget
+
+    def _engine_configuration(self, configurations: dict, fallbacks: dict = ENGINE_CONFIGURATION_FALLBACKS) -> dict:
+        """Get the engine-specific entry of a configuration, falling back to the configuration of a compatible engine."""
+        if self.engine in configurations:
+            return configurations[self.engine]
+        return configurations.get(fallbacks.get(self.engine), {})
+
     def _translate_model_config(self) -> dict:
         """Get the appropriate model configuration based on engine type."""
         # Start with engine-specific base configuration
-        config = self._model_configuration[self.engine].copy()
+        config = self._engine_configuration(self._model_configuration, MODEL_CONFIGURATION_FALLBACKS).copy()
 
         # Update device-specific settings
         if self.engine == "transformers":
+            # Budget of the load in progress (see `_load()`), computed on demand otherwise (e.g. configuration before loading)
+            offload_budget = int((self._offload_stats["budget"] if self._offload_stats else self._offload_budget()) * 1024**3) if self._offload else None
+            offload_parts = (self.engine_config["model_id"].replace("/", "--"), self.quantization)
             if torch.cuda.is_available():
                 config.update(
                     {
                         "device_map": "auto",
                         "low_cpu_mem_usage": True,
-                        "offload_folder": "offload",
+                        "offload_folder": offload_dir(self._offload or {}, *offload_parts),
                         "offload_state_dict": True,
                         "max_memory": {i: f"{int(torch.cuda.get_device_properties(i).total_memory * self.usable_memory / (1024**3))}GB" for i in range(torch.cuda.device_count())},
                     }
                 )
+                if self._offload:
+                    # Layers beyond the GPU budgets are offloaded to cpu memory, then to disk
+                    config["max_memory"]["cpu"] = offload_budget
             elif torch.backends.mps.is_available():
                 config["device_map"] = "mps"
-        elif self.engine == "llama.cpp":
-            config["n_threads"] = os.cpu_count()
+            else:
+                config.update(self._profile_dtype())
+                if self._offload:
+                    # Layers beyond the memory budget are mapped to disk
+                    config.update({"device_map": "auto", "low_cpu_mem_usage": True, "offload_folder": offload_dir(self._offload, *offload_parts), "max_memory": {"cpu": offload_budget}})
+        elif self.engine == "onnxruntime":
+            # Reuse the KV cache between decode steps, and bind inputs/outputs to avoid copies
+            config = {"use_cache": True, "use_io_binding": True, **config}
+        elif self.engine in ("llama.cpp", "llama.cpp-server"):
+            config["n_threads"] = self._threads
+            config.update(self._tuned.get("parameters", {}))
+
+            # Cap the context length to the training context length of the GGUF file (unless configured by the user)
+            if self._chat_metadata and self._chat_metadata["context_length"]:
+                config["n_ctx"] = min(config.get("n_ctx") or DEFAULT_CONTEXT_LENGTH, self._chat_metadata["context_length"])
 
             # Enable GPU acceleration if CUDA is available
             if torch.cuda.is_available():
@@ -384,6 +1157,11 @@ class UniversalModelMixin(AbstractUniversalModel):
                 config["gpu_offload_embed"] = True  # Enable embedding offloading
                 config["gpu_offload_output"] = True  # Enable output layer offloading
 
+            if self._offload:
+                # Memory-map the GGUF file without locking it, weights beyond available memory are paged in on demand
+                config["use_mmap"] = True
+                config["use_mlock"] = False
+
             # Map known transformers model config parameters to llama.cpp equivalents
             if "model" in self.config:
                 param_mapping = {
@@ -407,6 +1185,21 @@ class UniversalModelMixin(AbstractUniversalModel):
 
         return config
 
+    def _profile_dtype(self) -> dict:
+        """Get the compute dtype of full precision checkpoints on cpu from the hardware profile (transformers).
+
+        Upcasting to float32 (CPUs without native bf16) is skipped if the upcast weights would not fit in memory.
+        """
+        dtype = self._profile.get("dtype", "auto")
+        if dtype == "auto" or self.quantization not in FULL_PRECISION_QUANTIZATIONS or self.engine_config.get("quantize"):
+            return {}
+
+        torch_dtype = getattr(torch, dtype)
+        required_memory = self._sources.get(self._device_type, self._sources["cpu"])[self.quantization].get("memory", 0) * torch.finfo(torch_dtype).bits / self._precision
+        if required_memory > psutil.virtual_memory().available / (1024**3) * self.usable_memory:
+            return {}
+        return {"torch_dtype": torch_dtype}
+
     def _format_chat_prompt(self, messages: list[Message], add_generation_prompt: bool = True) -> str:
         """Format messages according to the model's chat template.
 
@@ -417,6 +1210,13 @@ class UniversalModelMixin(AbstractUniversalModel):
         Returns:
             Formatted prompt string
         """
+        # Use the Jinja chat template of the GGUF file (llama.cpp engines), unless the model's template is rendered on rejection
+        if self._chat_metadata and self._chat_metadata["chat_template"]:
+            try:
+                return render_chat_template(self._chat_metadata, messages or [{"role": "system", "content": self._chat_template["default_system_message"]}], add_generation_prompt and bool(messages))
+            except TemplateError:
+                pass
+
         prompt = ""
 
         # Handle empty messages
@@ -449,10 +1249,10 @@ class UniversalModelMixin(AbstractUniversalModel):
 
         if not configuration:
             # Use default configurations from _inference_configuration
-            result = self._inference_configuration[self.engine].copy()
+            result = self._engine_configuration(self._inference_configuration).copy()
         else:
             # Translate provided configuration
-            if self.engine == "transformers":
+            if self.engine in ("transformers", "onnxruntime"):
                 result = configuration
             elif self.engine == "mlx-lm":
                 # Map transformers parameters to mlx-lm parameters
@@ -498,57 +1298,524 @@ class UniversalModelMixin(AbstractUniversalModel):
                         result["temperature"] = 0
                         result.pop("top_p", None)  # Remove top_p for deterministic generation
 
+        # Stop on the end of generation tokens of the GGUF file, besides the model's stop strings
+        if self.engine in ("llama.cpp", "llama.cpp-server") and self._chat_metadata and self._chat_metadata["stop"]:
+            result["stop"] = list(dict.fromkeys([*result.get("stop", []), *self._chat_metadata["stop"]]))
+
         print(f"\n[Generation Config] Engine: {self.engine}")
         print(f"Input config: {configuration}")
         print(f"Translated config: {result}\n")
 
         return result
 
+    def _count_tokens(self, text: str) -> int:
+        """Count the tokens of a text with the model's tokenizer (estimated if the model is not loaded)."""
+        if self.engine == "llama.cpp" and self.model:
+            return len(self.model.tokenize(text.encode("utf-8"), add_bos=False, special=True))
+        if self.engine == "llama.cpp-server" and self.model:
+            return len(self.model.tokenize(text))
+        if self.tokenizer:
+            return len(self.tokenizer.encode(text, add_special_tokens=False))
+        return estimate_token_count(text)
+
+    def _resolve_reasoning_configuration(self, configuration: dict) -> ReasoningConfiguration | None:
+        """Resolve the reasoning trace policy from the model defaults, model configuration and inference configuration (in order of precedence)."""
+        reasoning = dict(self._reasoning_configuration or {})
+        for override in (self.config.get("reasoning"), configuration.pop("reasoning", None)):
+            if isinstance(override, str):
+                reasoning["policy"] = override
+            elif isinstance(override, dict):
+                reasoning.update(override)
+        return reasoning if reasoning.get("policy") else None
+
+    def _sample_candidates(self, inputs: Any, gen_config: dict, output_processor_config: dict, n: int) -> list[tuple[str, float | None]]:
+        """Sample `n` candidates from a single prefill of the prompt (transformers).
+
+        The prompt (minus its last token) is prefilled once, its KV cache is forked into `n`
+        streams, and generation resumes from the shared state in a single batched call.
+        ONNX Runtime models generate the `n` streams in a single batched call, without a shared prefill.
+
+        Returns:
+            List of (text, logprob) tuples, one per candidate
+        """
+        input_ids = inputs["input_ids"]
+        attention_mask = inputs.get("attention_mask", torch.ones_like(input_ids))
+        prompt_length = input_ids.shape[1]
+
+        gen_config = {**gen_config, "return_dict_in_generate": True, "output_scores": True}
+        gen_config.setdefault("do_sample", True)  # n greedy candidates would be identical
+
+        if self.engine == "transformers":
+            from transformers import DynamicCache
+
+            # Prefill the shared prompt once
+            cache = DynamicCache()
+            with torch.no_grad():
+                self.model(input_ids=input_ids[:, :-1], attention_mask=attention_mask[:, :-1], past_key_values=cache, use_cache=True)
+
+            # Fork the prefilled KV state into n sampling streams
+            cache.batch_repeat_interleave(n)
+            gen_config["past_key_values"] = cache
+
+        outputs = self.model.generate(
+            input_ids=input_ids.repeat(n, 1),
+            attention_mask=attention_mask.repeat(n, 1),
+            **gen_config,
+        )
+        scores = self.model.compute_transition_scores(outputs.sequences, outputs.scores, normalize_logits=True)
+
+        eos_token_ids = self.model.generation_config.eos_token_id
+        if eos_token_ids is None:
+            eos_token_ids = []
+        elif isinstance(eos_token_ids, int):
+            eos_token_ids = [eos_token_ids]
+
+        candidates = []
+        for i in range(n):
+            tokens = outputs.sequences[i, prompt_length:]
+
+            # Only score tokens up to (and including) the first end-of-sequence token
+            length = len(tokens)
+            finished = torch.isin(tokens, torch.tensor(eos_token_ids, device=tokens.device)).nonzero()
+            if len(finished):
+                length = int(finished[0]) + 1
+
+            logprob = float(scores[i, :length].sum())
+            text = self.tokenizer.decode(tokens[:length], skip_special_tokens=True, **output_processor_config)
+            candidates.append((text, logprob))
+
+        return candidates
+
+    def _sample_candidates_mlx(self, input_text: str, generate_kwargs: dict, n: int) -> list[tuple[str, float | None]]:
+        """Sample `n` candidates from a single prefill of the prompt (mlx-lm).
+
+        The prompt is prefilled once into a prompt cache, which is rewound to the prompt
+        after each candidate so every stream resumes from the same shared state.
+
+        Returns:
+            List of (text, logprob) tuples, one per candidate
+        """
+        import mlx.core as mx
+        from mlx_lm import stream_generate
+        from mlx_lm.models.cache import can_trim_prompt_cache, make_prompt_cache, trim_prompt_cache
+
+        prompt_tokens = self.tokenizer.encode(input_text)
+        generate_kwargs = {key: value for key, value in generate_kwargs.items() if key != "verbose"}
+
+        # Prefill the shared prompt once
+        prompt_cache = make_prompt_cache(self.model)
+        shared_prefill = can_trim_prompt_cache(prompt_cache)
+        if shared_prefill:
+            self.model(mx.array(prompt_tokens[:-1])[None], cache=prompt_cache)
+            mx.eval([c.state for c in prompt_cache])
+            prefill_length = prompt_cache[0].offset
+
+        candidates = []
+        for _ in range(n):
+            if shared_prefill:
+                prompt, kwargs = prompt_tokens[-1:], {"prompt_cache": prompt_cache}
+            else:
+                prompt, kwargs = prompt_tokens, {}
+
+            text, logprob = "", 0.0
+            for response in stream_generate(self.model, self.tokenizer, prompt=prompt, **generate_kwargs, **kwargs):
+                text += response.text
+                logprob += response.logprobs[response.token].item()
+            candidates.append((text, logprob))
+
+            # Rewind the cache to the shared prompt state
+            if shared_prefill:
+                trim_prompt_cache(prompt_cache, prompt_cache[0].offset - prefill_length)
+
+        return candidates
+
+    def _memory_pressure(self) -> bool:
+        """Check if available memory is below the minimum allowed for cached session state."""
+        if self.engine == "transformers" and torch.cuda.is_available():
+            available_memory, total_memory = torch.cuda.mem_get_info()
+        else:
+            system_memory = psutil.virtual_memory()
+            available_memory, total_memory = system_memory.available, system_memory.total
+        return available_memory / total_memory < self._min_available_memory
+
+    def _evict_idle_sessions(self, current: Session | None = None) -> None:
+        """Evict the cached KV state of the least recently used idle sessions, beyond the maximum number of cached sessions or under memory pressure."""
+        idle_sessions = sorted((session for session in self._sessions if session.cached() and session is not current), key=lambda session: session.last_used)
+        cached_sessions = len(idle_sessions) + (1 if current is not None and current.cached() else 0)
+        while idle_sessions and (cached_sessions > self._max_cached_sessions or self._memory_pressure()):
+            idle_sessions.pop(0).evict()
+            cached_sessions -= 1
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+
+    def _common_prefix_length(self, cached_ids: Any, input_ids: Any) -> int:
+        """Get the length of the prefix shared by cached token ids and a prompt (transformers)."""
+        # At least the last prompt token must be evaluated to generate
+        length = min(len(cached_ids), input_ids.shape[1] - 1)
+        mismatches = (cached_ids[:length] != input_ids[0, :length]).nonzero()
+        return int(mismatches[0]) if len(mismatches) else length
+
+    def _resume_cache(self, input_ids: Any, session: Session | None = None, pinned: list[PinnedContext] | None = None) -> Any | None:
+        """Get the cached KV state sharing the longest prefix with `input_ids`, cropped to that prefix (transformers).
+
+        Session state is consumed (generation extends it in place), pinned context state is copied so that it stays reusable.
+        """
+        candidates = [(block._kv, True) for block in pinned or [] if block._kv is not None]
+        if session is not None and session._kv is not None:
+            candidates.append((session._kv, False))
+            session._kv = None
+
+        best_length, best = 0, None
+        for (cached_ids, cache), shared in candidates:
+            length = self._common_prefix_length(cached_ids, input_ids)
+            if length > best_length:
+                best_length, best = length, (cache, shared)
+        if best is None:
+            return None
+
+        cache, shared = best
+        if shared:
+            cache = copy.deepcopy(cache)
+        cache.crop(best_length)
+        return cache
+
+    def _setup_compilation(self, logger: Logger) -> None:
+        """Persist compiled artifacts on disk (reused across restarts), and warm up the compiled decode step of each bucket."""
+        if self._compile["cache_dir"]:
+            os.environ["TORCHINDUCTOR_CACHE_DIR"] = self._compile["cache_dir"]
+        else:
+            os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", get_cache_dir("inductor"))
+        os.environ.setdefault("TORCHINDUCTOR_FX_GRAPH_CACHE", "1")
+
+        from transformers import CompileConfig
+
+        # Reduce overhead with CUDA graphs on GPUs, transformers only compiles on CUDA devices unless told otherwise
+        self._compile_config = CompileConfig(fullgraph=False, dynamic=False, mode=self._compile["mode"] or ("reduce-overhead" if self.model.device.type == "cuda" else "default"))
+        self._compile_config._compile_all_devices = True
+
+        if not self._compile["warmup"]:
+            return
+        inputs = self.tokenizer("Hello", return_tensors="pt").to(self.model.device)
+        for bucket in self._compile["buckets"]:
+            logger.print(prefix="Model", message=f"Warming up compiled generation (max length: {bucket})..", color=Color.GRAY)
+            if self._generate_compiled(inputs, {"max_new_tokens": 2, "do_sample": False}, logger, bucket=bucket) is None:
+                return
+        logger.print(prefix="Model", message=f"Compiled generation ready (buckets: {self._compile['buckets']})", color=Color.GREEN)
+
+    def _is_compilation_failure(self, error: BaseException) -> bool:
+        """Check if an error is a compiler failure (e.g. missing compiler toolchain, unsupported operators), and not an allocation
+        failure raised while compiling (recovered from by downgrading the quantization instead)."""
+        from torch._dynamo.exc import BackendCompilerFailed, Unsupported
+        from torch._inductor.exc import CppCompileError, CUDACompileError, InvalidCxxCompiler
+
+        # Compiler errors wrap the errors raised by the backends
+        chain: list[BaseException] = []
+        cause: BaseException | None = error
+        while cause is not None and cause not in chain:
+            chain.append(cause)
+            cause = getattr(cause, "inner_exception", None) or cause.__cause__
+        if any(self._is_out_of_memory(cause) for cause in chain):
+            return False
+        return isinstance(error, (BackendCompilerFailed, Unsupported, CppCompileError, CUDACompileError, InvalidCxxCompiler))
+
+    def _generate_compiled(self, inputs: Any, gen_config: dict, logger: Logger, streamer: "TextStreamer | None" = None, bucket: int | None = None) -> Any | None:
+        """Generate with a static KV cache sized to the smallest bucket fitting the prompt and generation budget, and a compiled decode step.
+
+        Static caches are allocated once per bucket and reused across calls, so that compiled graphs are reused as well.
+
+        Returns:
+            The generation outputs, or None to generate eagerly (no fitting bucket, or compilation failure)
+        """
+        if bucket is None:
+            max_new_tokens = gen_config.get("max_new_tokens") or self.model.generation_config.max_new_tokens
+            if not max_new_tokens:
+                return None
+            bucket = next((size for size in self._compile["buckets"] if size >= inputs.input_ids.shape[1] + max_new_tokens), None)
+            if bucket is None:
+                return None
+
+        cache = self._static_caches.get(bucket)
+        if cache is None:
+            from transformers import StaticCache
+
+            cache = self._static_caches[bucket] = StaticCache(config=self.model.config, max_cache_len=bucket)
+        else:
+            cache.reset()
+
+        try:
+            return self.model.generate(**inputs, **gen_config, past_key_values=cache, compile_config=self._compile_config, streamer=streamer, return_dict_in_generate=True)
+        except Exception as error:
+            if not self._is_compilation_failure(error):
+                raise
+            logger.print(prefix="Compile", message=f"Compiled generation failed, falling back to eager generation: {error}", color=Color.YELLOW)
+            self._compile = None
+            self._static_caches.clear()
+            return None
+
+    def _processor_configuration_for_engine(self) -> tuple[dict, dict]:
+        """Get the input and output processor configurations, updated with user-provided processor configurations."""
+        input_processor_config = self._engine_configuration(self._processor_configuration)["input"].copy()
+        output_processor_config = self._engine_configuration(self._processor_configuration)["output"].copy()
+
+        # Update with user-provided processor configurations if available
+        if "processor" in self.config:
+            if "input" in self.config["processor"]:
+                if "tokenizer" in self.config["processor"]["input"]:
+                    input_processor_config["tokenizer"].update(self.config["processor"]["input"]["tokenizer"])
+                if "chat_template" in self.config["processor"]["input"]:
+                    input_processor_config["chat_template"].update(self.config["processor"]["input"]["chat_template"])
+            if "output" in self.config["processor"]:
+                output_processor_config.update(self.config["processor"]["output"])
+
+        return input_processor_config, output_processor_config
+
+    def _prefill_context(self, pinned: PinnedContext) -> None:
+        """Render and prefill a pinned context block into its own KV state (transformers, llama.cpp), with the active adapter."""
+        pinned._kv_adapter = self._active_adapter
+        if self.engine == "transformers":
+            from transformers import DynamicCache
+
+            input_processor_config, _ = self._processor_configuration_for_engine()
+            input_text = self.tokenizer.apply_chat_template(
+                pinned.messages,
+                tokenize=False,
+                **{**input_processor_config.get("chat_template", {}), "add_generation_prompt": False},
+            )
+            input_ids = self.tokenizer(input_text, return_tensors="pt", **input_processor_config.get("tokenizer", {})).input_ids.to(self.model.device)
+
+            cache = DynamicCache()
+            with torch.no_grad():
+                self.model(input_ids=input_ids, past_key_values=cache, use_cache=True)
+            pinned._kv = (input_ids[0], cache)
+
+        elif self.engine == "llama.cpp":
+            prompt = self._format_chat_prompt(pinned.messages, add_generation_prompt=False)
+            self.model.reset()
+            self.model.eval(self.model.tokenize(prompt.encode("utf-8"), special=True))
+            pinned._kv = self.model.save_state()
+            self._kv_owner = ("context", pinned.id)
+
+        elif self.engine == "llama.cpp-server":
+            # Prefill the block into every slot, the server reuses a slot's cached prompt prefix
+            prompt = self._format_chat_prompt(pinned.messages, add_generation_prompt=False)
+            with ThreadPoolExecutor(max_workers=self._n_parallel) as executor:
+                list(executor.map(lambda slot: self.model.complete(prompt, {"n_predict": 0}, slot=slot), range(self._n_parallel)))
+            pinned._kv = prompt
+
+    def add_adapter(self, name: str, adapter: str | AdapterConfig) -> None:
+        """Register a LoRA adapter over the shared base model, selected per call (`configuration={"adapter": name}`) or per session.
+
+        Adapters are loaded with the model (right away if it is loaded, llama.cpp-server: on next load), their weights
+        stay resident next to the base weights so that switching between adapters is cheap.
+
+        Args:
+            name: Name of the adapter
+            adapter: Local path or Hugging Face repository id of the adapter (transformers: PEFT adapter, llama.cpp: GGUF LoRA file),
+                or adapter configuration (path or model_id, model_file, scale)
+        """
+        if self.engine not in ADAPTER_ENGINES:
+            raise ValueError(f"[UniversalModelMixin:add_adapter] Adapters are not supported by engine {self.engine}. Use one of {list(ADAPTER_ENGINES)}")
+        if self.engine_config.get("quantize"):
+            raise ValueError(f"[UniversalModelMixin:add_adapter] Adapters are not supported with quantization {self.quantization} (quantized at load time)")
+
+        with self._lock:
+            self._adapters[name] = adapter_config(adapter)
+            if self.model and self.engine != "llama.cpp-server":
+                self._load_adapter(name)
+
+    def _load_adapter(self, name: str) -> None:
+        """Load a registered adapter next to the loaded base model."""
+        adapter = self._adapters[name]
+        if self.engine == "transformers":
+            from peft import PeftModel
+
+            if isinstance(self.model, PeftModel):
+                self.model.load_adapter(adapter_path(adapter, self.engine), adapter_name=name)
+            else:
+                self.model = PeftModel.from_pretrained(self.model, adapter_path(adapter, self.engine), adapter_name=name)
+            # Loading an adapter activates it, restore the active adapter
+            self._active_adapter = name
+            self._activate_adapter(None)
+        elif self.engine == "llama.cpp":
+            if self._lora is None:
+                self._lora = LlamaLoraAdapters(self.model)
+            self._lora.add(name, adapter_path(adapter, self.engine), adapter.get("scale", 1.0))
+
+    def _activate_adapter(self, adapter: str | None) -> None:
+        """Activate an adapter on the loaded model (None: base model), without reloading any weights."""
+        if adapter == self._active_adapter:
+            return
+        if self.engine == "transformers":
+            if adapter is None:
+                self.model.base_model.disable_adapter_layers()
+            else:
+                self.model.base_model.enable_adapter_layers()
+                self.model.set_adapter(adapter)
+        elif self.engine == "llama.cpp":
+            self._lora.activate(adapter)
+            # The evaluated prompt prefix was computed with the previous adapter
+            self.model.reset()
+            self._kv_owner = None
+        self._active_adapter = adapter
+
+    def pin_context(self, items: list[Any]) -> PinnedContext:
+        """Render and prefill context items once, and get a handle to reference them in later calls (`context=[handle, ...]`).
+
+        The model is loaded if needed. Prefilled KV state stays resident until evicted or the model is
+        unloaded, it is then prefilled again on next use (mlx-lm and onnxruntime context blocks are only rendered).
+        """
+        if not items:
+            raise ValueError("[UniversalModelMixin:pin_context] Context items are required")
+
+        pinned = PinnedContext(self, items)
+        with self._lock, Logger(self._log_level) as logger:
+            logger.print(message=f"* Pinning context.. ({self._name}) *", color=Color.WHITE)
+            self._pinned_contexts.add(pinned)
+            if not self.model:
+                self.load()
+            self._prefill_context(pinned)
+        return pinned
+
+    def session(self, adapter: str | None = None) -> Session:
+        """Open a conversation session over this model, with its own history and cached KV state.
+
+        Sessions can be processed concurrently, generation on the shared model is serialized.
+
+        Args:
+            adapter: Name of the registered adapter to process the session with (default: base model)
+        """
+        if adapter is not None and adapter not in self._adapters:
+            raise ValueError(f"[UniversalModelMixin:session] Unknown adapter: {adapter} (must be one of {list(self._adapters)})")
+        session = Session(self, adapter=adapter)
+        with self._lock:
+            self._sessions.add(session)
+        return session
+
+    @contextmanager
+    def _generation_slot(self) -> Iterator[None]:
+        """Reserve a generation slot on the model, in-process engines have a single slot (generation is serialized)."""
+        # Slots are replaced when swapping between in-process engines and llama.cpp-server
+        while True:
+            slots = self._slots
+            slots.acquire()
+            if slots is self._slots:
+                break
+            slots.release()
+        try:
+            with self._lock:
+                self._in_flight += 1
+            try:
+                yield
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+        finally:
+            slots.release()
+
+    def _generate_llama_server(self, prompt: str, gen_config: dict, n: int, text_filter: ReasoningTraceFilter | None, slot: int | None) -> str | list[tuple[str, float | None]] | None:
+        """Generate through the llama.cpp-server engine, candidates are sampled concurrently in the server's parallel slots.
+
+        Returns:
+            The response, or list of (text, logprob) tuples when sampling several candidates (None if streamed to `text_filter`)
+        """
+        if n > 1:
+            with ThreadPoolExecutor(max_workers=min(n, self._n_parallel)) as executor:
+                completions = list(executor.map(lambda _: self.model.complete(prompt, {**gen_config, "n_probs": 1}), range(n)))
+            return [(completion["content"].strip(), completion_logprob(completion)) for completion in completions]
+        if text_filter:
+            for chunk in self.model.stream(prompt, gen_config, slot=slot):
+                text_filter.feed(chunk)
+            return None
+        return self.model.complete(prompt, gen_config, slot=slot)["content"].strip()
+
     def process(self, input: str | list[Message], context: list[Any] | None = None, configuration: dict | None = None, remember: bool = False, keep_alive: bool = False) -> tuple[Any, dict]:
         """Process input through the model."""
-        with Logger(self._log_level) as logger:
+        return self._process(input, context=context, configuration=configuration, remember=remember, keep_alive=keep_alive)
+
+    def _process(self, input: str | list[Message], context: list[Any] | None = None, configuration: dict | None = None, remember: bool = False, keep_alive: bool = False, session: Session | None = None) -> tuple[Any, dict]:
+        """Process input through the model, within a session's history and cached KV state if provided (model history otherwise).
+
+        Allocation failures are recovered from transparently by downgrading the quantization and processing again (see `_recover()`).
+        """
+        downgrades = len(self._downgrades)
+        while True:
+            quantization = self.quantization
+            try:
+                output, logs = self._process_attempt(input, context=context, configuration=configuration, remember=remember, keep_alive=keep_alive, session=session)
+            except Exception as error:
+                with Logger(self._log_level) as logger:
+                    if not self._recover(error, quantization, "generate", logger):
+                        raise
+                continue
+
+            if len(self._downgrades) > downgrades:
+                logs["downgrades"] = self._downgrades[downgrades:]
+            return output, logs
+
+    def _process_attempt(self, input: str | list[Message], context: list[Any] | None = None, configuration: dict | None = None, remember: bool = False, keep_alive: bool = False, session: Session | None = None) -> tuple[Any, dict]:
+        """Process input through the model once (see `_process()`)."""
+        with self._generation_slot(), Logger(self._log_level) as logger:
             logger.print(message=f"* Invoking model.. ({self._name}) *\n", color=Color.WHITE)
             if not input:
                 raise ValueError("Input is required")
 
-            if not self.model:
-                logger.print(prefix="Model", message="Loading model..", color=Color.CYAN)
-                self.load()
-                logger.print(prefix="Model", message="Loading model..", color=Color.GRAY, replace_last_line=True)
-                logger.print(prefix="Model", message="Model loaded", color=Color.GREEN)
-            else:
-                logger.print(prefix="Model", message="Model already loaded", color=Color.GREEN)
+            with self._lock:
+                if not self.model:
+                    logger.print(prefix="Model", message="Loading model..", color=Color.CYAN)
+                    self.load()
+                    logger.print(prefix="Model", message="Loading model..", color=Color.GRAY, replace_last_line=True)
+                    logger.print(prefix="Model", message="Model loaded", color=Color.GREEN)
+                else:
+                    logger.print(prefix="Model", message="Model already loaded", color=Color.GREEN)
 
             logger.print(prefix="Model", message="Translating input..", color=Color.GRAY)
 
+            # Extract the number of candidates to sample (shared prefill)
+            configuration = dict(configuration or {})
+            n = int(configuration.pop("n", 1))
+            if n < 1:
+                raise ValueError(f"Invalid n value: {n} (must be a positive integer)")
+
+            # Select the adapter (per call, then per session, base model otherwise)
+            adapter = configuration.pop("adapter", session.adapter if session else None)
+            if adapter is not None and adapter not in self._adapters:
+                raise ValueError(f"[UniversalModelMixin:process:configuration] Unknown adapter: {adapter} (must be one of {list(self._adapters)})")
+
+            # Resolve the reasoning trace policy, traces are separated from the output as it is generated
+            reasoning = self._resolve_reasoning_configuration(configuration)
+            text_filter = ReasoningTraceFilter(reasoning.get("start_tag", "<think>"), reasoning.get("end_tag", "</think>")) if reasoning and n == 1 else None
+
             # Convert input to messages format if string
-            messages = input if isinstance(input, list) else [{"role": "user", "content": input}]
+            input_messages = input if isinstance(input, list) else [{"role": "user", "content": input}]
 
-            # Add context if provided
-            if context:
-                messages = [{"role": "system", "content": str(ctx)} for ctx in context] + messages
+            # Add context if provided, pinned context blocks go first so that their prefilled KV state is reused
+            pinned_messages, context_messages = split_context(self, context)
+            messages = context_messages + input_messages
 
-            # Add history to current messages
-            if self.history:
-                messages = self.history + messages
+            # Add history to current messages, windowed to the token budget if configured
+            history = session.history if session else self.history
+            if history and self._history_window:
+                history = self._history_window.fit(history, pinned_messages + messages)
+            messages = pinned_messages + history + messages
 
             logger.print(prefix="Model", message=f"Translated input: {messages}", color=Color.GRAY, debug=True)
 
             logger.print(prefix="Model", message="Configuring engine..", color=Color.GRAY)
 
             # Get processor configurations
-            input_processor_config = self._processor_configuration[self.engine]["input"].copy()
-            output_processor_config = self._processor_configuration[self.engine]["output"].copy()
-
-            # Update with user-provided processor configurations if available
-            if "processor" in self.config:
-                if "input" in self.config["processor"]:
-                    if "tokenizer" in self.config["processor"]["input"]:
-                        input_processor_config["tokenizer"].update(self.config["processor"]["input"]["tokenizer"])
-                    if "chat_template" in self.config["processor"]["input"]:
-                        input_processor_config["chat_template"].update(self.config["processor"]["input"]["chat_template"])
-                if "output" in self.config["processor"]:
-                    output_processor_config.update(self.config["processor"]["output"])
+            input_processor_config, output_processor_config = self._processor_configuration_for_engine()
+
+            # Activate the adapter, cached KV state computed with another adapter is stale
+            if self._adapters:
+                self._activate_adapter(adapter)
+                if session and session._kv_adapter != adapter:
+                    session.evict()
+
+            # Prefill pinned context blocks again if their KV state was evicted (or computed with another adapter)
+            blocks = pinned_blocks(context)
+            for block in blocks:
+                if not block.cached() or block._kv_adapter != self._active_adapter:
+                    self._prefill_context(block)
 
             logger.print(prefix="Model", message=f"Input processor config: {input_processor_config}", color=Color.GRAY, debug=True)
             logger.print(prefix="Model", message=f"Output processor config: {output_processor_config}", color=Color.GRAY, debug=True)
@@ -556,7 +1823,9 @@ class UniversalModelMixin(AbstractUniversalModel):
             logger.print(prefix="Model", message="Generating output..", color=Color.CYAN)
 
             # Process based on engine
-            if self.engine == "transformers":
+            if self.engine in ("transformers", "onnxruntime"):
+                from .streamers import ReasoningTraceStreamer
+
                 # Apply input processor config for tokenization
                 input_text = self.tokenizer.apply_chat_template(
                     messages,
@@ -570,14 +1839,35 @@ class UniversalModelMixin(AbstractUniversalModel):
                 ).to(self.model.device)
 
                 gen_config = self._translate_generation_config(configuration)
-                outputs = self.model.generate(**inputs, **gen_config)
-
-                # Apply output processor config for decoding
-                response = self.tokenizer.decode(
-                    outputs[0][len(inputs.input_ids[0]) :],
-                    skip_special_tokens=True,
-                    **output_processor_config,
-                )
+                if n > 1:
+                    candidates = self._sample_candidates(inputs, gen_config, output_processor_config, n)
+                else:
+                    streamer = ReasoningTraceStreamer(self.tokenizer, text_filter, skip_special_tokens=True, **output_processor_config) if text_filter else None
+
+                    # Resume from the session's (or pinned context's) cached KV state, only the prompt suffix it does not share is prefilled
+                    cache = self._resume_cache(inputs.input_ids, session, blocks)
+
+                    # Without resumable state, generate with a static KV cache and a compiled decode step if enabled (eagerly outside of the buckets)
+                    outputs = self._generate_compiled(inputs, gen_config, logger, streamer) if cache is None and self._compile else None
+                    if outputs is None:
+                        if streamer and self._compile_config:
+                            # Restart streaming if compiled generation failed midway
+                            text_filter.reset()
+                            streamer = ReasoningTraceStreamer(self.tokenizer, text_filter, skip_special_tokens=True, **output_processor_config)
+                        if cache is not None:
+                            gen_config = {**gen_config, "past_key_values": cache}
+                        outputs = self.model.generate(**inputs, **gen_config, streamer=streamer, return_dict_in_generate=True)
+
+                        if session and hasattr(outputs.past_key_values, "crop"):
+                            session._kv = (outputs.sequences[0, : outputs.past_key_values.get_seq_length()], outputs.past_key_values)
+                            session._kv_adapter = adapter
+
+                    # Apply output processor config for decoding
+                    response = self.tokenizer.decode(
+                        outputs.sequences[0][len(inputs.input_ids[0]) :],
+                        skip_special_tokens=True,
+                        **output_processor_config,
+                    )
 
             elif self.engine == "mlx-lm":
                 from mlx_lm import generate
@@ -618,7 +1908,36 @@ class UniversalModelMixin(AbstractUniversalModel):
                 if "stop_tokens" in gen_config:
                     generate_kwargs["stop_tokens"] = gen_config["stop_tokens"]
 
-                response = generate(self.model, self.tokenizer, prompt=input_text, **generate_kwargs)
+                if n > 1:
+                    candidates = self._sample_candidates_mlx(input_text, generate_kwargs, n)
+                elif text_filter:
+                    from mlx_lm import stream_generate
+
+                    generate_kwargs.pop("verbose")
+                    for chunk in stream_generate(self.model, self.tokenizer, prompt=input_text, **generate_kwargs):
+                        text_filter.feed(chunk.text)
+                else:
+                    response = generate(self.model, self.tokenizer, prompt=input_text, **generate_kwargs)
+
+            elif self.engine == "llama.cpp-server":
+                # Format the prompt using the chat template
+                prompt = self._format_chat_prompt(messages)
+
+                # Configure generation parameters
+                gen_config = self._translate_generation_config(configuration)
+
+                # Apply the adapter to this request only (adapters the server was started with, scaled to 0 otherwise)
+                if self._adapters:
+                    if adapter is not None and adapter not in self._server_adapters:
+                        raise ValueError(f"[UniversalModelMixin:process:configuration] Adapter {adapter} was registered after llama-server started, reload the model to use it")
+                    gen_config["lora"] = [{"id": i, "scale": self._adapters[name].get("scale", 1.0) if name == adapter else 0.0} for i, name in enumerate(self._server_adapters)]
+
+                # Sessions are bound to a slot, so that the server reuses the slot's cached prompt prefix
+                result = self._generate_llama_server(prompt, gen_config, n, text_filter, session.id if session else None)
+                if n > 1:
+                    candidates = result
+                else:
+                    response = result
 
             else:  # llama.cpp
                 # Format the prompt using the chat template
@@ -627,27 +1946,206 @@ class UniversalModelMixin(AbstractUniversalModel):
                 # Configure generation parameters
                 gen_config = self._translate_generation_config(configuration)
 
-                response = self.model(prompt, **gen_config)["choices"][0]["text"].strip()
+                # Restore the session's (or pinned context's) KV state if another session has used the model since,
+                # llama.cpp then reuses the evaluated prompt prefix
+                owner, state = (("session", session.id), session._kv) if session else (None, None)
+                if state is None and blocks:
+                    owner, state = ("context", blocks[0].id), blocks[0]._kv
+                if owner != self._kv_owner and state is not None:
+                    self.model.load_state(state)
+                self._kv_owner = owner
+
+                if n > 1:
+                    # llama.cpp reuses the evaluated prompt prefix between calls, so the prompt is only prefilled once
+                    # Token logprobs are only available when the model keeps all logits (logits_all=True)
+                    logits_all = getattr(self.model, "_logits_all", getattr(self.model.context_params, "logits_all", False))
+                    candidates = []
+                    for _ in range(n):
+                        output = self.model(prompt, **gen_config, logprobs=1 if logits_all else None)["choices"][0]
+                        logprobs = output.get("logprobs")
+                        candidates.append((output["text"].strip(), sum(logprobs["token_logprobs"]) if logprobs else None))
+                elif text_filter:
+                    for chunk in self.model(prompt, **{**gen_config, "stream": True}):
+                        text_filter.feed(chunk["choices"][0]["text"])
+                else:
+                    response = self.model(prompt, **gen_config)["choices"][0]["text"].strip()
+
+                if session:
+                    session._kv = self.model.save_state()
+                    session._kv_adapter = adapter
 
             logger.print(prefix="Model", message="Generating output..", color=Color.GRAY, replace_last_line=True)
             logger.print(prefix="Model", message="Generation complete", color=Color.GREEN)
 
-            if not keep_alive:
-                logger.print(prefix="Model", message="Unloading model..", color=Color.GRAY)
-                self.unload()
-                logger.print(prefix="Model", message="Model unloaded", color=Color.GREEN)
-
-            # Update history if remember is True
+            with self._lock:
+                if session:
+                    self._evict_idle_sessions(current=session)
+
+                # Only unload once no other request is in flight
+                if not keep_alive and self._in_flight == 1:
+                    logger.print(prefix="Model", message="Unloading model..", color=Color.GRAY)
+                    self.unload()
+                    logger.print(prefix="Model", message="Model unloaded", color=Color.GREEN)
+
+            logs = {"engine": self.engine, "quantization": self.quantization, "profile": self._profile["name"]}
+            if self._adapters:
+                logs["adapter"] = adapter
+            if self._offload:
+                logs["offload"] = self._offload_stats
+            remembered = response if n == 1 and not text_filter else None
+
+            # Apply the reasoning trace policy, traces are only exposed in the logs
+            if text_filter:
+                text_filter.flush()
+                response, remembered = apply_reasoning_policy(text_filter, reasoning["policy"], reasoning.get("summary_max_length", 500))
+                if text_filter.trace:
+                    logs["reasoning"] = text_filter.trace
+
+            if n > 1:
+                # Remember the most likely candidate when sampling several
+                best = max(range(n), key=lambda i: candidates[i][1] if candidates[i][1] is not None else float("-inf"))
+                response = [text for text, _ in candidates]
+                remembered = response[best]
+                logs["logprobs"] = [logprob for _, logprob in candidates]
+
+                if reasoning:
+                    text_filters = [split_reasoning(text, reasoning.get("start_tag", "<think>"), reasoning.get("end_tag", "</think>")) for text in response]
+                    outputs = [apply_reasoning_policy(candidate_filter, reasoning["policy"], reasoning.get("summary_max_length", 500)) for candidate_filter in text_filters]
+                    response = [output for output, _ in outputs]
+                    remembered = outputs[best][1]
+                    logs["reasoning"] = [candidate_filter.trace for candidate_filter in text_filters]
+
+            # Update history if remember is True, context is never duplicated into history
             if remember:
-                self.history = [*messages, {"role": "assistant", "content": response}]
+                history = [*history, *input_messages, {"role": "assistant", "content": remembered}]
+                if session:
+                    session.history = history
+                else:
+                    self.history = history
 
             logger.print(prefix="Model", message=f"Response: {response}", color=Color.GRAY, debug=True)
 
-            return response, {"engine": self.engine, "quantization": self.quantization}
+            return response, logs
+
+    def _export_onnx_model(self, model_id: str, model_dir: str, file_name: str) -> None:
+        """Export a Hugging Face checkpoint to ONNX (with past key values), and quantize its weights per the selected precision.
+
+        8-bit precision uses dynamic int8 quantization, 4-bit precision uses block-wise int4 MatMul quantization.
+        """
+        from optimum.onnxruntime import ORTModelForCausalLM
+
+        ORTModelForCausalLM.from_pretrained(model_id, export=True, use_cache=True, trust_remote_code=True).save_pretrained(model_dir)
+        if file_name == "model.onnx":
+            return
+
+        if self._precision == 8:
+            from optimum.onnxruntime import ORTQuantizer
+            from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+            if platform.machine().lower() in ("arm64", "aarch64"):
+                quantization_config = AutoQuantizationConfig.arm64(is_static=False, per_channel=True)
+            else:
+                quantization_config = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=True)
+            ORTQuantizer.from_pretrained(model_dir, file_name="model.onnx").quantize(save_dir=model_dir, quantization_config=quantization_config, file_suffix="int8", use_external_data_format=True)
+        else:
+            import onnx
+
+            try:
+                from onnxruntime.quantization.matmul_nbits_quantizer import MatMulNBitsQuantizer as MatMul4BitsQuantizer
+            except ImportError:  # onnxruntime < 1.20
+                from onnxruntime.quantization.matmul_4bits_quantizer import MatMul4BitsQuantizer
+
+            # Block-wise symmetric int4 weights, with int8 activations in the MatMul kernels on CPU (accuracy level 4)
+            quantizer = MatMul4BitsQuantizer(onnx.load(os.path.join(model_dir, "model.onnx")), block_size=32, is_symmetric=True, accuracy_level=4)
+            quantizer.process()
+            quantizer.model.save_model_to_file(os.path.join(model_dir, file_name), use_external_data_format=True)
+
+        # Only keep the quantized graph
+        for exported_file in ("model.onnx", "model.onnx_data"):
+            if os.path.exists(os.path.join(model_dir, exported_file)):
+                os.remove(os.path.join(model_dir, exported_file))
+
+    def _load_transformers_model(self, model_id: str, model_config: dict, downloads: dict[str, Future] | None = None) -> Any:
+        """Load a transformers model, applying the cpu weight quantization of the source if any (int8 dynamic, int4 weight-only).
+
+        Safetensors shards being downloaded (see `_resolve_model()`) are deserialized as they complete, while the next ones
+        download, unless the weights are quantized or mapped across devices or disk at load time.
+        """
+        from transformers import MODEL_FOR_CAUSAL_LM_MAPPING, AutoConfig, AutoModelForCausalLM, GenerationConfig
+
+        quantize = self.engine_config.get("quantize")
+        shards = [download for filename, download in (downloads or {}).items() if filename.endswith(".safetensors")]
+        if shards and not quantize and not self._offload and not torch.cuda.is_available():
+            config = AutoConfig.from_pretrained(model_id, trust_remote_code=True)
+            if type(config) in MODEL_FOR_CAUSAL_LM_MAPPING:
+                model = MODEL_FOR_CAUSAL_LM_MAPPING[type(config)].from_pretrained(None, config=config, state_dict=load_shards(shards), **model_config)
+                with suppress(OSError):
+                    model.generation_config = GenerationConfig.from_pretrained(model_id)
+                return model
+        for download in (downloads or {}).values():
+            download.result()
+
+        if quantize == "int8_dynamic":
+            # Dynamic quantization converts float32 linear layers, activations are quantized on the fly at inference. Layers are
+            # converted one at a time from the 16-bit checkpoint, so that loading peaks at the checkpoint and one float32 layer
+            model_config = {**model_config, "torch_dtype": torch.bfloat16, "device_map": "cpu"}
+            model = AutoModelForCausalLM.from_pretrained(model_id, trust_remote_code=True, **model_config)
+            for parent in list(model.modules()):
+                for name, child in list(parent.named_children()):
+                    if isinstance(child, torch.nn.Linear):
+                        setattr(parent, name, torch.ao.quantization.quantize_dynamic(torch.nn.Sequential(child.float()), {torch.nn.Linear}, dtype=torch.qint8, inplace=True)[0])
+            return model.float()
+        if quantize == "int4_weight_only":
+            from transformers import QuantoConfig
+
+            # Linear weights are quantized to packed int4 as they are loaded, computations run in bfloat16
+            model_config = {**model_config, "torch_dtype": torch.bfloat16, "device_map": "cpu", "quantization_config": QuantoConfig(weights="int4")}
+        return AutoModelForCausalLM.from_pretrained(model_id, trust_remote_code=True, **model_config)
+
+    def _load_onnx_model(self, model_id: str, model_config: dict, logger: Logger) -> Any:
+        """Load an ONNX Runtime model, exported (and quantized) once from the Hugging Face checkpoint and cached.
+
+        Sources with a `model_file` reference a pre-exported ONNX graph in the model repository, which is loaded as is.
+        """
+        import onnxruntime
+        from optimum.onnxruntime import ORTModelForCausalLM
+
+        model_config = model_config.copy()
+        provider = model_config.pop("provider", None)
+        if not provider:
+            provider = "CUDAExecutionProvider" if torch.cuda.is_available() and "CUDAExecutionProvider" in onnxruntime.get_available_providers() else "CPUExecutionProvider"
+
+        # Apply all graph optimizations on session creation, with the hardware profile's intra-op threads
+        session_options = onnxruntime.SessionOptions()
+        session_options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        session_options.intra_op_num_threads = model_config.pop("intra_op_num_threads", None) or self._threads
+
+        if self.engine_config.get("model_file"):
+            subfolder, file_name = os.path.split(self.engine_config["model_file"])
+            return ORTModelForCausalLM.from_pretrained(model_id, subfolder=subfolder, file_name=file_name, provider=provider, session_options=session_options, **model_config)
+
+        model_dir = get_cache_dir("onnx", self.engine_config["model_id"].replace("/", "--"), self.quantization)
+        file_name = {8: "model_int8.onnx", 4: "model_int4.onnx"}.get(self._precision, "model.onnx")
+        if not os.path.exists(os.path.join(model_dir, file_name)):
+            logger.print(prefix="ONNX Export", message=f"Exporting {model_id} ({self.quantization}) to {model_dir}..", color=Color.YELLOW)
+            self._export_onnx_model(model_id, model_dir, file_name)
+
+        return ORTModelForCausalLM.from_pretrained(model_dir, file_name=file_name, provider=provider, session_options=session_options, **model_config)
 
     def load(self) -> None:
+        """Load model into memory based on engine type, downgrading the quantization on allocation failures (see `_recover()`)."""
+        while True:
+            quantization = self.quantization
+            try:
+                return self._load()
+            except Exception as error:
+                with Logger(self._log_level) as logger:
+                    if not self._recover(error, quantization, "load", logger):
+                        raise
+
+    def _load(self) -> None:
         """Load model into memory based on engine type."""
-        with Logger(self._log_level) as logger:
+        with self._lock, Logger(self._log_level) as logger:
             logger.print(message=f"* Loading model.. ({self._name}) *", color=Color.WHITE)
             # Clear CUDA cache and reset memory stats if CUDA is available
             if torch.cuda.is_available():
@@ -658,11 +2156,19 @@ class UniversalModelMixin(AbstractUniversalModel):
                     # Cap available memory for each GPU
                     torch.cuda.set_per_process_memory_fraction(self.usable_memory, i)
 
-            if self.engine == "transformers":
-                model_id = self.engine_config["model_id"]
+            # Memory budget of resident weights when offloading, weights beyond it are offloaded (see `_translate_model_config()`)
+            if self._offload:
+                self._offload_stats = {"budget": self._offload_budget()}
+
+            if self.engine in ("transformers", "onnxruntime"):
+                # Download missing files with parallel ranged requests, the tokenizer is loaded once the small files are downloaded
+                model_id, downloads = self._resolve_model()
+                for filename, download in (downloads or {}).items():
+                    if not filename.endswith(WEIGHT_EXTENSIONS):
+                        download.result()
 
                 # Get tokenizer config from default and user processor settings
-                tokenizer_config = self._processor_configuration[self.engine]["input"]["tokenizer"].copy()
+                tokenizer_config = self._engine_configuration(self._processor_configuration)["input"]["tokenizer"].copy()
                 if "processor" in self.config and "input" in self.config["processor"] and "tokenizer" in self.config["processor"]["input"]:
                     tokenizer_config.update(self.config["processor"]["input"]["tokenizer"])
 
@@ -670,24 +2176,44 @@ class UniversalModelMixin(AbstractUniversalModel):
                 special_tokens = tokenizer_config.pop("special_tokens", {})
 
                 # Initialize tokenizer with remaining config
+                from transformers import AutoTokenizer
+
                 self.tokenizer = AutoTokenizer.from_pretrained(model_id, **tokenizer_config)
 
                 # Add special tokens if provided
                 if special_tokens:
                     self.tokenizer.add_special_tokens(special_tokens)
                     # Update processor configuration to remove special_tokens
-                    if "special_tokens" in self._processor_configuration[self.engine]["input"]["tokenizer"]:
-                        del self._processor_configuration[self.engine]["input"]["tokenizer"]["special_tokens"]
+                    if "special_tokens" in self._engine_configuration(self._processor_configuration)["input"]["tokenizer"]:
+                        del self._engine_configuration(self._processor_configuration)["input"]["tokenizer"]["special_tokens"]
 
                 # Load model with memory-efficient settings
                 model_config = self._translate_model_config()
 
-                self.model = AutoModelForCausalLM.from_pretrained(model_id, trust_remote_code=True, **model_config)
+                if self.engine == "transformers":
+                    if self._device_type == "cpu":
+                        torch.set_num_threads(self._threads)
+                    self.model = self._load_transformers_model(model_id, model_config, downloads)
+                    if self._offload:
+                        # Read ahead the disk-offloaded layers following each computing layer
+                        self._prefetcher = LayerPrefetcher(self.model, prefetch=self._offload["prefetch"]) if self._offload["prefetch"] else None
+                        resident_memory, offloaded_memory = weights_size(self.model)
+                        self._offload_stats.update({"resident": round(resident_memory, 2), "offloaded": round(offloaded_memory, 2), "dir": model_config["offload_folder"]})
+                    for name in self._adapters:
+                        self._load_adapter(name)
+                    if self._compile:
+                        self._setup_compilation(logger)
+                else:
+                    for download in (downloads or {}).values():
+                        download.result()
+                    self.model = self._load_onnx_model(model_id, model_config, logger)
 
             elif self.engine == "mlx-lm":
                 from mlx_lm import load
 
-                model_id = self.engine_config["model_id"]
+                model_id, downloads = self._resolve_model()
+                for download in (downloads or {}).values():
+                    download.result()
 
                 # Get tokenizer config from default and user processor settings
                 tokenizer_config = self._processor_configuration[self.engine]["input"]["tokenizer"].copy()
@@ -696,15 +2222,52 @@ class UniversalModelMixin(AbstractUniversalModel):
 
                 self.model, self.tokenizer = load(model_id, tokenizer_config=tokenizer_config)
 
-            else:  # llama.cpp
-                from llama_cpp import Llama
-
+            else:  # llama.cpp, llama.cpp-server
                 # Download the GGUF model from HuggingFace
-                model_id = self.engine_config["model_id"]
+                model_id, downloads = self._resolve_model()
                 model_file = self.engine_config["model_file"]
-                model_path = hf_hub_download(repo_id=model_id, filename=model_file, repo_type="model")
+                for download in (downloads or {}).values():
+                    download.result()
+                model_path = hf_hub_download(repo_id=model_id, filename=model_file, repo_type="model") if self._source.engine_resolution and not os.path.isdir(model_id) else os.path.join(model_id, model_file)
+                self._chat_metadata = self._gguf_chat_metadata()
+
+                model_config = self._translate_model_config()
+                if self.engine == "llama.cpp-server":
+                    # Spawn and supervise a local llama-server process for the model
+                    model_config.pop("n_parallel", None)
+                    # Adapters are loaded at startup and applied per request (unapplied by default)
+                    self._server_adapters = list(self._adapters)
+                    adapter_args = [arg for name in self._server_adapters for arg in ("--lora", adapter_path(self._adapters[name], self.engine))]
+                    self.model = LlamaServer(
+                        model_path,
+                        model_config,
+                        n_parallel=self._n_parallel,
+                        binary=model_config.pop("server_binary", None),
+                        extra_args=(model_config.pop("server_args", None) or []) + adapter_args + (["--lora-init-without-apply"] if adapter_args else []),
+                    )
+                    self.model.start()
+                else:
+                    from llama_cpp import Llama
+
+                    self.model = Llama(model_path=model_path, **model_config)
+                    for name in self._adapters:
+                        self._load_adapter(name)
 
-                self.model = Llama(model_path=model_path, **self._translate_model_config())
+                if self._offload:
+                    # Weights beyond the memory budget stay on disk, paged in from the memory-mapped file
+                    model_size = os.path.getsize(model_path) / (1024**3)
+                    resident_memory = min(model_size, self._offload_stats["budget"])
+                    self._offload_stats.update({"resident": round(resident_memory, 2), "offloaded": round(model_size - resident_memory, 2), "dir": os.path.dirname(model_path)})
+
+            # Pin the files of the engine in the local store while loaded, and enforce the store quota
+            self._track_files(pin=True)
+
+            # History token counts are cached per tokenizer
+            if self._history_window:
+                self._history_window.clear()
+
+            if self._offload:
+                logger.print(prefix="Model", message=f"Offloading: {self._offload_stats['resident']:.2f}GB resident (budget: {self._offload_stats['budget']:.2f}GB), {self._offload_stats['offloaded']:.2f}GB on disk ({self._offload_stats['dir']})", color=Color.YELLOW)
 
             # Final memory cleanup
             if torch.cuda.is_available():
@@ -715,14 +2278,35 @@ class UniversalModelMixin(AbstractUniversalModel):
 
     def unload(self) -> None:
         """Unload model from memory."""
-        with Logger(self._log_level) as logger:
+        with self._lock, Logger(self._log_level) as logger:
             logger.print(message=f"* Unloading model.. ({self._name}) *", color=Color.WHITE)
+
+            # Session and pinned context KV state is bound to the loaded model
+            for session in self._sessions:
+                session.evict()
+            for pinned in self._pinned_contexts:
+                pinned.evict()
+            self._kv_owner = None
+            self._static_caches.clear()
+            if self._prefetcher:
+                self._prefetcher.remove()
+                self._prefetcher = None
+            self._active_adapter = None
+            self._lora = None
+            if self._store_pin:
+                self._source.index.unpin(self.engine_config, self._store_pin)
+                self._store_pin = None
+
             # Clear any cached tensors and move model to CPU if needed
             if self.model:
                 # Clear any cached tensors
                 if hasattr(self.model, "clear_cache"):
                     self.model.clear_cache()
 
+                # Stop the llama-server process
+                if self.engine == "llama.cpp-server":
+                    self.model.stop()
+
                 # Delete model and force garbage collection
                 del self.model
                 self.model = None
@@ -732,6 +2316,8 @@ class UniversalModelMixin(AbstractUniversalModel):
                 del self.tokenizer
                 self.tokenizer = None
                 gc.collect()
+            if self._history_window:
+                self._history_window.clear()
 
             # Clear memory based on device type
             if torch.cuda.is_available():
@@ -807,7 +2393,7 @@ class UniversalModelMixin(AbstractUniversalModel):
                 "quantization": self.quantization,
                 "model_config": self._translate_model_config(),
                 "inference_config": self._translate_generation_config(self.configuration),
-                "processor_config": self._processor_configuration[self.engine],
+                "processor_config": self._engine_configuration(self._processor_configuration),
             }
             return config
 
@@ -0,0 +1,294 @@
+"""
+Managed `llama-server` subprocess for the llama.cpp-server engine.
+
+The server is spawned for a GGUF model file and supervised (health checks, restarts), so that a crash
+does not take down the calling process. Requests go over a pooled keep-alive HTTP connection on
+localhost, and are served concurrently by the server's parallel slots with continuous batching.
+"""
+
+import json
+import math
+import os
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# llama.cpp model parameters and their llama-server flags
+SERVER_FLAGS = {
+    "n_threads": "--threads",
+    "n_batch": "--batch-size",
+    "n_ubatch": "--ubatch-size",
+    "n_gpu_layers": "--n-gpu-layers",
+    "main_gpu": "--main-gpu",
+    "rope_freq_base": "--rope-freq-base",
+    "rope_freq_scale": "--rope-freq-scale",
+}
+
+# llama.cpp model switches, the value enabling the llama-server flag
+SERVER_SWITCHES = {
+    "use_mlock": (True, "--mlock"),
+    "use_mmap": (False, "--no-mmap"),
+}
+
+# llama.cpp generation parameters and their llama-server equivalents (None: not supported)
+SERVER_PARAMETERS = {
+    "max_tokens": "n_predict",
+    "echo": None,
+    "stream": None,
+    "logprobs": None,
+    "beam_search_size": None,
+}
+
+
+def completion_logprob(completion: dict) -> float | None:
+    """Sum the token logprobs of a llama-server completion, if returned (`n_probs` > 0)."""
+    probabilities = completion.get("completion_probabilities")
+    if not probabilities:
+        return None
+
+    logprob = 0.0
+    for token in probabilities:
+        if "logprob" in token:
+            logprob += token["logprob"]
+            continue
+        # Older servers only return the probabilities of the top tokens
+        prob = next((candidate["prob"] for candidate in token.get("probs", []) if candidate.get("tok_str") == token.get("content")), None)
+        if not prob:
+            return None
+        logprob += math.log(prob)
+    return logprob
+
+
+class LlamaServer:
+    """Supervised `llama-server` process serving a GGUF model on localhost."""
+
+    def __init__(
+        self,
+        model_path: str,
+        model_config: dict,
+        n_parallel: int = 4,
+        binary: str | None = None,
+        extra_args: list[str] | None = None,
+        host: str = "127.0.0.1",
+        startup_timeout: float = 300.0,
+        health_check_interval: float = 10.0,
+        max_restarts: int = 3,
+    ) -> None:
+        """Initialize the server (see `start()`).
+
+        Args:
+            model_path: Path of the GGUF model file
+            model_config: llama.cpp model configuration, translated to llama-server flags (`n_ctx` is per slot)
+            n_parallel: Number of parallel slots
+            binary: Path of the llama-server binary (defaults to $LLAMA_SERVER_PATH, or `llama-server` on the PATH)
+            extra_args: Additional llama-server command line arguments
+            host: Host to bind the server to
+            startup_timeout: Maximum time to wait for the model to be loaded, in seconds
+            health_check_interval: Interval between health checks of the running server, in seconds
+            max_restarts: Maximum number of restarts after a crash or failed health checks
+        """
+        self.binary = binary or os.environ.get("LLAMA_SERVER_PATH") or shutil.which("llama-server")
+        if not self.binary:
+            raise ValueError("[LlamaServer] llama-server binary not found. Please install llama.cpp (https://github.com/ggml-org/llama.cpp) or set the LLAMA_SERVER_PATH environment variable.")
+        if n_parallel < 1:
+            raise ValueError(f"[LlamaServer] Invalid n_parallel value: {n_parallel} (must be a positive integer)")
+
+        self.model_path = model_path
+        self.model_config = model_config
+        self.n_parallel = n_parallel
+        self.extra_args = extra_args or []
+        self.host = host
+        self.port: int | None = None
+        self.startup_timeout = startup_timeout
+        self.health_check_interval = health_check_interval
+        self.max_restarts = max_restarts
+        self.restarts = 0
+
+        self.process: subprocess.Popen | None = None
+        self._log: Any | None = None
+        self._restart_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._watchdog: threading.Thread | None = None
+
+        # Keep-alive connections, one per parallel slot
+        self._http = requests.Session()
+        self._http.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=n_parallel))
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def _command(self) -> list[str]:
+        """Build the llama-server command line."""
+        n_ctx = self.model_config.get("n_ctx") or 2048
+        command = [
+            self.binary,
+            "--model",
+            self.model_path,
+            "--host",
+            self.host,
+            "--port",
+            str(self.port),
+            "--parallel",
+            str(self.n_parallel),
+            "--cont-batching",
+            "--ctx-size",
+            str(n_ctx * self.n_parallel),  # the context is split between slots
+        ]
+        for param, flag in SERVER_FLAGS.items():
+            if self.model_config.get(param) is not None:
+                command += [flag, str(self.model_config[param])]
+        for param, (value, flag) in SERVER_SWITCHES.items():
+            if param in self.model_config and bool(self.model_config[param]) == value:
+                command.append(flag)
+        return command + self.extra_args
+
+    def _log_tail(self) -> str:
+        """Get the last lines of the server log."""
+        if not self._log:
+            return ""
+        self._log.seek(0)
+        return "\n".join(self._log.read().decode("utf-8", errors="replace").splitlines()[-20:])
+
+    def start(self) -> None:
+        """Spawn the server and wait until the model is loaded."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind((self.host, 0))
+            self.port = sock.getsockname()[1]
+
+        self._log = tempfile.TemporaryFile()
+        self.process = subprocess.Popen(self._command(), stdout=self._log, stderr=subprocess.STDOUT)
+
+        deadline = time.monotonic() + self.startup_timeout
+        while not self.healthy():
+            if self.process.poll() is not None:
+                raise ValueError(f"[LlamaServer] llama-server exited with code {self.process.returncode}:\n{self._log_tail()}")
+            if time.monotonic() > deadline:
+                self._terminate()
+                raise ValueError(f"[LlamaServer] llama-server did not load the model within {self.startup_timeout}s:\n{self._log_tail()}")
+            time.sleep(0.25)
+
+        if not self._watchdog or not self._watchdog.is_alive():
+            self._stopped.clear()
+            self._watchdog = threading.Thread(target=self._watch, name="llama-server-watchdog", daemon=True)
+            self._watchdog.start()
+
+    def healthy(self) -> bool:
+        """Check if the server is running, with the model loaded."""
+        if not self.process or self.process.poll() is not None:
+            return False
+        try:
+            return self._http.get(f"{self.url}/health", timeout=2).status_code == 200
+        except requests.RequestException:
+            return False
+
+    def _watch(self) -> None:
+        """Restart the server if it crashes or fails consecutive health checks."""
+        failures = 0
+        while not self._stopped.wait(self.health_check_interval):
+            process = self.process
+            failures = 0 if self.healthy() else failures + 1
+            if failures and (process.poll() is not None or failures >= 3):
+                try:
+                    self.restart(process)
+                except ValueError:
+                    return
+                failures = 0
+
+    def restart(self, process: subprocess.Popen | None = None) -> None:
+        """Restart the server (unless it has been restarted already since `process` failed)."""
+        with self._restart_lock:
+            if self._stopped.is_set() or (process is not None and process is not self.process):
+                return
+            if self.restarts >= self.max_restarts:
+                raise ValueError(f"[LlamaServer] llama-server failed after {self.restarts} restarts:\n{self._log_tail()}")
+            self.restarts += 1
+            self._terminate()
+            self.start()
+
+    def _terminate(self) -> None:
+        """Terminate the server process."""
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        if self._log:
+            self._log.close()
+            self._log = None
+
+    def stop(self) -> None:
+        """Stop the server and its supervision."""
+        self._stopped.set()
+        with self._restart_lock:
+            self._terminate()
+        self._http.close()
+
+    def _post(self, path: str, payload: dict, stream: bool = False) -> requests.Response:
+        """Post a request to the server, restarting it (once) if it is down."""
+        for attempt in range(2):
+            process = self.process
+            if process is None or process.poll() is not None:
+                self.restart(process)
+                process = self.process
+            try:
+                response = self._http.post(f"{self.url}{path}", json=payload, stream=stream)
+            except requests.ConnectionError as error:
+                if attempt:
+                    raise ValueError("[LlamaServer] llama-server is not responding.") from error
+                self.restart(process)
+                continue
+            if response.status_code >= 400:
+                raise ValueError(f"[LlamaServer] Error generating output ({response.status_code}): {response.text[:500]}")
+            return response
+        raise ValueError("[LlamaServer] Error generating output.")
+
+    def _payload(self, prompt: str, parameters: dict, slot: int | None) -> dict:
+        """Build a completion request, translating llama.cpp generation parameters."""
+        payload = {"prompt": prompt, "cache_prompt": True}  # reuse the slot's KV cache for the shared prompt prefix
+        for param, value in parameters.items():
+            server_param = SERVER_PARAMETERS.get(param, param)
+            if server_param is not None:
+                payload[server_param] = value
+        if slot is not None:
+            payload["id_slot"] = slot % self.n_parallel
+        return payload
+
+    def complete(self, prompt: str, parameters: dict, slot: int | None = None) -> dict:
+        """Generate a completion.
+
+        Args:
+            prompt: Formatted prompt
+            parameters: llama.cpp generation parameters
+            slot: Slot to generate in (to reuse its KV cache), any idle slot otherwise
+
+        Returns:
+            Completion result (content, completion_probabilities, ...)
+        """
+        return self._post("/completion", self._payload(prompt, parameters, slot)).json()
+
+    def stream(self, prompt: str, parameters: dict, slot: int | None = None) -> Iterator[str]:
+        """Generate a completion, yielding text chunks as they are generated."""
+        response = self._post("/completion", {**self._payload(prompt, parameters, slot), "stream": True}, stream=True)
+        with response:
+            for line in response.iter_lines():
+                if not line.startswith(b"data: "):
+                    continue
+                chunk = json.loads(line[len(b"data: ") :])
+                yield chunk.get("content", "")
+                if chunk.get("stop"):
+                    break
+
+    def tokenize(self, text: str) -> list[int]:
+        """Tokenize a text with the model's tokenizer."""
+        return self._post("/tokenize", {"content": text, "add_special": False}).json()["tokens"]
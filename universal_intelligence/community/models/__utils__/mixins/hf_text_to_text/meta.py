@@ -6,6 +6,16 @@ import yaml
 from ......core.utils.types import Compatibility, Contract
 from .types import Sources
 
+# Full precision transformers checkpoints, from which CPU weight quantizations are derived
+FULL_PRECISION_QUANTIZATIONS = ("bfloat16", "float16", "float32")
+
+# CPU weight quantizations of full precision transformers checkpoints, applied at load time (memory once loaded, and peak memory
+# while loading, relative to the 16-bit checkpoint)
+CPU_WEIGHT_QUANTIZATIONS = {
+    "INT8_DYNAMIC": {"quantize": "int8_dynamic", "memory_ratio": 0.6, "load_memory_ratio": 1.0},  # int8 linear weights, activations quantized on the fly (quantized from the loaded 16-bit checkpoint)
+    "INT4_WEIGHT_ONLY": {"quantize": "int4_weight_only", "memory_ratio": 0.35, "load_memory_ratio": 0.35},  # packed int4 linear weights (group-wise scales, quantized as loaded)
+}
+
 
 def extract_precision_from_descriptor(precision_descriptor: str) -> int:
     """Extract precision from precision descriptor."""
@@ -33,12 +43,15 @@ def generate_sources_from_yaml(yaml_path: str) -> Sources:
 
         quantizations:
           quantization_name:
-            engine: str
+            engine: str  # transformers, mlx-lm, llama.cpp (also served by llama.cpp-server), onnxruntime
             model_id: str
-            model_file: str  # optional
+            model_file: str  # optional (onnxruntime: path of a pre-exported ONNX graph, exported from model_id and cached otherwise)
             model_size: float
             supported_devices: List[str]  # must contain valid device types: cuda, mps, cpu
 
+    Full precision transformers quantizations supporting cpu (bfloat16, float16, float32) also register
+    INT8_DYNAMIC and INT4_WEIGHT_ONLY cpu quantizations, quantized at load time (unless defined in the file).
+
     Raises:
         ValueError: If required sections or fields are missing, or if validation fails
     """
@@ -94,9 +107,14 @@ def generate_sources_from_yaml(yaml_path: str) -> Sources:
         if quant_info.get("model_file"):
             engine_config["model_file"] = quant_info["model_file"]
 
+        # GGUF files can also be served by a managed llama-server process
+        engine_configs = [engine_config]
+        if engine_config["name"] == "llama.cpp":
+            engine_configs.append({**engine_config, "name": "llama.cpp-server", "is_default": False})
+
         # Create quantization config
         quant_config = {
-            "available_engines": [copy.deepcopy(engine_config)],
+            "available_engines": copy.deepcopy(engine_configs),
             "is_default": False,  # Will be set to True later if it matches device's default
             "memory": float(quant_info["model_size"]),
             "precision": int(re.search(r"\d+", quant_name).group() if re.search(r"\d+", quant_name) else "32"),  # Extract first sequence of consecutive digits or default to 32
@@ -106,10 +124,10 @@ def generate_sources_from_yaml(yaml_path: str) -> Sources:
         for device in supported_devices:
             # If quantization already exists for this device, append engine
             if quant_name in sources[device]:
-                # New engine is not default since we already have engines
-                engine_config_copy = copy.deepcopy(engine_config)
-                engine_config_copy["is_default"] = False
-                sources[device][quant_name]["available_engines"].append(engine_config_copy)
+                # New engines are not default since we already have engines
+                for engine_config_copy in copy.deepcopy(engine_configs):
+                    engine_config_copy["is_default"] = False
+                    sources[device][quant_name]["available_engines"].append(engine_config_copy)
             else:
                 # First engine for this quantization
                 sources[device][quant_name] = copy.deepcopy(quant_config)
@@ -117,6 +135,23 @@ def generate_sources_from_yaml(yaml_path: str) -> Sources:
                 if device in default_quantizations and default_quantizations[device] == quant_name:
                     sources[device][quant_name]["is_default"] = True
 
+    # Derive CPU weight quantizations from full precision transformers checkpoints
+    for quant_name, quant_config in list(sources["cpu"].items()):
+        if quant_name not in FULL_PRECISION_QUANTIZATIONS:
+            continue
+        for engine_config in quant_config["available_engines"]:
+            if engine_config["name"] != "transformers":
+                continue
+            for cpu_quant_name, cpu_quant in CPU_WEIGHT_QUANTIZATIONS.items():
+                if cpu_quant_name in sources["cpu"]:
+                    continue
+                sources["cpu"][cpu_quant_name] = {
+                    "available_engines": [{**engine_config, "quantize": cpu_quant["quantize"], "is_default": True}],
+                    "is_default": False,
+                    "memory": round(max(quant_config["memory"] * max(cpu_quant["memory_ratio"], cpu_quant["load_memory_ratio"]) * 16 / quant_config["precision"], 0.1), 1),
+                    "precision": int(re.search(r"\d+", cpu_quant_name).group()),
+                }
+
     # Validate exactly one default quantization per device type
     for device in valid_devices:
         default_count = sum(1 for quant in sources[device].values() if quant["is_default"])
@@ -142,7 +177,7 @@ def generate_standard_contract(name: str, description: str) -> Contract:
                         "name": "engine",
                         "type": "str | List[str]",
                         "schema": {},
-                        "description": "Name of the engine to use (e.g. transformers, mlx-lm, llama.cpp) or list of engines in order of priority",
+                        "description": "Name of the engine to use (e.g. transformers, mlx-lm, llama.cpp, llama.cpp-server, onnxruntime) or list of engines in order of priority",
                         "required": False,
                     },
                     {
@@ -178,6 +213,20 @@ def generate_standard_contract(name: str, description: str) -> Contract:
                                     "description": "Maximum memory allocation as fraction of available memory",
                                     "required": False,
                                 },
+                                {
+                                    "name": "optimize",
+                                    "type": "str",
+                                    "schema": {"pattern": "^(throughput|latency)$"},
+                                    "description": "Use the stored autotuning results of the host (see `autotune`): fastest generation (throughput) or time to first token (latency), within the precision range. Falls back to precision selection if the model was not tuned on the host",
+                                    "required": False,
+                                },
+                                {
+                                    "name": "max_quality_loss",
+                                    "type": "float",
+                                    "schema": {},
+                                    "description": "With optimize, only consider quantizations whose benchmarked perplexity (see `benchmark`) is within this fraction of the best one (e.g. 0.05)",
+                                    "required": False,
+                                },
                             ]
                         },
                         "description": "Quantization method to use (e.g. bfloat16, Q4_K_M, MLX_4) or list of methods in order of priority, or dictionary of quantization settings",
@@ -199,7 +248,7 @@ def generate_standard_contract(name: str, description: str) -> Contract:
                                     "name": "model",
                                     "type": "Dict",
                                     "schema": {},
-                                    "description": "Model-specific configuration parameters",
+                                    "description": "Model-specific configuration parameters (llama.cpp-server: `n_parallel` slots, `server_binary` path, and extra `server_args`)",
                                     "required": False,
                                 },
                                 {
@@ -226,9 +275,250 @@ def generate_standard_contract(name: str, description: str) -> Contract:
                                     "description": "Processor configuration parameters",
                                     "required": False,
                                 },
+                                {
+                                    "name": "history",
+                                    "type": "Dict",
+                                    "schema": {
+                                        "nested": [
+                                            {
+                                                "name": "max_tokens",
+                                                "type": "int",
+                                                "schema": {"pattern": "^[1-9][0-9]*$"},
+                                                "description": "Token budget of the prompt (history and new messages)",
+                                                "required": True,
+                                            },
+                                            {
+                                                "name": "strategy",
+                                                "type": "str",
+                                                "schema": {"pattern": "^(drop|summarize)$"},
+                                                "description": "How to handle the oldest turns outside of the budget (system messages are always kept)",
+                                                "required": False,
+                                            },
+                                            {
+                                                "name": "summary_max_length",
+                                                "type": "int",
+                                                "schema": {"pattern": "^[0-9]+$"},
+                                                "description": "Maximum length of the summary of dropped turns (summarize strategy)",
+                                                "required": False,
+                                            },
+                                        ]
+                                    },
+                                    "description": "History windowing configuration, bounding the prompt to a token budget",
+                                    "required": False,
+                                },
+                                {
+                                    "name": "reasoning",
+                                    "type": "str | Dict",
+                                    "schema": {"pattern": "^(keep|strip|summarize)$"},
+                                    "description": "Reasoning trace policy for reasoning models (keep, strip, or summarize traces before they enter history)",
+                                    "required": False,
+                                },
+                                {
+                                    "name": "sessions",
+                                    "type": "Dict",
+                                    "schema": {
+                                        "nested": [
+                                            {
+                                                "name": "max_cached",
+                                                "type": "int",
+                                                "schema": {"pattern": "^[0-9]+$"},
+                                                "description": "Maximum number of sessions keeping cached KV state (default: 8)",
+                                                "required": False,
+                                            },
+                                            {
+                                                "name": "min_available_memory",
+                                                "type": "float",
+                                                "schema": {"pattern": "^[0-9]+(.[0-9]+)?$"},
+                                                "description": "Fraction of memory below which idle session KV state is evicted (default: 0.1)",
+                                                "required": False,
+                                            },
+                                        ]
+                                    },
+                                    "description": "Session KV state caching configuration",
+                                    "required": False,
+                                },
+                                {
+                                    "name": "compile",
+                                    "type": "bool | Dict",
+                                    "schema": {
+                                        "nested": [
+                                            {
+                                                "name": "buckets",
+                                                "type": "List[int]",
+                                                "schema": {},
+                                                "description": "Max lengths (prompt and generation budget, in tokens) of the static KV caches, generation is eager outside of the largest bucket (default: [1024, 2048, 4096])",
+                                                "required": False,
+                                            },
+                                            {
+                                                "name": "mode",
+                                                "type": "str",
+                                                "schema": {"pattern": "^(default|reduce-overhead|max-autotune|max-autotune-no-cudagraphs)$"},
+                                                "description": "torch.compile mode (default: reduce-overhead on cuda, default otherwise)",
+                                                "required": False,
+                                            },
+                                            {
+                                                "name": "warmup",
+                                                "type": "bool",
+                                                "schema": {},
+                                                "description": "Whether to compile each bucket when the model is loaded (default: True)",
+                                                "required": False,
+                                            },
+                                            {
+                                                "name": "cache_dir",
+                                                "type": "str",
+                                                "schema": {},
+                                                "description": "Directory of the persistent compile cache, reused across restarts (default: $TORCHINDUCTOR_CACHE_DIR, or the universal_intelligence cache)",
+                                                "required": False,
+                                            },
+                                        ]
+                                    },
+                                    "description": "Opt-in compiled generation (transformers): static KV caches and a compiled decode step, falling back to eager generation when compilation fails. Resumable KV state (pinned context) and n > 1 sampling generate eagerly",
+                                    "required": False,
+                                },
+                                {
+                                    "name": "adapters",
+                                    "type": "Dict[str, str | Dict]",
+                                    "schema": {},
+                                    "description": "LoRA adapters served over the shared base model, by name: local path or Hugging Face repository id (transformers: PEFT adapter, llama.cpp: GGUF LoRA file), or dictionary with path or model_id, model_file and scale",
+                                    "required": False,
+                                },
+                                {
+                                    "name": "offload",
+                                    "type": "bool | Dict",
+                                    "schema": {
+                                        "nested": [
+                                            {
+                                                "name": "dir",
+                                                "type": "str",
+                                                "schema": {},
+                                                "description": "Offload directory, preferably on a fast disk (default: the universal_intelligence cache)",
+                                                "required": False,
+                                            },
+                                            {
+                                                "name": "max_memory",
+                                                "type": "float",
+                                                "schema": {},
+                                                "description": "Memory budget of resident weights in cpu memory, in GB (default: the usable share of available memory)",
+                                                "required": False,
+                                            },
+                                            {
+                                                "name": "prefetch",
+                                                "type": "int",
+                                                "schema": {},
+                                                "description": "Number of disk-offloaded layers read ahead while the previous layers compute, 0 to disable (default: 2)",
+                                                "required": False,
+                                            },
+                                        ]
+                                    },
+                                    "description": "Disk offload of the weights beyond the memory budget (transformers: memory-mapped layers read ahead during the forward pass, llama.cpp: memory-mapped GGUF file). Used as a fallback when no quantization fits in memory, unless False",
+                                    "required": False,
+                                },
+                                {
+                                    "name": "recovery",
+                                    "type": "bool | Dict",
+                                    "schema": {
+                                        "nested": [
+                                            {
+                                                "name": "max_downgrades",
+                                                "type": "int",
+                                                "schema": {},
+                                                "description": "Maximum number of quantization downgrades over the model's lifetime (default: 2)",
+                                                "required": False,
+                                            },
+                                        ]
+                                    },
+                                    "description": "Out-of-memory recovery: allocation failures at load or generation time reload the next smaller quantization of the selector's candidates and retry transparently (default: enabled, False to disable)",
+                                    "required": False,
+                                },
+                                {
+                                    "name": "download",
+                                    "type": "bool | Dict",
+                                    "schema": {
+                                        "nested": [
+                                            {
+                                                "name": "workers",
+                                                "type": "int",
+                                                "schema": {},
+                                                "description": "Parallel ranged requests (default: 8)",
+                                                "required": False,
+                                            },
+                                            {
+                                                "name": "chunk_size",
+                                                "type": "int",
+                                                "schema": {},
+                                                "description": "Size of the ranged requests, in MB (default: 16)",
+                                                "required": False,
+                                            },
+                                        ]
+                                    },
+                                    "description": "Download of model files missing from the Hugging Face cache at load time (and by `prefetch()`): parallel ranged requests, resumed and verified, safetensors shards deserialized while the next ones download (default: enabled, False to let the engine download the files)",
+                                    "required": False,
+                                },
+                                {
+                                    "name": "source",
+                                    "type": "str",
+                                    "schema": {},
+                                    "description": "Source of the model files: 'hub' (Hugging Face Hub), 'offline' (local store only, no login check nor network access), an http(s):// mirror of the Hugging Face Hub, or a local directory / file:// URL laid out as <root>/<model_id> (default: $UIN_MODEL_SOURCE, or 'hub'). Downloaded files are stored content-addressed at $UIN_MODEL_STORE (default: the Hugging Face cache)",
+                                    "required": False,
+                                },
+                                {
+                                    "name": "store",
+                                    "type": "Dict",
+                                    "schema": {
+                                        "nested": [
+                                            {
+                                                "name": "quota",
+                                                "type": "float",
+                                                "schema": {},
+                                                "description": "Disk quota of the model files tracked in the local store, in GB: the least recently used files are evicted beyond it, files of loaded models are never evicted (default: $UIN_STORE_QUOTA, or unbounded)",
+                                                "required": False,
+                                            },
+                                        ]
+                                    },
+                                    "description": "Local store management: files loaded or prefetched are tracked in an index with their size and last use (report and prune with `python -m universal_intelligence.community.models.__utils__.mixins.hf_text_to_text.store`)",
+                                    "required": False,
+                                },
+                                {
+                                    "name": "chat_metadata",
+                                    "type": "Dict",
+                                    "schema": {
+                                        "nested": [
+                                            {
+                                                "name": "chat_template",
+                                                "type": "str | bool",
+                                                "schema": {},
+                                                "description": "Jinja chat template replacing the one of the GGUF file, or False to format prompts with the model's built-in template",
+                                                "required": False,
+                                            },
+                                            {
+                                                "name": "stop",
+                                                "type": "List[str] | bool",
+                                                "schema": {},
+                                                "description": "Stop strings replacing the end of generation tokens of the GGUF file, or False to stop on the model's built-in stop strings only",
+                                                "required": False,
+                                            },
+                                            {
+                                                "name": "context_length",
+                                                "type": "int | bool",
+                                                "schema": {},
+                                                "description": "Upper bound of the context length replacing the training context length of the GGUF file, or False to keep the model's n_ctx",
+                                                "required": False,
+                                            },
+                                        ]
+                                    },
+                                    "description": "Overrides of the chat template, stop tokens and context length read from the GGUF header (llama.cpp engines, default: derived from the GGUF file once it is local, the model's built-in values otherwise)",
+                                    "required": False,
+                                },
+                                {
+                                    "name": "profile",
+                                    "type": "str | Dict",
+                                    "schema": {"pattern": "^(cuda|mps|cpu-amx|cpu-avx512-bf16|cpu-avx512|cpu-avx2|cpu-arm-bf16|cpu-arm|cpu-generic)$"},
+                                    "description": "Hardware profile to pin (default: $UIN_PROFILE, or detected from the device and cpu features), or dictionary overriding its name, dtype, engines (preference), quantizations (ranking) and threads (physical, logical or count)",
+                                    "required": False,
+                                },
                             ]
                         },
-                        "description": "Optional configuration dictionary for model, processor, and other settings",
+                        "description": "Optional configuration dictionary for model, processor, history, and other settings",
                         "required": False,
                     },
                     {
@@ -285,9 +575,9 @@ def generate_standard_contract(name: str, description: str) -> Contract:
                     },
                     {
                         "name": "context",
-                        "type": "List[Any]",
+                        "type": "List[Any | PinnedContext] | PinnedContext",
                         "schema": {},
-                        "description": "Optional context items to prepend as system messages",
+                        "description": "Optional context items to prepend as system messages, and/or pinned context handles (see `pin_context`). Context is never remembered in history",
                         "required": False,
                     },
                     {
@@ -337,6 +627,27 @@ def generate_standard_contract(name: str, description: str) -> Contract:
                                     "description": "Penalty for repeating tokens",
                                     "required": False,
                                 },
+                                {
+                                    "name": "adapter",
+                                    "type": "str",
+                                    "schema": {},
+                                    "description": "Name of the registered adapter to generate with (default: the session's adapter, or the base model)",
+                                    "required": False,
+                                },
+                                {
+                                    "name": "n",
+                                    "type": "int",
+                                    "schema": {"pattern": "^[1-9][0-9]*$"},
+                                    "description": "Number of candidates to sample from a single prompt (returns a list of candidates when greater than 1)",
+                                    "required": False,
+                                },
+                                {
+                                    "name": "reasoning",
+                                    "type": "str | Dict",
+                                    "schema": {"pattern": "^(keep|strip|summarize)$"},
+                                    "description": "Reasoning trace policy for reasoning models (keep, strip, or summarize traces before they enter history), or dictionary with policy, start_tag, end_tag and summary_max_length",
+                                    "required": False,
+                                },
                             ]
                         },
                         "description": "Optional generation configuration parameters",
@@ -364,9 +675,9 @@ def generate_standard_contract(name: str, description: str) -> Contract:
                             "nested": [
                                 {
                                     "name": "response",
-                                    "type": "str",
+                                    "type": "str | List[str]",
                                     "schema": {},
-                                    "description": "Generated text response",
+                                    "description": "Generated text response (or list of candidate responses when n is greater than 1)",
                                     "required": True,
                                 },
                                 {
@@ -386,6 +697,48 @@ def generate_standard_contract(name: str, description: str) -> Contract:
                                                 "type": "str",
                                                 "schema": {"pattern": "^(Q4_K_M|Q8_0|bfloat16)$"},
                                             },
+                                            {
+                                                "name": "profile",
+                                                "type": "str",
+                                                "schema": {},
+                                                "description": "Hardware profile the model was initialized with",
+                                                "required": True,
+                                            },
+                                            {
+                                                "name": "adapter",
+                                                "type": "str | None",
+                                                "schema": {},
+                                                "description": "Adapter used for generation (models with adapters)",
+                                                "required": False,
+                                            },
+                                            {
+                                                "name": "offload",
+                                                "type": "Dict",
+                                                "schema": {},
+                                                "description": "Memory accounting of offloaded models: budget, resident and offloaded weights (GB), and offload directory",
+                                                "required": False,
+                                            },
+                                            {
+                                                "name": "downgrades",
+                                                "type": "List[Dict]",
+                                                "schema": {},
+                                                "description": "Quantization downgrades recovering from allocation failures during this call: stage, from and to (engine, quantization), and error",
+                                                "required": False,
+                                            },
+                                            {
+                                                "name": "logprobs",
+                                                "type": "List[float | None]",
+                                                "schema": {},
+                                                "description": "Log-probability of each candidate response (when n is greater than 1)",
+                                                "required": False,
+                                            },
+                                            {
+                                                "name": "reasoning",
+                                                "type": "str | List[str]",
+                                                "schema": {},
+                                                "description": "Reasoning traces separated from the response (reasoning models)",
+                                                "required": False,
+                                            },
                                         ]
                                     },
                                     "description": "Processing logs and metadata",
@@ -398,6 +751,229 @@ def generate_standard_contract(name: str, description: str) -> Contract:
                     }
                 ],
             },
+            {
+                "name": "pin_context",
+                "description": "Render and prefill context items once into resident KV state (the model is loaded if needed), and get a handle to reference them in later `process` calls. Pinned context goes first in the prompt so that its KV state is reused as a prefix",
+                "arguments": [
+                    {
+                        "name": "items",
+                        "type": "List[Any]",
+                        "schema": {},
+                        "description": "Context items to pin as system messages",
+                        "required": True,
+                    }
+                ],
+                "outputs": [
+                    {
+                        "type": "PinnedContext",
+                        "schema": {},
+                        "description": "Pinned context handle (evict)",
+                        "required": True,
+                    }
+                ],
+            },
+            {
+                "name": "session",
+                "description": "Open a conversation session over the model, with its own history and cached KV state. Sessions share the loaded model and can be processed concurrently (`session.process(...)` remembers interactions and keeps the model loaded by default)",
+                "arguments": [
+                    {
+                        "name": "adapter",
+                        "type": "str",
+                        "schema": {},
+                        "description": "Name of the registered adapter to process the session with (default: base model)",
+                        "required": False,
+                    }
+                ],
+                "outputs": [
+                    {
+                        "type": "Session",
+                        "schema": {},
+                        "description": "Session handle (process, reset, evict)",
+                        "required": True,
+                    }
+                ],
+            },
+            {
+                "name": "add_adapter",
+                "description": "Register a LoRA adapter over the shared base model, selectable per call or per session. Adapter weights are loaded once next to the base weights, switching is cheap",
+                "arguments": [
+                    {
+                        "name": "name",
+                        "type": "str",
+                        "schema": {},
+                        "description": "Name of the adapter",
+                        "required": True,
+                    },
+                    {
+                        "name": "adapter",
+                        "type": "str | Dict",
+                        "schema": {},
+                        "description": "Local path or Hugging Face repository id of the adapter (transformers: PEFT adapter, llama.cpp: GGUF LoRA file), or dictionary with path or model_id, model_file and scale",
+                        "required": True,
+                    },
+                ],
+                "outputs": [
+                    {
+                        "type": "None",
+                        "schema": {},
+                        "description": "No return value",
+                        "required": True,
+                    }
+                ],
+            },
+            {
+                "name": "swap",
+                "description": "Switch the engine and/or quantization without downtime: the new variant is loaded next to the serving one (within the memory budget), in-flight requests are drained and the model switches over atomically. The previous variant keeps serving if the new one fails to load",
+                "arguments": [
+                    {
+                        "name": "engine",
+                        "type": "str",
+                        "schema": {},
+                        "description": "Engine to switch to (default: the current engine if it serves the quantization, or the preferred engine)",
+                        "required": False,
+                    },
+                    {
+                        "name": "quantization",
+                        "type": "str",
+                        "schema": {},
+                        "description": "Quantization to switch to (default: the current quantization)",
+                        "required": False,
+                    },
+                ],
+                "outputs": [
+                    {
+                        "type": "None",
+                        "schema": {},
+                        "description": "No return value",
+                        "required": True,
+                    }
+                ],
+            },
+            {
+                "name": "autotune",
+                "description": "Benchmark quantizations and runtime parameters (n_threads, and n_batch, n_ubatch for llama.cpp) on a short synthetic workload, each combination loaded next to the serving model. Results are stored per host fingerprint and model, for `quantization={'optimize': ...}`",
+                "arguments": [
+                    {
+                        "name": "quantizations",
+                        "type": "List[str]",
+                        "schema": {},
+                        "description": "Quantizations to benchmark (default: the current quantization, the hardware profile's ranking and the default quantization)",
+                        "required": False,
+                    },
+                    {
+                        "name": "prompt_tokens",
+                        "type": "int",
+                        "schema": {},
+                        "description": "Approximate prompt length of the synthetic workload (default: 256)",
+                        "required": False,
+                    },
+                    {
+                        "name": "max_new_tokens",
+                        "type": "int",
+                        "schema": {},
+                        "description": "Number of tokens to generate per request (default: 32)",
+                        "required": False,
+                    },
+                    {
+                        "name": "save",
+                        "type": "bool",
+                        "schema": {},
+                        "description": "Whether to store the results (default: True)",
+                        "required": False,
+                    },
+                ],
+                "outputs": [
+                    {
+                        "type": "List[Dict]",
+                        "schema": {},
+                        "description": "Benchmark results by decreasing throughput: quantization, engine, n_threads, parameters, memory, time_to_first_token, decode_tokens_per_second and tokens_per_second",
+                        "required": True,
+                    }
+                ],
+            },
+            {
+                "name": "benchmark",
+                "description": "Benchmark quality versus speed across quantizations: perplexity on a text corpus, generation speed, load time and peak resident memory, each quantization loaded next to the serving model. Results are stored for `quantization={'optimize': ..., 'max_quality_loss': ...}` (command line: `python -m universal_intelligence.community.models.__utils__.mixins.hf_text_to_text.benchmark <model>`, writing a Pareto table in JSON and Markdown)",
+                "arguments": [
+                    {
+                        "name": "quantizations",
+                        "type": "List[str]",
+                        "schema": {},
+                        "description": "Quantizations to benchmark (default: every quantization fitting in memory)",
+                        "required": False,
+                    },
+                    {
+                        "name": "corpus",
+                        "type": "str",
+                        "schema": {},
+                        "description": "Text to measure perplexity on (default: bundled corpus)",
+                        "required": False,
+                    },
+                    {
+                        "name": "context_length",
+                        "type": "int",
+                        "schema": {},
+                        "description": "Perplexity window, in tokens (default: 512)",
+                        "required": False,
+                    },
+                    {
+                        "name": "max_new_tokens",
+                        "type": "int",
+                        "schema": {},
+                        "description": "Number of tokens to generate per speed measurement (default: 32)",
+                        "required": False,
+                    },
+                    {
+                        "name": "save",
+                        "type": "bool",
+                        "schema": {},
+                        "description": "Whether to store the results (default: True)",
+                        "required": False,
+                    },
+                ],
+                "outputs": [
+                    {
+                        "type": "List[Dict]",
+                        "schema": {},
+                        "description": "Benchmark results by decreasing precision: quantization, engine, precision, perplexity, tokens_per_second, decode_tokens_per_second, time_to_first_token, load_time, peak_rss and pareto (Pareto-optimal)",
+                        "required": True,
+                    }
+                ],
+            },
+            {
+                "name": "prefetch",
+                "description": "Download the files of quantizations ahead of loading, with parallel ranged requests into the Hugging Face cache, resuming partial downloads and verifying file hashes (command line: `python -m universal_intelligence.community.models.__utils__.mixins.hf_text_to_text.prefetch <model> [<model> ...]`)",
+                "arguments": [
+                    {
+                        "name": "quantizations",
+                        "type": "List[str]",
+                        "schema": {},
+                        "description": "Quantizations to prefetch (default: every quantization runnable on this host, and the selected quantization)",
+                        "required": False,
+                    },
+                ],
+                "outputs": [
+                    {
+                        "type": "List[Dict]",
+                        "schema": {},
+                        "description": "Prefetched files per quantization: quantization, engine, model_id, files (local paths), size (GB) and time (seconds)",
+                        "required": True,
+                    }
+                ],
+            },
+            {
+                "name": "metrics",
+                "description": "Get runtime metrics of the model",
+                "arguments": [],
+                "outputs": [
+                    {
+                        "type": "Dict",
+                        "schema": {},
+                        "description": "Engine and quantization in use, memory estimate (weights, KV cache, compute buffers, in GB) from the file headers when available, number of quantization downgrades after allocation failures and their history",
+                        "required": True,
+                    }
+                ],
+            },
             {
                 "name": "load",
                 "description": "Load model into memory based on engine type",
@@ -533,6 +1109,8 @@ def generate_standard_compatibility(sources: Sources) -> list[Compatibility]:
                         compatibility["dependencies"].extend(["autoawq", "optimum"])
                     elif quantization.startswith("BNB"):
                         compatibility["dependencies"].extend(["bitsandbytes"])
+                    elif engine_config.get("quantize") == "int4_weight_only":
+                        compatibility["dependencies"].extend(["optimum-quanto"])
                 elif engine == "mlx-lm":
                     compatibility["dependencies"] = [
                         "torch",
@@ -549,6 +1127,23 @@ def generate_standard_compatibility(sources: Sources) -> list[Compatibility]:
                         "huggingface_hub",
                         "protobuf",
                     ]
+                elif engine == "llama.cpp-server":
+                    compatibility["dependencies"] = [
+                        "torch",
+                        "huggingface_hub",
+                        "requests",
+                        "protobuf",
+                    ]
+                elif engine == "onnxruntime":
+                    compatibility["dependencies"] = [
+                        "torch",
+                        "transformers",
+                        "huggingface_hub",
+                        "optimum",
+                        "onnx",
+                        "onnxruntime",
+                        "protobuf",
+                    ]
 
                 compatibilities.append(compatibility)
 
@@ -0,0 +1,138 @@
+"""
+Disk offload for models larger than memory.
+
+transformers: layers beyond the memory budget are mapped to disk, their weights are memory-mapped from the
+checkpoint's safetensors files (or from the offload directory, when they had to be converted) and read ahead
+by the kernel while the previous layers compute. llama.cpp: GGUF files are memory-mapped without locking,
+weights are paged in on demand.
+"""
+
+import json
+import os
+import struct
+import threading
+
+import torch
+
+from ......community.__utils__.cache import get_cache_dir
+
+# Engines able to run with offloaded weights
+OFFLOAD_ENGINES = ("transformers", "llama.cpp", "llama.cpp-server")
+
+# Default offload settings, `dir` defaults to the universal_intelligence cache and `max_memory` (GB of resident
+# weights) to the usable memory of the device
+OFFLOAD_DEFAULTS = {"dir": None, "max_memory": None, "prefetch": 2}
+
+
+def safetensors_offsets(path: str) -> dict[str, tuple[int, int]]:
+    """Read the byte ranges (offset, length) of the tensors of a safetensors file from its header."""
+    with open(path, "rb") as f:
+        (header_size,) = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(header_size))
+    return {name: (8 + header_size + info["data_offsets"][0], info["data_offsets"][1] - info["data_offsets"][0]) for name, info in header.items() if name != "__metadata__"}
+
+
+def weights_size(model: torch.nn.Module) -> tuple[float, float]:
+    """Get the size of the resident and offloaded (meta device) weights of a model, in GB."""
+    resident, offloaded = 0, 0
+    for param in model.parameters():
+        size = param.numel() * param.element_size()
+        if param.device.type == "meta":
+            offloaded += size
+        else:
+            resident += size
+    return resident / (1024**3), offloaded / (1024**3)
+
+
+class LayerPrefetcher:
+    """Read ahead the disk-offloaded weights of the next layers, as each layer starts computing."""
+
+    def __init__(self, model: torch.nn.Module, prefetch: int = 2) -> None:
+        """Install prefetch hooks on the disk-offloaded modules of a model loaded with accelerate's device map.
+
+        Args:
+            model: Model with an `hf_device_map`, some modules of which are mapped to disk
+            prefetch: Number of disk-offloaded modules to read ahead
+        """
+        self.prefetch = prefetch
+        self._files: dict[str, int] = {}
+        self._offsets: dict[str, dict[str, tuple[int, int]]] = {}
+        self._hooks = []
+
+        # Byte ranges of each disk-offloaded module, in execution order
+        disk_modules = [name for name, device in getattr(model, "hf_device_map", {}).items() if device == "disk"]
+        self.ranges: list[list[tuple[str, int, int]]] = [self._module_ranges(model.get_submodule(name) if name else model) for name in disk_modules]
+
+        if self.ranges:
+            self._hooks.append(model.register_forward_pre_hook(lambda *_: self._advise(0)))
+            for i, name in enumerate(disk_modules):
+                self._hooks.append(model.get_submodule(name).register_forward_pre_hook(lambda *_, i=i: self._advise(i + 1)))
+
+    def _module_ranges(self, module: torch.nn.Module) -> list[tuple[str, int, int]]:
+        """Get the file byte ranges (path, offset, length) of the offloaded weights of a module."""
+        ranges = []
+        for submodule in module.modules():
+            weights_map = getattr(getattr(submodule, "_hf_hook", None), "weights_map", None)
+            loader = getattr(weights_map, "dataset", None)
+            if loader is None or not hasattr(loader, "index"):
+                continue
+            for name, _ in submodule.named_parameters(recurse=False):
+                info = loader.index.get(f"{weights_map.prefix}{name}")
+                if info is None:
+                    continue
+                if info.get("safetensors_file"):
+                    path = info["safetensors_file"]
+                    if path not in self._offsets:
+                        self._offsets[path] = safetensors_offsets(path)
+                    offset, length = self._offsets[path][info.get("weight_name", f"{weights_map.prefix}{name}")]
+                    ranges.append((path, offset, length))
+                else:  # converted weights, memory-mapped from the offload directory
+                    ranges.append((os.path.join(loader.save_folder, f"{weights_map.prefix}{name}.dat"), 0, 0))
+        return ranges
+
+    def _advise(self, start: int) -> None:
+        """Read ahead the weights of the disk-offloaded modules following `start`."""
+        ranges = [byte_range for module_ranges in self.ranges[start : start + self.prefetch] for byte_range in module_ranges]
+        if not ranges:
+            return
+        if hasattr(os, "posix_fadvise"):
+            # Asynchronous readahead into the page cache, mapped pages are then read without blocking on disk
+            for path, offset, length in ranges:
+                os.posix_fadvise(self._file(path), offset, length, os.POSIX_FADV_WILLNEED)
+        else:
+            threading.Thread(target=self._read, args=(ranges,), daemon=True).start()
+
+    def _read(self, ranges: list[tuple[str, int, int]]) -> None:
+        """Read byte ranges to populate the page cache (platforms without posix_fadvise)."""
+        for path, offset, length in ranges:
+            with open(path, "rb") as f:
+                f.seek(offset)
+                remaining = length or os.fstat(f.fileno()).st_size
+                while remaining > 0:
+                    chunk = f.read(min(remaining, 1 << 24))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+
+    def _file(self, path: str) -> int:
+        """Get a (cached) read-only file descriptor."""
+        if path not in self._files:
+            self._files[path] = os.open(path, os.O_RDONLY)
+        return self._files[path]
+
+    def remove(self) -> None:
+        """Remove the prefetch hooks and close the files."""
+        for hook in self._hooks:
+            hook.remove()
+        for fd in self._files.values():
+            os.close(fd)
+        self._hooks, self._files = [], {}
+
+
+def offload_dir(settings: dict, *parts: str) -> str:
+    """Get (and create) the offload directory of a model (configured fast disk directory, or the universal_intelligence cache)."""
+    if settings.get("dir"):
+        path = os.path.join(os.path.expanduser(settings["dir"]), *parts)
+        os.makedirs(path, exist_ok=True)
+        return path
+    return get_cache_dir("offload", *parts)
@@ -0,0 +1,277 @@
+"""
+Parallel chunked prefetch of model files into the Hugging Face cache.
+
+Files are split in chunks downloaded with parallel ranged requests. Partial downloads are resumed from the chunks
+recorded next to the partial file, and completed files are verified against the hashes of the repository (sha256 of
+LFS files, git blob hash of the others) before being linked into the cache, where `hf_hub_download` and
+`from_pretrained` find them. Small files (configuration, tokenizer) are downloaded first and checkpoint shards in
+order, so that shards can be deserialized while the next ones download (see `load_shards()`).
+
+The endpoint is the Hugging Face Hub (or `HF_ENDPOINT`), or any server exposing the same file and model info routes.
+
+To prefetch the quantizations of local models runnable on this host from the project root run:
+   python -m universal_intelligence.community.models.__utils__.mixins.hf_text_to_text.prefetch qwen2_5_7b_instruct smollm2_360m_instruct --quantizations Q4_K_M
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import importlib
+import json
+import os
+import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import torch
+from huggingface_hub import HfApi, constants, hf_hub_url
+from huggingface_hub.file_download import repo_folder_name
+from huggingface_hub.utils import build_hf_headers, hf_raise_for_status, http_backoff
+from safetensors.torch import load_file
+
+from .types import EngineConfig, RemoteFile
+
+# Default settings of the downloader (chunk size in MB)
+DOWNLOAD_DEFAULTS = {"workers": 8, "chunk_size": 16}
+
+# Files of a checkpoint loaded by transformers (and mlx-lm, ONNX export), at the root of the repository
+CHECKPOINT_PATTERNS = ("*.json", "*.safetensors", "*.model", "*.tiktoken", "*.txt", "*.py", "*.jinja")
+
+# Weight files, downloaded after the small files
+WEIGHT_EXTENSIONS = (".safetensors", ".bin", ".gguf", ".onnx", ".onnx_data")
+
+# Attempts per chunk before the download fails (resumable)
+CHUNK_ATTEMPTS = 3
+
+
+def engine_files(engine_config: EngineConfig, filenames: list[str]) -> list[str]:
+    """Get the files of a repository loaded by an engine (GGUF file, ONNX graph with its external data, or checkpoint), small files first."""
+    model_file = engine_config.get("model_file")
+    if model_file and engine_config["name"] in ("llama.cpp", "llama.cpp-server"):
+        return [model_file]
+
+    root = [name for name in filenames if "/" not in name]
+    patterns = CHECKPOINT_PATTERNS if any(name.endswith(".safetensors") for name in root) else (*CHECKPOINT_PATTERNS, "*.bin")
+    if model_file:  # pre-exported ONNX graph, configuration and tokenizer at the root and next to the graph
+        patterns = (*(pattern for pattern in CHECKPOINT_PATTERNS if pattern != "*.safetensors"), f"{model_file}*", f"{os.path.dirname(model_file)}/*.json")
+        root = filenames
+    files = {name for name in root if any(fnmatch.fnmatch(name, pattern) for pattern in patterns)}
+    return sorted(files, key=lambda name: (name.endswith(WEIGHT_EXTENSIONS), name))
+
+
+def list_files(repo_id: str, engine_config: EngineConfig, revision: str = "main", endpoint: str | None = None, token: str | None = None) -> list[RemoteFile]:
+    """List the files of a repository loaded by an engine, with their sizes and hashes."""
+    info = HfApi(endpoint=endpoint, token=token).model_info(repo_id, revision=revision, files_metadata=True)
+    siblings = {sibling.rfilename: sibling for sibling in info.siblings}
+    return [
+        {
+            "repo_id": repo_id,
+            "filename": name,
+            "revision": revision,
+            "commit": info.sha,
+            "size": siblings[name].size or 0,
+            "sha256": siblings[name].lfs.sha256 if siblings[name].lfs else None,
+            "blob_id": siblings[name].blob_id,
+        }
+        for name in engine_files(engine_config, list(siblings))
+    ]
+
+
+def file_hash(path: str, file: RemoteFile) -> str:
+    """Hash a downloaded file as the repository does: sha256 for LFS files, git blob hash for the others."""
+    digest = hashlib.sha256() if file["sha256"] else hashlib.sha1()  # git blob hash
+    if not file["sha256"]:
+        digest.update(f"blob {os.path.getsize(path)}\0".encode())
+    with open(path, "rb") as f:
+        while block := f.read(8 * 1024**2):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ChunkedDownloader:
+    """Download files into the Hugging Face cache with parallel ranged requests, resuming partial files and verifying hashes."""
+
+    def __init__(self, workers: int = 8, chunk_size: int = 16, endpoint: str | None = None, token: str | None = None, cache_dir: str | None = None) -> None:
+        """
+        Args:
+            workers: Parallel ranged requests (shared by all files)
+            chunk_size: Size of the ranged requests, in MB
+            endpoint: Hugging Face Hub endpoint (default: `HF_ENDPOINT`)
+            token: Hugging Face token (default: logged in token)
+            cache_dir: Hugging Face cache (default: `HF_HUB_CACHE`)
+        """
+        self.chunk_size = chunk_size * 1024**2
+        self.endpoint = endpoint or constants.ENDPOINT
+        self.token = token
+        self.cache_dir = cache_dir or constants.HF_HUB_CACHE
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prefetch")
+        self._downloads: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def list_files(self, repo_id: str, engine_config: EngineConfig, revision: str = "main") -> list[RemoteFile]:
+        return list_files(repo_id, engine_config, revision=revision, endpoint=self.endpoint, token=self.token)
+
+    def prefetch(self, files: list[RemoteFile]) -> dict[str, Future]:
+        """Start downloading files, in order (chunks are queued file by file).
+
+        Returns:
+            Futures of the local paths of the files, by filename
+        """
+        return {file["filename"]: self._start(file) for file in files}
+
+    def download(self, files: list[RemoteFile]) -> list[str]:
+        """Download files, and get their local paths."""
+        return [download.result() for download in self.prefetch(files).values()]
+
+    def close(self, wait: bool = True) -> None:
+        """Stop accepting files, queued chunks are still downloaded."""
+        self._executor.shutdown(wait=wait)
+
+    def _paths(self, file: RemoteFile) -> tuple[str, str, str]:
+        """Get the blob, snapshot and storage paths of a file in the Hugging Face cache."""
+        storage = os.path.join(self.cache_dir, repo_folder_name(repo_id=file["repo_id"], repo_type="model"))
+        blob = os.path.join(storage, "blobs", file["sha256"] or file["blob_id"])
+        return blob, os.path.join(storage, "snapshots", file["commit"], file["filename"]), storage
+
+    def _start(self, file: RemoteFile) -> Future:
+        blob, pointer, _ = self._paths(file)
+        with self._lock:
+            # Files shared by several variants (e.g. checkpoints quantized at load time) are downloaded once
+            existing = self._downloads.get(blob)
+            if existing and not (existing.done() and existing.exception()):
+                return existing
+            download = self._downloads[blob] = Future()
+
+        if os.path.exists(blob):
+            self._link(file)
+            download.set_result(pointer)
+            return download
+
+        # Resume the chunks of a partial download recorded as complete
+        partial, record = f"{blob}.chunked", f"{blob}.chunked.json"
+        done: set[int] = set()
+        if os.path.exists(partial) and os.path.exists(record):
+            with open(record) as f:
+                done = set(json.load(f))
+        else:
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            with open(partial, "wb") as f:
+                f.truncate(file["size"])
+        chunks = [(index, start, min(start + self.chunk_size, file["size"]) - 1) for index, start in enumerate(range(0, file["size"], self.chunk_size)) if index not in done]
+        if not chunks:
+            self._executor.submit(self._complete, file, download)
+            return download
+
+        url = hf_hub_url(file["repo_id"], file["filename"], revision=file["commit"], endpoint=self.endpoint)
+        remaining = [len(chunks)]
+        lock = threading.Lock()
+        futures: list[Future] = []
+
+        def on_chunk(index: int, chunk: Future) -> None:
+            with lock:
+                if download.done() or chunk.cancelled():
+                    return
+                if chunk.exception():
+                    download.set_exception(chunk.exception())
+                else:
+                    done.add(index)
+                    tmp_record = f"{record}.tmp"
+                    with open(tmp_record, "w") as f:
+                        json.dump(sorted(done), f)
+                    os.replace(tmp_record, record)
+                    remaining[0] -= 1
+                    if remaining[0]:
+                        return
+            if download.done():  # failed, the chunks downloaded so far are kept for resuming
+                for other in futures:
+                    other.cancel()
+                return
+            self._complete(file, download)
+
+        for index, start, end in chunks:
+            future = self._executor.submit(self._fetch, url, partial, start, end, file["size"])
+            futures.append(future)
+            future.add_done_callback(lambda chunk, index=index: on_chunk(index, chunk))
+        return download
+
+    def _fetch(self, url: str, partial: str, start: int, end: int, size: int) -> None:
+        """Download a byte range of a file into the partial file."""
+        for attempt in range(CHUNK_ATTEMPTS):
+            try:
+                response = http_backoff("GET", url, headers={**build_hf_headers(token=self.token), "Range": f"bytes={start}-{end}"}, stream=True, timeout=constants.HF_HUB_DOWNLOAD_TIMEOUT)
+                hf_raise_for_status(response)
+                if response.status_code != 206 and (start, end) != (0, size - 1):
+                    raise ValueError(f"[UniversalModelMixin:prefetch] Ranged requests are not supported by the server: {url}")
+                written = 0
+                with open(partial, "r+b") as f:
+                    f.seek(start)
+                    for block in response.iter_content(1024**2):
+                        f.write(block)
+                        written += len(block)
+                if written != end - start + 1:
+                    raise OSError(f"Incomplete chunk ({written}/{end - start + 1} bytes): {url}")
+                return
+            except OSError:
+                if attempt == CHUNK_ATTEMPTS - 1:
+                    raise
+
+    def _complete(self, file: RemoteFile, download: Future) -> None:
+        """Verify a downloaded file, then move it into the cache."""
+        blob, pointer, _ = self._paths(file)
+        partial, record = f"{blob}.chunked", f"{blob}.chunked.json"
+        try:
+            expected = file["sha256"] or file["blob_id"]
+            if file_hash(partial, file) != expected:
+                os.remove(partial)
+                if os.path.exists(record):
+                    os.remove(record)
+                raise ValueError(f"[UniversalModelMixin:prefetch] Hash mismatch of {file['repo_id']}/{file['filename']} (expected {expected}), the partial download was discarded")
+            os.replace(partial, blob)
+            if os.path.exists(record):
+                os.remove(record)
+            self._link(file)
+            download.set_result(pointer)
+        except Exception as e:
+            download.set_exception(e)
+
+    def _link(self, file: RemoteFile) -> None:
+        """Link a blob into the snapshot of its commit, and point the revision to the commit."""
+        blob, pointer, storage = self._paths(file)
+        os.makedirs(os.path.dirname(pointer), exist_ok=True)
+        if not os.path.exists(pointer):
+            try:
+                os.symlink(os.path.relpath(blob, os.path.dirname(pointer)), pointer)
+            except OSError:  # no symlink support
+                shutil.copyfile(blob, pointer)
+        if file["revision"] != file["commit"]:
+            os.makedirs(os.path.join(storage, "refs"), exist_ok=True)
+            with open(os.path.join(storage, "refs", file["revision"]), "w") as f:
+                f.write(file["commit"])
+
+
+def load_shards(downloads: list[Future]) -> dict[str, torch.Tensor]:
+    """Deserialize safetensors shards in download order, each one while the next ones are downloading."""
+    state_dict = {}
+    for download in downloads:
+        state_dict.update(load_file(download.result()))
+    return state_dict
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Prefetch the files of local models with parallel ranged requests, resumed and verified")
+    parser.add_argument("models", nargs="+", help="Local model modules (e.g. qwen2_5_7b_instruct) or dotted paths to modules exposing UniversalModel")
+    parser.add_argument("--quantizations", nargs="+", help="Quantizations to prefetch (default: every quantization runnable on this host)")
+    parser.add_argument("--workers", type=int, default=DOWNLOAD_DEFAULTS["workers"], help="Parallel ranged requests")
+    parser.add_argument("--chunk-size", type=int, default=DOWNLOAD_DEFAULTS["chunk_size"], help="Size of the ranged requests, in MB")
+    args = parser.parse_args(argv)
+
+    for name in args.models:
+        module_path = name if "." in name else f"universal_intelligence.community.models.local.{name}.model"
+        model = importlib.import_module(module_path).UniversalModel(verbose=False, configuration={"download": {"workers": args.workers, "chunk_size": args.chunk_size}})
+        quantizations = [quantization for quantization in args.quantizations if quantization in model._device_sources] if args.quantizations else None
+        for result in model.prefetch(quantizations):
+            print(f"{model._name} {result['quantization']} ({result['engine']}): {len(result['files'])} files, {result['size']:.2f}GB in {result['time']:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Test script for the chunked downloader (see `prefetch.py`), end to end against a local stub Hugging Face server.
+
+To run this script from the project root run:
+   python -m universal_intelligence.community.models.__utils__.mixins.hf_text_to_text.prefetch_test
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ...test import check
+from .prefetch import ChunkedDownloader
+
+REPO_ID = "stub/model"
+COMMIT = "0123456789abcdef0123456789abcdef01234567"
+ENGINE_CONFIG = {"name": "transformers", "model_id": REPO_ID}
+
+
+class StubServer(ThreadingHTTPServer):
+    """Stub Hugging Face server, serving the model info and ranged file routes of one repository, with injected failures."""
+
+    daemon_threads = True
+
+    def __init__(self, files: dict[str, bytes]) -> None:
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.files = files
+        self.ranges: list[str] = []  # served ranges
+        self.errors = 0  # next file requests answered with a 500 error (retried by the downloader)
+        self.fail_after: int | None = None  # served ranges before file requests are refused with a 403 error (not retried)
+        self.corrupt = False  # serve altered files
+        self.lock = threading.Lock()
+
+    @property
+    def endpoint(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def _send(self, status: int, body: bytes = b"", headers: dict | None = None) -> None:
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if re.match(rf"/api/models/{REPO_ID}/revision/", self.path):
+            siblings = []
+            for name, data in self.server.files.items():
+                sibling = {"rfilename": name, "size": len(data), "blobId": hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()}
+                if name.endswith(".safetensors"):
+                    sibling["lfs"] = {"sha256": hashlib.sha256(data).hexdigest(), "size": len(data), "pointerSize": 134}
+                siblings.append(sibling)
+            self._send(200, json.dumps({"id": REPO_ID, "sha": COMMIT, "siblings": siblings}).encode(), {"Content-Type": "application/json"})
+            return
+
+        match = re.match(rf"/{REPO_ID}/resolve/{COMMIT}/(.+)", self.path)
+        if not match or match.group(1) not in self.server.files:
+            self._send(404)
+            return
+        with self.server.lock:
+            if self.server.errors:
+                self.server.errors -= 1
+                self._send(500)
+                return
+            if self.server.fail_after is not None and len(self.server.ranges) >= self.server.fail_after:
+                self._send(403)
+                return
+            self.server.ranges.append(self.headers["Range"])
+
+        data = self.server.files[match.group(1)]
+        if self.server.corrupt:
+            data = data[:-1] + bytes([data[-1] ^ 1])
+        start, end = (int(bound) for bound in self.headers["Range"].split("=")[1].split("-"))
+        end = min(end, len(data) - 1)
+        self._send(206, data[start : end + 1], {"Content-Range": f"bytes {start}-{end}/{len(data)}", "Accept-Ranges": "bytes"})
+
+
+def run_downloader_tests(server: StubServer, cache_dir: str) -> None:
+    """Test ranged downloads with retried errors, resuming after an interruption, and hash verification."""
+    print("\033[94m" + "\n\n================================================\n## Testing chunked downloader against stub server \n================================================\n" + "\033[0m")
+
+    # Ranged downloads, retrying server errors, are complete and linked into the cache snapshot
+    downloader = ChunkedDownloader(workers=4, chunk_size=1, endpoint=server.endpoint, cache_dir=os.path.join(cache_dir, "download"))
+    files = downloader.list_files(REPO_ID, ENGINE_CONFIG)
+    check("small files first", [file["filename"] for file in files] == ["config.json", "model.safetensors"], files)
+    server.errors = 2
+    paths = downloader.download(files)
+    check("files downloaded", all(open(path, "rb").read() == server.files[os.path.basename(path)] for path in paths), paths)
+    check("snapshot linked", all(os.path.dirname(path).endswith(os.path.join("snapshots", COMMIT)) for path in paths), paths)
+    check("ranged requests", len(server.ranges) == 1 + 4, server.ranges)  # 3.5MB in 1MB chunks
+    downloader.close()
+
+    # Interrupted downloads keep their completed chunks, and resume with the missing ones
+    server.ranges.clear()
+    server.fail_after = 2
+    downloader = ChunkedDownloader(workers=1, chunk_size=1, endpoint=server.endpoint, cache_dir=os.path.join(cache_dir, "resume"))
+    weights = [file for file in downloader.list_files(REPO_ID, ENGINE_CONFIG) if file["filename"] == "model.safetensors"]
+    try:
+        downloader.download(weights)
+        check("interruption raises", False)
+    except Exception as e:
+        check("interruption raises", "403" in str(e), e)
+    downloader.close()
+    server.ranges.clear()
+    server.fail_after = None
+    downloader = ChunkedDownloader(workers=4, chunk_size=1, endpoint=server.endpoint, cache_dir=os.path.join(cache_dir, "resume"))
+    path = downloader.download(weights)[0]
+    check("resumed download", open(path, "rb").read() == server.files["model.safetensors"])
+    check("only missing chunks requested", sorted(server.ranges) == ["bytes=2097152-3145727", "bytes=3145728-3670015"], server.ranges)
+    downloader.close()
+
+    # Files not matching the hashes of the repository are rejected, and discarded
+    server.corrupt = True
+    downloader = ChunkedDownloader(workers=4, chunk_size=1, endpoint=server.endpoint, cache_dir=os.path.join(cache_dir, "corrupt"))
+    try:
+        downloader.download(weights)
+        check("hash mismatch raises", False)
+    except ValueError as e:
+        check("hash mismatch raises", "Hash mismatch" in str(e), e)
+    blobs = os.path.join(cache_dir, "corrupt", "models--stub--model", "blobs")
+    check("corrupt download discarded", not os.listdir(blobs), os.listdir(blobs))
+    downloader.close()
+    server.corrupt = False
+
+
+if __name__ == "__main__":
+    server = StubServer({"config.json": b'{"model_type": "stub"}', "model.safetensors": os.urandom(3 * 1024**2 + 512 * 1024)})
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    cache_dir = tempfile.mkdtemp()
+    try:
+        run_downloader_tests(server, cache_dir)
+    finally:
+        server.shutdown()
+        shutil.rmtree(cache_dir, ignore_errors=True)
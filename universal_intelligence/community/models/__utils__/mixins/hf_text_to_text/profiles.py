@@ -0,0 +1,188 @@
+"""
+Hardware performance profiles for the HF text-to-text mixin.
+
+CPU features (AVX2, AVX-512, AMX, bf16, ...) are detected once per process and matched against the
+profiles below, in order. The selected profile sets the compute dtype of full precision checkpoints,
+the engine preference, the quantization ranking of automatic selection and the number of threads.
+"""
+
+import functools
+import os
+import platform
+import subprocess
+
+import psutil
+import torch
+
+from .types import HardwareProfile
+
+# Environment variable pinning a profile by name, unless one is passed in the model configuration
+PROFILE_ENV_VAR = "UIN_PROFILE"
+
+# Engine preference of CPU profiles without fast matrix extensions (GGUF kernels are the fastest there)
+CPU_ENGINES = ["llama.cpp", "transformers", "onnxruntime", "llama.cpp-server"]
+
+# Hardware profiles, matched in order (the first profile whose device and cpu features match is selected)
+HARDWARE_PROFILES: list[HardwareProfile] = [
+    {
+        "name": "cuda",
+        "device": "cuda",
+        "requires": [],
+        "dtype": "auto",
+        "engines": ["transformers", "llama.cpp", "llama.cpp-server", "onnxruntime"],
+        "quantizations": [],  # default quantizations are tuned for cuda already
+        "threads": "logical",
+    },
+    {
+        "name": "mps",
+        "device": "mps",
+        "requires": [],
+        "dtype": "auto",
+        "engines": ["mlx-lm", "llama.cpp", "transformers", "llama.cpp-server", "onnxruntime"],
+        "quantizations": [],  # default quantizations are tuned for mps already
+        "threads": "physical",
+    },
+    {
+        # AMX tiles run bf16 and int8 matrix multiplications natively (oneDNN), full precision transformers checkpoints are fast
+        "name": "cpu-amx",
+        "device": "cpu",
+        "requires": ["amx_bf16", "amx_int8"],
+        "dtype": "bfloat16",
+        "engines": ["transformers", "llama.cpp", "onnxruntime", "llama.cpp-server"],
+        "quantizations": ["bfloat16", "INT8_DYNAMIC", "Q8_0", "Q4_K_M"],
+        "threads": "physical",
+    },
+    {
+        # AVX-512 bf16 dot products and VNNI int8 dot products, 8-bit GGUF kernels are compute efficient
+        "name": "cpu-avx512-bf16",
+        "device": "cpu",
+        "requires": ["avx512f", "avx512_bf16", "avx512_vnni"],
+        "dtype": "bfloat16",
+        "engines": CPU_ENGINES,
+        "quantizations": ["Q8_0", "Q4_K_M", "INT8_DYNAMIC"],
+        "threads": "physical",
+    },
+    {
+        # bf16 is emulated, full precision checkpoints compute in float32
+        "name": "cpu-avx512",
+        "device": "cpu",
+        "requires": ["avx512f"],
+        "dtype": "float32",
+        "engines": CPU_ENGINES,
+        "quantizations": ["Q4_K_M", "Q8_0", "Q4_0"],
+        "threads": "physical",
+    },
+    {
+        "name": "cpu-avx2",
+        "device": "cpu",
+        "requires": ["avx2"],
+        "dtype": "float32",
+        "engines": CPU_ENGINES,
+        "quantizations": ["Q4_K_M", "Q4_0", "IQ4_XS"],
+        "threads": "physical",
+    },
+    {
+        # ARMv8.6 bf16 and int8 matrix multiply extensions (Apple M2+, Graviton3+), Q4_0 weights are repacked for them by llama.cpp
+        "name": "cpu-arm-bf16",
+        "device": "cpu",
+        "requires": ["arm64", "bf16", "i8mm"],
+        "dtype": "bfloat16",
+        "engines": CPU_ENGINES,
+        "quantizations": ["Q4_0", "IQ4_NL", "Q4_K_M"],
+        "threads": "physical",
+    },
+    {
+        "name": "cpu-arm",
+        "device": "cpu",
+        "requires": ["arm64"],
+        "dtype": "float32",
+        "engines": CPU_ENGINES,
+        "quantizations": ["Q4_0", "Q4_K_M"],
+        "threads": "physical",
+    },
+    {
+        "name": "cpu-generic",
+        "device": "cpu",
+        "requires": [],
+        "dtype": "float32",
+        "engines": CPU_ENGINES,
+        "quantizations": ["Q4_K_M", "Q4_0"],
+        "threads": "physical",
+    },
+]
+
+
+@functools.lru_cache(maxsize=1)
+def detect_cpu_features() -> frozenset[str]:
+    """Detect the CPU features (lower case cpu flags, e.g. avx2, avx512_bf16, amx_int8, bf16, i8mm), once per process."""
+    features = set()
+    try:
+        if platform.system() == "Linux":
+            with open("/proc/cpuinfo") as cpuinfo:
+                for line in cpuinfo:
+                    if line.startswith(("flags", "Features")):  # x86, arm
+                        features.update(line.split(":", 1)[1].split())
+                        break
+        elif platform.system() == "Darwin":
+            sysctl = subprocess.run(["sysctl", "-a"], capture_output=True, text=True, timeout=10).stdout
+            for line in sysctl.splitlines():
+                key, _, value = line.partition(":")
+                if key in ("machdep.cpu.features", "machdep.cpu.leaf7_features"):  # intel
+                    features.update(flag.lower().replace(".", "_") for flag in value.split())
+                elif key.startswith("hw.optional.arm.FEAT_") and value.strip() == "1":  # apple silicon
+                    features.add(key.removeprefix("hw.optional.arm.FEAT_").lower())
+    except (OSError, subprocess.SubprocessError):
+        pass
+
+    # Complete with the instruction set used by PyTorch (the only detection on other platforms)
+    capability = torch.backends.cpu.get_cpu_capability()
+    if capability.startswith("AVX512"):
+        features.update({"avx2", "avx512f"})
+    elif capability == "AVX2":
+        features.add("avx2")
+    if platform.machine().lower() in ("arm64", "aarch64"):
+        features.add("arm64")
+
+    return frozenset(features)
+
+
+def select_profile(device_type: str, features: frozenset[str] | None = None) -> HardwareProfile:
+    """Select the first hardware profile matching a device type and cpu features (detected by default)."""
+    features = detect_cpu_features() if features is None else features
+    for profile in HARDWARE_PROFILES:
+        if profile["device"] == device_type and all(feature in features for feature in profile["requires"]):
+            return profile
+    return HARDWARE_PROFILES[-1]  # cpu-generic
+
+
+def resolve_profile(device_type: str, override: str | HardwareProfile | None = None) -> HardwareProfile:
+    """Resolve the hardware profile of a model.
+
+    Args:
+        device_type: Device the model runs on (cuda, mps, cpu)
+        override: Name of a profile to pin (defaults to $UIN_PROFILE), or profile settings overriding the
+            selected profile (or the profile named by their `name`)
+
+    Returns:
+        Hardware profile
+    """
+    override = override or os.environ.get(PROFILE_ENV_VAR) or None
+    profiles = {profile["name"]: profile for profile in HARDWARE_PROFILES}
+    if override is None:
+        return dict(select_profile(device_type))
+    if isinstance(override, str):
+        if override not in profiles:
+            raise ValueError(f"[UniversalModelMixin:__init__:configuration] Unknown hardware profile: {override} (must be one of {list(profiles)})")
+        return dict(profiles[override])
+    return {**(profiles.get(override.get("name")) or select_profile(device_type)), **override}
+
+
+def profile_threads(profile: HardwareProfile) -> int:
+    """Get the number of cpu threads of a hardware profile, capped to the cpus the process may run on."""
+    threads = profile.get("threads", "physical")
+    if isinstance(threads, int):
+        return threads
+    usable = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    if threads == "physical":
+        return min(psutil.cpu_count(logical=False) or usable, usable)
+    return usable
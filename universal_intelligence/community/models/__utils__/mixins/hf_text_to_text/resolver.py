@@ -0,0 +1,153 @@
+"""
+Model sources: where the files of a model (`model_id`, `model_file` of its sources) are resolved from.
+
+Sources are configured per deployment (`UIN_MODEL_SOURCE`) or per model (`configuration={"source": ...}`):
+- `hub` (default): the Hugging Face Hub, the Hugging Face login is checked and engines resolve the files themselves
+- `offline`: the local store only, no network access (also implied by `HF_HUB_OFFLINE=1`)
+- `http(s)://...`: an internal mirror exposing the Hugging Face Hub routes, missing files are downloaded into the local
+  store (which serves them if the mirror is unreachable)
+- a directory or `file://` URL: a local mirror laid out as `<root>/<model_id>/<files>`, used in place
+
+The local store is content-addressed, in the layout of the Hugging Face cache (blobs named by hash, snapshots of
+revisions linking to them), at `UIN_MODEL_STORE` (default: the Hugging Face cache), with a disk quota (see `store.py`). Except for the hub, engines load
+from the resolved local directory, so that initialization and loading do not depend on the network.
+"""
+
+import os
+import re
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+from huggingface_hub import constants
+from huggingface_hub.file_download import repo_folder_name
+
+from .prefetch import ChunkedDownloader
+from .store import ModelStore, default_store, model_store
+from .types import EngineConfig
+
+SOURCE_ENV_VAR = "UIN_MODEL_SOURCE"
+
+
+def required_file(engine_config: EngineConfig) -> str:
+    """Get the file whose presence makes a model available locally (GGUF or ONNX file, or checkpoint configuration)."""
+    return engine_config.get("model_file") or "config.json"
+
+
+class ModelSource(ABC):
+    """Resolve the files of models to a local directory."""
+
+    # Whether the Hugging Face login is checked on initialization
+    credentials: bool = False
+
+    # Whether engines resolve the model id themselves (Hugging Face Hub), rather than loading from the local directory
+    engine_resolution: bool = False
+
+    # Whether missing files are downloaded (see `fetch()`), otherwise models are only loaded from local files
+    remote: bool = False
+
+    # Manager of the local store of downloaded files (quota and eviction, see `store.py`), None for local sources used in place
+    index: ModelStore | None = None
+
+    @abstractmethod
+    def locate(self, engine_config: EngineConfig) -> str | None:
+        """Get the local directory of a model's files, without network access (None if they are not available locally)."""
+        pass
+
+    def fetch(self, engine_config: EngineConfig, download: dict) -> tuple[str, dict[str, Future]]:
+        """Start downloading the files of a model that are not available locally (remote sources).
+
+        Args:
+            engine_config: Engine configuration of the model source
+            download: Downloader settings (workers, chunk_size)
+
+        Returns:
+            Local directory of the files, and futures of their local paths by filename (small files first, weights in order)
+        """
+        raise ValueError(f"[UniversalModelMixin:resolver] {engine_config['model_id']} is not available from {self!r}, and cannot be downloaded from a local source")
+
+
+class HubSource(ModelSource):
+    """Files of the Hugging Face Hub (or of a mirror exposing its routes), stored in the content-addressed local store."""
+
+    def __init__(self, endpoint: str | None = None, store: str | None = None, offline: bool = False, revision: str = "main") -> None:
+        self.endpoint = endpoint
+        self.store = store or constants.HF_HUB_CACHE
+        self.index = model_store(self.store)
+        self.offline = offline
+        self.revision = revision
+        self.remote = not offline
+        default = not endpoint and not offline and os.path.abspath(self.store) == os.path.abspath(constants.HF_HUB_CACHE)
+        self.credentials = self.engine_resolution = default
+
+    def __repr__(self) -> str:
+        return "offline" if self.offline else self.endpoint or "hub"
+
+    def snapshot(self, model_id: str) -> str | None:
+        """Get the local snapshot directory of the revision of a model in the store (None if it was never downloaded)."""
+        storage = os.path.join(self.store, repo_folder_name(repo_id=model_id, repo_type="model"))
+        commit = self.revision
+        if not re.fullmatch(r"[0-9a-f]{40}", commit):
+            try:
+                with open(os.path.join(storage, "refs", self.revision)) as f:
+                    commit = f.read().strip()
+            except OSError:
+                return None
+        return os.path.join(storage, "snapshots", commit)
+
+    def locate(self, engine_config: EngineConfig) -> str | None:
+        if os.path.isdir(engine_config["model_id"]):
+            return engine_config["model_id"]
+        model_dir = self.index.lookup(engine_config)
+        if model_dir:
+            return model_dir
+        snapshot = self.snapshot(engine_config["model_id"])
+        return snapshot if snapshot and os.path.exists(os.path.join(snapshot, required_file(engine_config))) else None
+
+    def fetch(self, engine_config: EngineConfig, download: dict) -> tuple[str, dict[str, Future]]:
+        if self.offline:
+            raise ValueError(f"[UniversalModelMixin:resolver] {engine_config['model_id']} cannot be downloaded in offline mode")
+        downloader = ChunkedDownloader(**download, endpoint=self.endpoint, cache_dir=self.store)
+        try:
+            files = downloader.list_files(engine_config["model_id"], engine_config, revision=self.revision)
+            downloads = downloader.prefetch(files)
+        finally:
+            downloader.close(wait=False)
+        storage = os.path.join(self.store, repo_folder_name(repo_id=engine_config["model_id"], repo_type="model"))
+        return os.path.join(storage, "snapshots", files[0]["commit"] if files else self.revision), downloads
+
+
+class DirectorySource(ModelSource):
+    """Files of a local directory (or mounted share) laid out as `<root>/<model_id>/<files>`, used in place."""
+
+    def __init__(self, root: str) -> None:
+        self.root = root
+
+    def __repr__(self) -> str:
+        return f"file://{self.root}"
+
+    def locate(self, engine_config: EngineConfig) -> str | None:
+        model_id = engine_config["model_id"]
+        model_dir = model_id if os.path.isdir(model_id) else os.path.join(self.root, model_id)
+        return model_dir if os.path.exists(os.path.join(model_dir, required_file(engine_config))) else None
+
+
+def resolve_source(source: str | None = None, store: str | None = None) -> ModelSource:
+    """Get the model source of a specification: `hub`, `offline`, an `http(s)://` mirror, a directory or a `file://` URL
+    (default: $UIN_MODEL_SOURCE, or `offline` if `HF_HUB_OFFLINE` is set, otherwise `hub`).
+
+    Args:
+        source: Source specification
+        store: Local store of downloaded files (default: $UIN_MODEL_STORE, or the Hugging Face cache)
+    """
+    source = source or os.environ.get(SOURCE_ENV_VAR) or ("offline" if constants.HF_HUB_OFFLINE else "hub")
+    store = store or default_store()
+    if source in ("hub", "offline"):
+        return HubSource(store=store, offline=source == "offline")
+    if source.startswith(("http://", "https://")):
+        return HubSource(endpoint=source.rstrip("/"), store=store)
+    path = url2pathname(urlparse(source).path) if source.startswith("file://") else os.path.expanduser(source)
+    if not os.path.isdir(path):
+        raise ValueError(f"[UniversalModelMixin:resolver] Invalid model source '{source}' (must be 'hub', 'offline', an http(s):// mirror, a directory or a file:// URL)")
+    return DirectorySource(path)
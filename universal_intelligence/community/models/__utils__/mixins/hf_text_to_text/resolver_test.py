@@ -0,0 +1,71 @@
+"""
+Test script for the model sources (see `resolver.py`): source specifications and local lookups, on a generated store and mirror.
+
+To run this script from the project root run:
+   python -m universal_intelligence.community.models.__utils__.mixins.hf_text_to_text.resolver_test
+"""
+
+import os
+import shutil
+import tempfile
+
+from ...test import check
+from .resolver import DirectorySource, HubSource, resolve_source
+from .store_test import COMMIT, write_snapshot
+
+CHECKPOINT = {"name": "transformers", "model_id": "org/model", "model_file": None}
+GGUF = {"name": "llama.cpp", "model_id": "org/model", "model_file": "model.gguf"}
+
+
+def run_resolver_tests(directory: str) -> None:
+    """Test resolving source specifications, locating files in the store and in local mirrors, and refusing downloads from local sources."""
+    print("\033[94m" + "\n\n================================================\n## Testing model sources \n================================================\n" + "\033[0m")
+
+    store, mirror = os.path.join(directory, "store"), os.path.join(directory, "mirror")
+    os.makedirs(os.path.join(mirror, "org", "model"))
+    with open(os.path.join(mirror, "org", "model", "config.json"), "w") as f:
+        f.write("{}")
+
+    # Source specifications
+    hub, offline, http = resolve_source("hub", store), resolve_source("offline", store), resolve_source("http://mirror.local/", store)
+    check("hub source", isinstance(hub, HubSource) and not hub.offline and hub.remote and hub.store == store, hub)
+    check("offline source", isinstance(offline, HubSource) and offline.offline and not offline.remote and not offline.credentials, offline)
+    check("mirror source", isinstance(http, HubSource) and http.endpoint == "http://mirror.local" and not http.engine_resolution, http)
+    check("directory source", isinstance(resolve_source(mirror), DirectorySource) and resolve_source(f"file://{mirror}").root == mirror)
+    try:
+        resolve_source(os.path.join(directory, "missing"))
+        check("invalid source rejected", False)
+    except ValueError:
+        check("invalid source rejected", True)
+
+    # The store serves the snapshots of the revision, once their required file is downloaded
+    check("missing files", offline.locate(CHECKPOINT) is None and offline.locate(GGUF) is None)
+    snapshot = write_snapshot(store, "org/model", {"config.json": b"{}"})
+    check("snapshot located", offline.locate(CHECKPOINT) == snapshot and offline.snapshot("org/model").endswith(COMMIT), offline.locate(CHECKPOINT))
+    check("required file missing", offline.locate(GGUF) is None)
+    check("other revision", HubSource(store=store, offline=True, revision="dev").locate(CHECKPOINT) is None)
+    check("local model ids", offline.locate({**CHECKPOINT, "model_id": mirror}) == mirror)
+
+    # Recorded artifacts are looked up in the store index
+    relocated = write_snapshot(store, "org/other", {"model.gguf": b"gguf"})
+    offline.index.record(GGUF, relocated)
+    check("indexed artifact located", offline.locate(GGUF) == relocated, offline.locate(GGUF))
+
+    # Local mirrors are used in place, and never download
+    source = DirectorySource(mirror)
+    check("mirror located", source.locate(CHECKPOINT) == os.path.join(mirror, "org", "model") and source.locate(GGUF) is None)
+    for local_source in (source, offline):
+        try:
+            local_source.fetch(GGUF, {})
+            check(f"download refused ({local_source!r})", False)
+        except ValueError:
+            check(f"download refused ({local_source!r})", True)
+
+
+if __name__ == "__main__":
+    directory = tempfile.mkdtemp()
+    os.environ["UIN_CACHE_DIR"] = os.path.join(directory, "cache")  # store index
+    try:
+        run_resolver_tests(directory)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
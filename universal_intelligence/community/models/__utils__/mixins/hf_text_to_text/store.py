@@ -0,0 +1,275 @@
+"""
+Local model store manager: disk quota and LRU eviction of model artifacts.
+
+An artifact is the set of files a model variant loads from the store (GGUF file, ONNX graph, or checkpoint), recorded in
+an index with its blob sizes and last use when a model loads or prefetches it (see `resolver.py` for the store layout).
+The index serves store lookups, reports and evictions, without walking the store directory. Artifacts pinned by loaded
+models (of any process on the node) are never evicted, and blobs shared by several artifacts are only deleted with the
+last one. Files downloaded outside of the models (e.g. `huggingface-cli download`) are not tracked, and never evicted.
+Changes to the index (and evictions) are serialized across the processes of the node with a lock file next to the index.
+
+The quota (in GB) is configured per deployment (`UIN_STORE_QUOTA`) or per model (`configuration={"store": {"quota": ...}}`),
+and enforced whenever an artifact is recorded, evicting the least recently used artifacts first.
+
+To report the artifacts of the store, or prune the unused ones, from the project root run:
+   python -m universal_intelligence.community.models.__utils__.mixins.hf_text_to_text.store report
+   python -m universal_intelligence.community.models.__utils__.mixins.hf_text_to_text.store prune --unused-days 30 --quota 200
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+
+import psutil
+from huggingface_hub import constants
+
+from ......community.__utils__.cache import get_cache_dir
+from .prefetch import engine_files
+from .types import EngineConfig, StoreArtifact, StoreEntry, StoreReport
+
+try:
+    import fcntl
+except ImportError:  # Windows, changes are only serialized across the threads of the process
+    fcntl = None
+
+STORE_ENV_VAR = "UIN_MODEL_STORE"
+QUOTA_ENV_VAR = "UIN_STORE_QUOTA"
+
+_stores: dict[str, "ModelStore"] = {}
+_stores_lock = threading.Lock()
+
+
+def default_store() -> str:
+    """Get the local store of downloaded files: $UIN_MODEL_STORE, or the Hugging Face cache."""
+    return os.environ.get(STORE_ENV_VAR) or constants.HF_HUB_CACHE
+
+
+def model_store(store: str | None = None) -> "ModelStore":
+    """Get the manager of a local store (default: `default_store()`), shared by the models of the process."""
+    store = os.path.abspath(store or default_store())
+    with _stores_lock:
+        if store not in _stores:
+            _stores[store] = ModelStore(store)
+        return _stores[store]
+
+
+def artifact_key(engine_config: EngineConfig) -> str:
+    """Get the index key of the artifact of an engine (checkpoints are shared by the engines loading them)."""
+    model_file = engine_config.get("model_file")
+    return f"{engine_config['model_id']}:{model_file}" if model_file else engine_config["model_id"]
+
+
+def _alive(pin: str) -> bool:
+    """Check whether the process holding a pin is running."""
+    return psutil.pid_exists(int(pin.split(":")[0]))
+
+
+class ModelStore:
+    """Index of the artifacts of a local store, with their sizes, last use and pins, enforcing a disk quota."""
+
+    def __init__(self, store: str, quota: float | None = None) -> None:
+        """
+        Args:
+            store: Local store directory
+            quota: Disk quota of the tracked artifacts, in GB (default: $UIN_STORE_QUOTA, or unbounded)
+        """
+        self.store = os.path.abspath(store)
+        self.quota = quota if quota is not None else float(os.environ[QUOTA_ENV_VAR]) if os.environ.get(QUOTA_ENV_VAR) else None
+        self._path = os.path.join(get_cache_dir("store"), f"{hashlib.sha256(self.store.encode()).hexdigest()[:16]}.json")
+        self._artifacts: dict[str, StoreArtifact] = {}
+        self._version: tuple[int, int, int] | None = None
+        self._lock = threading.RLock()
+        self._depth = 0  # nesting of `_locked()` sections (e.g. `prune()` when recording)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Serialize the changes to the index (read, modify, write and evict) across the threads and processes of the node."""
+        with self._lock:
+            self._depth += 1
+            try:
+                if self._depth > 1 or fcntl is None:
+                    yield
+                    return
+                with open(f"{self._path}.lock", "a") as lock_file:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)  # released when the file is closed
+                    yield
+            finally:
+                self._depth -= 1
+
+    def _read(self) -> dict[str, StoreArtifact]:
+        """Get the index, reloaded when written by another process (each write replaces the file)."""
+        try:
+            stat = os.stat(self._path)
+        except OSError:
+            return self._artifacts
+        version = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if version != self._version:
+            try:
+                with open(self._path) as f:
+                    self._artifacts = json.load(f)["artifacts"]
+            except (OSError, ValueError, KeyError):
+                self._artifacts = {}
+            self._version = version
+        return self._artifacts
+
+    def _write(self) -> None:
+        temporary = f"{self._path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary, "w") as f:
+            json.dump({"store": self.store, "artifacts": self._artifacts}, f)
+        os.replace(temporary, self._path)
+        stat = os.stat(self._path)
+        self._version = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def lookup(self, engine_config: EngineConfig) -> str | None:
+        """Get the local directory of the artifact of an engine from the index (None if not recorded, or evicted)."""
+        with self._lock:
+            artifact = self._read().get(artifact_key(engine_config))
+        if artifact is None or not os.path.exists(os.path.join(artifact["snapshot"], engine_config.get("model_file") or "config.json")):
+            return None
+        return artifact["snapshot"]
+
+    def record(self, engine_config: EngineConfig, model_dir: str, quantization: str | None = None, pin: bool = False, quota: float | None = None) -> str | None:
+        """Record the use of the artifact of an engine (files, sizes, last use), and enforce the quota (on the other artifacts,
+        the recorded artifact is kept even if it exceeds the quota on its own).
+
+        Args:
+            engine_config: Engine configuration of the model source
+            model_dir: Local directory of the files, in the store (files outside of the store are not tracked)
+            quantization: Quantization loaded from the files ("<model name>:<quantization>")
+            pin: Whether to pin the artifact until `unpin()` (or the end of the process)
+            quota: Disk quota, in GB (default: the quota of the store)
+
+        Returns:
+            Pin token (None if not pinned, or not tracked)
+        """
+        if not os.path.abspath(model_dir).startswith(self.store + os.sep):
+            return None
+        filenames = [os.path.relpath(os.path.join(root, name), model_dir) for root, _, names in os.walk(model_dir) for name in names]
+        files = {name: os.path.realpath(os.path.join(model_dir, name)) for name in engine_files(engine_config, [name.replace(os.sep, "/") for name in filenames])}
+        files = {name: blob for name, blob in files.items() if os.path.exists(blob)}
+        token = f"{os.getpid()}:{uuid.uuid4().hex[:8]}" if pin else None
+        with self._locked():
+            artifacts = self._read()
+            key = artifact_key(engine_config)
+            artifact = artifacts.get(key) or {"model_id": engine_config["model_id"], "model_file": engine_config.get("model_file"), "quantizations": [], "pins": []}
+            artifact["pins"] = [pin for pin in artifact["pins"] if _alive(pin)]
+            artifact.update(snapshot=os.path.abspath(model_dir), files=files, sizes={blob: os.path.getsize(blob) for blob in files.values()}, last_used=time.time())
+            if quantization and quantization not in artifact["quantizations"]:
+                artifact["quantizations"].append(quantization)
+            if token:
+                artifact["pins"].append(token)
+            artifacts[key] = artifact
+            self._write()
+            self.prune(quota=quota, keep=key)
+        return token
+
+    def unpin(self, engine_config: EngineConfig, token: str) -> None:
+        """Release the pin of a loaded model on the artifact of an engine (its last use is updated)."""
+        with self._locked():
+            artifact = self._read().get(artifact_key(engine_config))
+            if artifact and token in artifact["pins"]:
+                artifact["pins"].remove(token)
+                artifact["last_used"] = time.time()
+                self._write()
+
+    def _pinned(self, artifact: StoreArtifact) -> bool:
+        return any(_alive(pin) for pin in artifact["pins"])
+
+    def _size(self, artifacts: dict[str, StoreArtifact]) -> int:
+        """Get the size of artifacts, in bytes (blobs shared by several artifacts counted once)."""
+        return sum({blob: size for artifact in artifacts.values() for blob, size in artifact["sizes"].items()}.values())
+
+    def report(self) -> StoreReport:
+        """Get the artifacts of the store, most recently used first, with their size and pin status."""
+        with self._lock:
+            artifacts = dict(self._read())
+        entries: list[StoreEntry] = [
+            {
+                "model_id": artifact["model_id"],
+                "model_file": artifact["model_file"],
+                "quantizations": artifact["quantizations"],
+                "size": round(sum(artifact["sizes"].values()) / 1024**3, 3),
+                "last_used": artifact["last_used"],
+                "pinned": self._pinned(artifact),
+            }
+            for artifact in sorted(artifacts.values(), key=lambda artifact: artifact["last_used"], reverse=True)
+        ]
+        return {"store": self.store, "quota": self.quota, "size": round(self._size(artifacts) / 1024**3, 3), "artifacts": entries}
+
+    def prune(self, unused_days: float | None = None, quota: float | None = None, dry_run: bool = False, keep: str | None = None) -> list[StoreEntry]:
+        """Evict the unpinned artifacts unused for a number of days, then the least recently used ones beyond the quota.
+
+        Args:
+            unused_days: Evict the artifacts unused for this number of days (default: only enforce the quota)
+            quota: Disk quota, in GB (default: the quota of the store)
+            dry_run: Only get the artifacts that would be evicted
+            keep: Key of an artifact never evicted (e.g. the artifact being recorded, see `artifact_key()`)
+
+        Returns:
+            Evicted artifacts
+        """
+        quota = quota if quota is not None else self.quota
+        with self._locked():
+            artifacts = self._read()
+            remaining = dict(artifacts)
+            evicted: list[str] = []
+            for key, artifact in sorted(artifacts.items(), key=lambda item: item[1]["last_used"]):
+                unused = unused_days is not None and time.time() - artifact["last_used"] > unused_days * 86400
+                over_quota = quota is not None and self._size(remaining) > quota * 1024**3
+                if (unused or over_quota) and key != keep and not self._pinned(artifact):
+                    evicted.append(key)
+                    del remaining[key]
+
+            entries = [entry for entry in self.report()["artifacts"] if artifact_key(entry) in evicted]
+            if dry_run or not evicted:
+                return entries
+            shared = {blob for artifact in remaining.values() for blob in artifact["files"].values()}
+            for key in evicted:
+                self._evict(artifacts.pop(key), shared)
+            self._write()
+            return entries
+
+    def _evict(self, artifact: StoreArtifact, shared: set[str]) -> None:
+        """Delete the files of an artifact (blobs still used by other artifacts are kept)."""
+        for name, blob in artifact["files"].items():
+            pointer = os.path.join(artifact["snapshot"], name)
+            for path in (pointer, blob) if blob not in shared else (pointer,):
+                if path.startswith(self.store + os.sep) and os.path.lexists(path):
+                    os.remove(path)
+        # Remove the directories left empty in the snapshot
+        for root, _, _ in sorted(os.walk(artifact["snapshot"]), key=lambda item: len(item[0]), reverse=True):
+            if not os.listdir(root):
+                os.rmdir(root)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Report the artifacts of the local model store, or prune the unused ones")
+    parser.add_argument("command", choices=["report", "prune"])
+    parser.add_argument("--store", help="Local store (default: $UIN_MODEL_STORE, or the Hugging Face cache)")
+    parser.add_argument("--unused-days", type=float, help="Prune the artifacts unused for this number of days")
+    parser.add_argument("--quota", type=float, help="Prune the least recently used artifacts beyond this size, in GB (default: $UIN_STORE_QUOTA)")
+    parser.add_argument("--dry-run", action="store_true", help="Only list the artifacts that would be pruned")
+    args = parser.parse_args(argv)
+
+    manager = model_store(args.store)
+    entries = manager.report()["artifacts"] if args.command == "report" else manager.prune(args.unused_days, args.quota, args.dry_run)
+    for entry in entries:
+        quantizations = ", ".join(entry["quantizations"]) or "prefetched"
+        pinned = " (pinned)" if entry["pinned"] else ""
+        print(f"{entry['model_id']} {entry['model_file'] or ''} [{quantizations}]: {entry['size']:.2f}GB, last used {datetime.fromtimestamp(entry['last_used']):%Y-%m-%d %H:%M}{pinned}")
+    report = manager.report()
+    action = {"report": "", "prune": "Would prune" if args.dry_run else "Pruned"}[args.command]
+    if action:
+        print(f"{action} {len(entries)} artifacts, {sum(entry['size'] for entry in entries):.2f}GB")
+    print(f"Store {report['store']}: {report['size']:.2f}GB" + (f" / {report['quota']:.2f}GB quota" if report["quota"] else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Test script for the local model store manager (see `store.py`): quota, LRU eviction, pins and shared blobs, on a generated store.
+
+To run this script from the project root run:
+   python -m universal_intelligence.community.models.__utils__.mixins.hf_text_to_text.store_test
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+
+from huggingface_hub.file_download import repo_folder_name
+
+from ...test import check
+from .store import ModelStore, artifact_key
+
+COMMIT = "0123456789abcdef0123456789abcdef01234567"
+KB = 1024 / 1024**3  # in GB
+
+
+def write_snapshot(store: str, model_id: str, files: dict[str, bytes], revision: str = "main") -> str:
+    """Write files in the layout of the Hugging Face cache (snapshot links to blobs named by hash), and get the snapshot directory."""
+    storage = os.path.join(store, repo_folder_name(repo_id=model_id, repo_type="model"))
+    snapshot = os.path.join(storage, "snapshots", COMMIT)
+    os.makedirs(os.path.join(storage, "blobs"), exist_ok=True)
+    os.makedirs(os.path.join(storage, "refs"), exist_ok=True)
+    with open(os.path.join(storage, "refs", revision), "w") as f:
+        f.write(COMMIT)
+    for name, data in files.items():
+        blob = os.path.join(storage, "blobs", hashlib.sha256(data).hexdigest())
+        with open(blob, "wb") as f:
+            f.write(data)
+        path = os.path.join(snapshot, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if not os.path.lexists(path):
+            os.symlink(os.path.relpath(blob, os.path.dirname(path)), path)
+    return snapshot
+
+
+def gguf_engine(model_id: str, model_file: str) -> dict:
+    return {"name": "llama.cpp", "model_id": model_id, "model_file": model_file}
+
+
+def run_store_tests(store: str) -> None:
+    """Test recording artifacts, enforcing the quota (least recently used first), pins, shared blobs and pruning."""
+    print("\033[94m" + "\n\n================================================\n## Testing model store \n================================================\n" + "\033[0m")
+
+    manager = ModelStore(store)
+    engines = {name: gguf_engine(f"org/{name}", "model.gguf") for name in ("a", "b", "c", "d")}
+    snapshots = {name: write_snapshot(store, engine["model_id"], {"model.gguf": name.encode() * 400 * 1024}) for name, engine in engines.items()}
+
+    # Files outside of the store are not tracked
+    check("untracked files", manager.record(engines["a"], tempfile.gettempdir(), pin=True) is None)
+
+    # Recording enforces the quota on the least recently used artifacts
+    manager.record(engines["a"], snapshots["a"], quantization="A:Q8_0", quota=1000 * KB)
+    manager.record(engines["b"], snapshots["b"], quantization="B:Q8_0", quota=1000 * KB)
+    check("artifacts recorded", manager.lookup(engines["a"]) == snapshots["a"] and manager._size(manager._read()) == 800 * 1024, manager.report())
+    manager.record(engines["c"], snapshots["c"], quota=1000 * KB)
+    check("least recently used evicted", manager.lookup(engines["a"]) is None and not os.path.exists(snapshots["a"]), manager.report())
+    check("recent artifacts kept", manager.lookup(engines["b"]) == snapshots["b"] and manager.lookup(engines["c"]) == snapshots["c"])
+
+    # The recorded artifact is kept even if it exceeds the quota on its own
+    manager.record(engines["d"], snapshots["d"], quota=100 * KB)
+    check("recorded artifact kept", [entry["model_id"] for entry in manager.report()["artifacts"]] == ["org/d"], manager.report())
+
+    # Pinned artifacts are never evicted, until unpinned
+    snapshots["a"] = write_snapshot(store, "org/a", {"model.gguf": b"a" * 400 * 1024})
+    token = manager.record(engines["a"], snapshots["a"], pin=True)
+    manager.record(engines["d"], snapshots["d"], quota=100 * KB)
+    check("pinned artifact kept", manager.lookup(engines["a"]) == snapshots["a"] and manager.report()["artifacts"][1]["pinned"], manager.report())
+    check("pins shared across managers", ModelStore(store).report()["artifacts"][1]["pinned"])
+    manager.unpin(engines["a"], token)
+    check("dry run", sorted(entry["model_id"] for entry in manager.prune(quota=0, dry_run=True)) == ["org/a", "org/d"] and os.path.exists(snapshots["a"]))
+    manager.prune(quota=0)
+    check("unpinned artifacts evicted", not manager.report()["artifacts"] and not os.path.exists(snapshots["a"]), manager.report())
+
+    # Blobs shared by several artifacts are only deleted with the last one
+    files = {"model.gguf": b"shared" * 1024, "other.gguf": b"shared" * 1024}
+    snapshot = write_snapshot(store, "org/e", files)
+    shared, other = gguf_engine("org/e", "model.gguf"), gguf_engine("org/e", "other.gguf")
+    manager.record(shared, snapshot)
+    manager.record(other, snapshot)
+    check("shared blobs counted once", manager._size(manager._read()) == len(files["model.gguf"]), manager.report())
+    manager.prune(unused_days=0, keep=artifact_key(other))
+    check("shared blob kept", not os.path.lexists(os.path.join(snapshot, "model.gguf")) and open(os.path.join(snapshot, "other.gguf"), "rb").read() == files["other.gguf"])
+    manager.prune(unused_days=0)
+    check("last artifact evicts the blob", not os.listdir(os.path.join(store, "models--org--e", "blobs")))
+
+
+if __name__ == "__main__":
+    directory = tempfile.mkdtemp()
+    os.environ["UIN_CACHE_DIR"] = os.path.join(directory, "cache")  # store index
+    try:
+        run_store_tests(os.path.join(directory, "store"))
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
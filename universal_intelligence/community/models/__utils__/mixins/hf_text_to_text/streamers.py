@@ -0,0 +1,20 @@
+"""
+Generation streamers of transformers engines (imported with transformers, when generating).
+"""
+
+from typing import Any
+
+from transformers import TextStreamer
+
+from ...reasoning import ReasoningTraceFilter
+
+
+class ReasoningTraceStreamer(TextStreamer):
+    """Streamer feeding decoded text to a reasoning trace filter as it is generated."""
+
+    def __init__(self, tokenizer: Any, text_filter: ReasoningTraceFilter, **decode_kwargs) -> None:
+        super().__init__(tokenizer, skip_prompt=True, **decode_kwargs)
+        self.text_filter = text_filter
+
+    def on_finalized_text(self, text: str, stream_end: bool = False) -> None:
+        self.text_filter.feed(text)
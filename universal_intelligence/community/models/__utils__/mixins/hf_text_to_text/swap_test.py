@@ -0,0 +1,74 @@
+"""
+Test script for swapping the quantization of a model (see `swap()`) while a request is in flight.
+
+To run this script from the project root run:
+   python -m universal_intelligence.community.models.__utils__.mixins.hf_text_to_text.swap_test
+"""
+
+import copy
+import threading
+import time
+
+from ....local.smollm2_135m_instruct.model import UniversalModel
+from ...test import check
+
+
+class SwapModel(UniversalModel):
+    """Model recording the models released by `unload()` (e.g. the retired variant of a swap)."""
+
+    unloaded: list = []
+
+    def unload(self) -> None:
+        if self.model:
+            self.unloaded.append(self.model)
+        super().unload()
+
+
+def run_swap_tests(model_class: type[SwapModel]) -> None:
+    """Test that swapping waits for in-flight requests, retires the variant serving them once they complete, and clears the
+    history token counts of the previous tokenizer."""
+    print("\033[94m" + "\n\n================================================\n## Testing swap with a request in flight \n================================================\n" + "\033[0m")
+
+    model = model_class(engine="transformers", configuration={"history": {"max_tokens": 1024}}, verbose=False)
+    model.load()
+    model._history_window.count({"role": "user", "content": "Hello"})
+    source = model.quantization
+    target = next(quant for quant, sources in model._device_sources.items() if quant != source and any(engine["name"] == "transformers" for engine in sources["available_engines"]))
+
+    # The in-flight request changes the serving variant (e.g. reloaded by the out-of-memory recovery) once the swap is waiting
+    started, release = threading.Event(), threading.Event()
+    reloaded = copy.copy(model.model)
+    generate = model.model.generate
+
+    def blocking_generate(*args, **kwargs):
+        started.set()
+        release.wait()
+        model.model = reloaded
+        return generate(*args, **kwargs)
+
+    model.model.generate = blocking_generate
+    results = []
+    request = threading.Thread(target=lambda: results.append(model.process("Hello", configuration={"max_new_tokens": 4}, keep_alive=True)))
+    request.start()
+    started.wait()
+    swap = threading.Thread(target=model.swap, kwargs={"quantization": target})
+    swap.start()
+    time.sleep(1)
+    waiting = swap.is_alive() and model.quantization == source
+
+    release.set()
+    request.join()
+    swap.join()
+    check("swap waits for in-flight requests", waiting)
+    check("in-flight request served by the previous variant", results and results[0][1]["quantization"] == source, results)
+    check("switched over", model.quantization == target and model.loaded(), model.quantization)
+    check("retired variant is the one serving once drained", len(model_class.unloaded) == 1 and model_class.unloaded[0] is reloaded, model_class.unloaded)
+    check("history token counts cleared", not model._history_window._counts, model._history_window._counts)
+
+    _, logs = model.process("Hello", configuration={"max_new_tokens": 4}, keep_alive=True)
+    check("new requests served by the new variant", logs["quantization"] == target, logs)
+    model.unload()
+
+
+if __name__ == "__main__":
+    run_swap_tests(SwapModel)
@@ -1,11 +1,14 @@
 from typing import Any, Literal, TypedDict
 
+from ......core.utils.types import Compatibility
+
 
 # Engine configuration types
-class EngineConfig(TypedDict):
+class EngineConfig(TypedDict, total=False):
     name: str
     model_id: str
     model_file: str | None
+    quantize: Literal["int8_dynamic", "int4_weight_only"]  # cpu weight quantization applied at load time (transformers)
     is_default: bool
 
 
@@ -33,7 +36,7 @@ class ProcessorConfig(TypedDict, total=False):
     output: dict[str, Any]
 
 
-ProcessorConfiguration = dict[Literal["transformers", "mlx-lm", "llama.cpp"], ProcessorConfig]
+ProcessorConfiguration = dict[Literal["transformers", "mlx-lm", "llama.cpp", "llama.cpp-server", "onnxruntime"], ProcessorConfig]
 
 
 class ChatTemplate(TypedDict):
@@ -52,3 +55,152 @@ class QuantizationSettings(TypedDict):
     min_precision: Literal["2bit", "3bit", "4bit", "5bit", "6bit", "8bit", "16bit", "32bit"] | None
     max_precision: Literal["2bit", "3bit", "4bit", "5bit", "6bit", "8bit", "16bit", "32bit"] | None
     max_memory_allocation: float | None
+    optimize: Literal["throughput", "latency"] | None  # use the stored autotuning results of the host (see `autotune()`)
+    max_quality_loss: float | None  # maximum perplexity increase over the best benchmarked quantization, as a fraction (see `benchmark()`)
+
+
+class ReasoningConfiguration(TypedDict, total=False):
+    policy: Literal["keep", "strip", "summarize"]
+    start_tag: str
+    end_tag: str
+    summary_max_length: int
+
+
+class AdapterConfig(TypedDict, total=False):
+    path: str  # local adapter path (transformers: PEFT adapter directory, llama.cpp: GGUF LoRA file)
+    model_id: str  # Hugging Face repository of the adapter
+    model_file: str  # GGUF LoRA file in the repository (llama.cpp)
+    scale: float  # adapter scale (llama.cpp, default: 1.0)
+
+
+class HardwareProfile(TypedDict, total=False):
+    name: str
+    device: Literal["cuda", "mps", "cpu"]
+    requires: list[str]  # cpu features required by the profile (all of them)
+    dtype: Literal["auto", "bfloat16", "float16", "float32"]  # transformers compute dtype of full precision checkpoints
+    engines: list[str]  # engine preference, when a quantization is served by several engines
+    quantizations: list[str]  # quantization ranking, tried before the default quantization (automatic selection)
+    threads: Literal["physical", "logical"] | int  # cpu threads (llama.cpp, onnxruntime, transformers on cpu)
+
+
+class AutotuneResult(TypedDict):
+    quantization: str
+    engine: str
+    n_threads: int | None
+    parameters: dict  # engine parameters (llama.cpp: n_batch, n_ubatch)
+    memory: float  # GB
+    time_to_first_token: float  # seconds
+    decode_tokens_per_second: float
+    tokens_per_second: float  # generated tokens over the whole request
+
+
+class BenchmarkResult(AutotuneResult, total=False):
+    precision: int  # bits
+    perplexity: float | None  # on the benchmark corpus (None: the engine does not expose prompt logits)
+    load_time: float  # seconds
+    peak_rss: float  # peak resident memory of the process, GB
+    pareto: bool  # Pareto-optimal (perplexity, tokens per second, peak memory)
+
+
+class HeaderSummary(TypedDict):
+    format: Literal["gguf", "safetensors"]
+    weights: int  # bytes
+    parameters: int
+    n_layers: int
+    n_heads: int
+    n_kv_heads: int
+    head_dim: int
+    hidden_size: int
+    vocab_size: int
+    context_length: int | None  # training context length
+    special_tokens: dict[str, str]  # GGUF special token strings (bos, eos, eot, eom)
+    metadata: dict  # GGUF metadata (long arrays skipped)
+
+
+class ChatMetadata(TypedDict):
+    chat_template: str | None  # Jinja chat template
+    bos_token: str
+    eos_token: str
+    stop: list[str]  # end of generation tokens (eos, eot, eom)
+    context_length: int | None  # training context length
+
+
+class ChatMetadataOverrides(TypedDict, total=False):
+    chat_template: str | bool  # Jinja chat template, or False to use the model's `ChatTemplate`
+    stop: list[str] | bool  # stop strings added to the inference configuration, or False to add none
+    context_length: int | bool  # upper bound of the context length, or False to keep the model configuration
+
+
+class RemoteFile(TypedDict):
+    repo_id: str
+    filename: str
+    revision: str  # requested revision (branch, tag or commit)
+    commit: str  # resolved commit hash
+    size: int  # bytes
+    sha256: str | None  # LFS files
+    blob_id: str  # git blob hash
+
+
+class PrefetchResult(TypedDict):
+    quantization: str
+    engine: str
+    model_id: str
+    files: list[str]  # local paths, in the Hugging Face cache
+    size: float  # GB
+    time: float  # seconds
+
+
+class StoreArtifact(TypedDict):
+    model_id: str
+    model_file: str | None  # GGUF or ONNX file, None for checkpoints
+    snapshot: str  # local directory of the files
+    files: dict[str, str]  # blob paths, by filename
+    sizes: dict[str, int]  # bytes, by blob path
+    last_used: float  # timestamp
+    quantizations: list[str]  # "<model name>:<quantization>" loaded from the files
+    pins: list[str]  # "<pid>:<token>" of the loaded models using the files
+
+
+class StoreEntry(TypedDict):
+    model_id: str
+    model_file: str | None
+    quantizations: list[str]
+    size: float  # GB
+    last_used: float  # timestamp
+    pinned: bool  # in use by a loaded model
+
+
+class StoreReport(TypedDict):
+    store: str
+    quota: float | None  # GB
+    size: float  # GB, files shared by several artifacts counted once
+    artifacts: list[StoreEntry]  # most recently used first
+
+
+class CatalogEntry(TypedDict):
+    model: str  # local model module (e.g. qwen2_5_7b_instruct)
+    name: str
+    key: list[int]  # modification time (ns) and size of the sources.yaml file compiled
+    sources: Sources
+    compatibility: list[Compatibility]
+
+
+class CatalogMatch(TypedDict):
+    model: str
+    name: str
+    device: str
+    quantization: str
+    engines: list[str]
+    memory: float  # GB
+    precision: int
+    is_default: bool
+
+
+class MemoryEstimate(TypedDict):
+    weights: float  # GB
+    kv_cache: float  # GB
+    scratch: float  # GB, compute buffers and runtime overhead
+    load: float  # GB, peak while loading (weights held before their quantization at load time, and runtime overhead)
+    total: float  # GB, including the peak while loading
+    n_ctx: int
+    batch: int
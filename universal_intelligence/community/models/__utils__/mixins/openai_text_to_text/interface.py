@@ -0,0 +1,425 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ......community.__utils__.logger import Color, Logger, LogLevel
+from ......core.universal_model import AbstractUniversalModel
+from ......core.utils.types import Message
+from ...context import PinnedContext, split_context
+from ...history import HistoryWindow
+from ...reasoning import ReasoningTraceFilter, apply_reasoning_policy, split_reasoning
+from ...session import Session
+from .types import InferenceConfiguration, ReasoningConfiguration
+
+DEFAULT_BASE_URL = "http://localhost:8000/v1"
+
+# Generation parameters and their OpenAI-compatible equivalents (top_k, min_p and repetition_penalty are common server extensions, e.g. vLLM, llama.cpp)
+OPENAI_PARAMETERS = {
+    "max_new_tokens": "max_tokens",
+    "temperature": "temperature",
+    "top_p": "top_p",
+    "top_k": "top_k",
+    "min_p": "min_p",
+    "presence_penalty": "presence_penalty",
+    "frequency_penalty": "frequency_penalty",
+    "repetition_penalty": "repetition_penalty",
+    "seed": "seed",
+    "stop": "stop",
+    "logit_bias": "logit_bias",
+    "response_format": "response_format",
+}
+
+# Served model lists, per (base url, api key), shared by all instances: {key: (expiry, model ids)}
+_model_lists: dict[tuple[str, str | None], tuple[float, list[str]]] = {}
+_model_lists_lock = threading.Lock()
+
+
+class UniversalModelMixin(AbstractUniversalModel):
+
+    def __init__(
+        self,
+        interface_config: dict,
+        credentials: str | dict | None = None,
+        verbose: bool | str = "DEFAULT",
+        configuration: dict | None = None,
+    ) -> None:
+        """Initialize the model with specified server and configuration."""
+        self._log_level = LogLevel.NONE
+        if verbose:
+            if isinstance(verbose, bool):
+                self._log_level = LogLevel.DEFAULT if verbose else LogLevel.NONE
+            elif isinstance(verbose, str) and verbose.upper() in LogLevel.__members__:
+                self._log_level = LogLevel[verbose.upper()]
+            else:
+                raise ValueError(f"Invalid verbose value: {verbose} (must be bool or str)")
+
+        with Logger(self._log_level) as logger:
+
+            if not interface_config["inference_configuration"]:
+                raise ValueError("[UniversalModelMixin:__init__:interface_config] Inference configuration is not implemented")
+
+            self.config = configuration or {}
+            self.base_url = (self.config.get("base_url") or interface_config.get("base_url") or os.environ.get("OPENAI_BASE_URL") or DEFAULT_BASE_URL).rstrip("/")
+
+            logger.print(message=f"* Initializing model.. ({self.base_url}) *\n", color=Color.WHITE)
+
+            # Credentials are optional, self-hosted servers may not require any
+            if isinstance(credentials, str):
+                credentials = {"api_key": credentials}
+            self._credentials = dict(credentials or {})
+            if not self._credentials.get("api_key") and os.environ.get("OPENAI_API_KEY"):
+                self._credentials["api_key"] = os.environ["OPENAI_API_KEY"]
+
+            # Keep-alive connections, shared by concurrent requests (sessions, batches, candidates)
+            self._max_connections = int(self.config.get("max_connections", 8))
+            if self._max_connections < 1:
+                raise ValueError(f"[UniversalModelMixin:__init__:configuration] Invalid max_connections value: {self._max_connections} (must be a positive integer)")
+            self._timeout = self.config.get("timeout", 600)
+            self._models_ttl = float(self.config.get("models_ttl", 300))
+            self._http = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._max_connections)
+            self._http.mount("http://", adapter)
+            self._http.mount("https://", adapter)
+            self._http.headers.update({"Content-Type": "application/json", **self._credentials.get("headers", {})})
+            if self._credentials.get("api_key"):
+                self._http.headers["Authorization"] = f"Bearer {self._credentials['api_key']}"
+
+            # Resolve the served model (defaults to the first model listed by the server)
+            logger.print(prefix="Model", message="Discovering served models..")
+            name = self.config.get("model") or interface_config.get("name")
+            try:
+                served = self.models()
+            except ValueError:
+                if not name:
+                    logger.print(prefix="Model", message=f"Server not reachable at {self.base_url}.", color=Color.RED)
+                    raise
+                logger.print(prefix="Model", message="Model discovery unavailable, skipping model validation.", color=Color.YELLOW)
+                served = None
+            if served is not None:
+                if not name:
+                    if not served:
+                        raise ValueError(f"[UniversalModelMixin:__init__:configuration] No model served at {self.base_url}")
+                    name = served[0]
+                elif name not in served:
+                    logger.print(prefix="Model", message=f"Model {name} is not served at {self.base_url}.", color=Color.RED)
+                    raise ValueError(f"[UniversalModelMixin:__init__:configuration] Model {name} is not served at {self.base_url} (served models: {served})")
+
+            # Store interface config
+            logger.print(prefix="Model", message="Setting up model configuration..")
+            self._inference_configuration: InferenceConfiguration = interface_config["inference_configuration"]
+            self._reasoning_configuration: ReasoningConfiguration | None = interface_config.get("reasoning_configuration")
+            self.name = name
+            self.engine = "openai"
+            self._logprobs_supported = True  # until the server rejects them (see `_request_completion()`)
+            self._n_supported = True  # until the server rejects or ignores `n` (see `_request_completion()` and `_process()`)
+            self.history = []
+
+            # Window history to a token budget if configured (e.g. {"max_tokens": 4096, "strategy": "summarize"}), token counts are estimated
+            history_configuration = self.config.get("history")
+            self._history_window = HistoryWindow(**history_configuration) if history_configuration else None
+
+            logger.print(prefix="Model", message=f"Initialized remote model: {self.name}", color=Color.MAGENTA)
+            logger.print(prefix="Model", message=f"Device: cloud, Engine: {self.engine}, Server: {self.base_url}\n", color=Color.MAGENTA)
+
+    def _request(self, method: str, path: str, check: bool = True, **kwargs) -> requests.Response:
+        """Send a request to the server over the pooled connections (error statuses raise unless `check` is False)."""
+        try:
+            response = self._http.request(method, f"{self.base_url}{path}", timeout=self._timeout, **kwargs)
+        except requests.RequestException as error:
+            raise ValueError(f"[UniversalModelMixin:request] Server not reachable at {self.base_url}") from error
+        if check and response.status_code >= 400:
+            raise ValueError(f"[UniversalModelMixin:request] Error requesting {path} ({response.status_code}): {response.text[:500]}")
+        return response
+
+    def models(self, refresh: bool = False) -> list[str]:
+        """Get the ids of the models served by the server (cached for `models_ttl` seconds, across instances)."""
+        key = (self.base_url, self._credentials.get("api_key"))
+        with _model_lists_lock:
+            cached = _model_lists.get(key)
+        if cached and not refresh and time.monotonic() < cached[0]:
+            return list(cached[1])
+
+        models = [model["id"] for model in self._request("GET", "/models").json().get("data", [])]
+        with _model_lists_lock:
+            _model_lists[key] = (time.monotonic() + self._models_ttl, models)
+        return list(models)
+
+    def _translate_generation_config(self, configuration: dict | None = None) -> dict:
+        """Translate generation configuration parameters to the OpenAI format."""
+        result = self._inference_configuration[self.engine].copy()
+
+        if configuration:
+            result.update(configuration)
+
+        return {OPENAI_PARAMETERS[param]: value for param, value in result.items() if param in OPENAI_PARAMETERS}
+
+    def _request_completion(self, messages: list[Message], generation_config: dict, stream: bool = False, logger: Logger | None = None) -> dict:
+        """Request a chat completion from the server.
+
+        Streamed completions are printed as they are generated (first candidate), and reassembled into the
+        non-streamed response format. Requests for logprobs rejected by the server (4xx) are retried without them, and
+        logprobs are no longer requested from this server once the retry succeeds. Requests for several candidates
+        rejected by the server (4xx, e.g. llama.cpp server only supports `n=1`) are retried as concurrent single
+        requests, and `n` is no longer requested from this server once they succeed.
+        """
+        payload = {"model": self.name, "messages": messages, **generation_config, **({"stream": True} if stream else {})}
+        response = self._request("POST", "/chat/completions", check=False, data=json.dumps(payload), stream=stream)
+        if payload.get("logprobs") and 400 <= response.status_code < 500:
+            response.close()
+            payload.pop("logprobs")
+            response = self._request("POST", "/chat/completions", check=False, data=json.dumps(payload), stream=stream)
+            if response.status_code < 400:
+                self._logprobs_supported = False
+        if payload.get("n", 1) > 1 and 400 <= response.status_code < 500:
+            response.close()
+            choices = self._request_candidates(messages, {param: value for param, value in generation_config.items() if param != "n"}, payload["n"], stream=stream, logger=logger)
+            self._n_supported = False
+            return {"choices": choices}
+        if response.status_code >= 400:
+            with response:
+                raise ValueError(f"[UniversalModelMixin:request] Error requesting /chat/completions ({response.status_code}): {response.text[:500]}")
+        if not stream:
+            return response.json()
+
+        choices: dict[int, dict] = {}
+        with response:
+            for line in response.iter_lines():
+                if not line.startswith(b"data:"):
+                    continue
+                data = line[len(b"data:") :].strip()
+                if data == b"[DONE]":
+                    break
+                for chunk in json.loads(data).get("choices", []):
+                    choice = choices.setdefault(chunk.get("index", 0), {"content": [], "reasoning": [], "logprobs": []})
+                    delta = chunk.get("delta") or {}
+                    if delta.get("content"):
+                        choice["content"].append(delta["content"])
+                        if logger and chunk.get("index", 0) == 0:
+                            logger.stream(delta["content"], color=Color.GRAY)
+                    if delta.get("reasoning_content") or delta.get("reasoning"):
+                        choice["reasoning"].append(delta.get("reasoning_content") or delta.get("reasoning"))
+                    choice["logprobs"].extend((chunk.get("logprobs") or {}).get("content") or [])
+        if logger:
+            logger.stream("\n")
+
+        return {
+            "choices": [
+                {
+                    "index": index,
+                    "message": {"role": "assistant", "content": "".join(choice["content"]), "reasoning": "".join(choice["reasoning"]) or None},
+                    "logprobs": {"content": choice["logprobs"]} if choice["logprobs"] else None,
+                }
+                for index, choice in sorted(choices.items())
+            ]
+        }
+
+    def _request_candidates(self, messages: list[Message], generation_config: dict, n: int, stream: bool = False, logger: Logger | None = None) -> list[dict]:
+        """Request `n` candidates as concurrent single chat completions (first candidate streamed), for servers not supporting `n`."""
+
+        def request(index: int) -> dict:
+            choice = self._request_completion(messages, generation_config, stream=stream and index == 0, logger=logger if index == 0 else None)["choices"][0]
+            return {**choice, "index": index}
+
+        with ThreadPoolExecutor(max_workers=min(n, self._max_connections)) as executor:
+            return list(executor.map(request, range(n)))
+
+    def _extract_logprob(self, choice: dict) -> float | None:
+        """Sum the token logprobs of a completion choice, if returned by the server."""
+        logprobs = (choice.get("logprobs") or {}).get("content")
+        if not logprobs:
+            return None
+        return sum(token["logprob"] for token in logprobs)
+
+    def _resolve_reasoning_configuration(self, configuration: dict) -> ReasoningConfiguration | None:
+        """Resolve the reasoning trace policy from the model defaults and inference configuration (in order of precedence)."""
+        reasoning = dict(self._reasoning_configuration or {})
+        override = configuration.pop("reasoning", None)
+        if isinstance(override, str):
+            reasoning["policy"] = override
+        elif isinstance(override, dict):
+            reasoning.update(override)
+        return reasoning if reasoning.get("policy") else None
+
+    def _separate_reasoning(self, message: dict, reasoning: ReasoningConfiguration) -> ReasoningTraceFilter:
+        """Separate the reasoning trace from a completion message, whether inlined in its content or returned separately by the server."""
+        start_tag, end_tag = reasoning.get("start_tag", "<think>"), reasoning.get("end_tag", "</think>")
+        content = message["content"] or ""
+        trace = message.get("reasoning_content") or message.get("reasoning")
+        if trace:
+            content = f"{start_tag}{trace}{end_tag}{content}"
+        return split_reasoning(content, start_tag, end_tag)
+
+    def process(self, input: str | list[Message], context: list[Any] | None = None, configuration: dict | None = None, remember: bool = False, keep_alive: bool = False, stream: bool = False) -> tuple[Any, dict]:
+        """Process input through the model."""
+        return self._process(input, context=context, configuration=configuration, remember=remember, keep_alive=keep_alive, stream=stream)
+
+    def process_batch(self, inputs: list[str | list[Message]], context: list[Any] | None = None, configuration: dict | None = None) -> list[tuple[Any, dict]]:
+        """Process independent inputs concurrently (up to `max_connections` requests in flight), without history.
+
+        Returns:
+            List of (output, logs) tuples, in the order of the inputs
+        """
+        if not inputs:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(inputs), self._max_connections)) as executor:
+            return list(executor.map(lambda input: self._process(input, context=context, configuration=configuration, history=False), inputs))
+
+    def pin_context(self, items: list[Any]) -> PinnedContext:
+        """Render context items once, and get a handle to reference them in later calls (`context=[handle, ...]`).
+
+        Pinned context goes first in the prompt, so that servers caching prompt prefixes can reuse it.
+        """
+        if not items:
+            raise ValueError("[UniversalModelMixin:pin_context] Context items are required")
+        return PinnedContext(self, items)
+
+    def session(self) -> Session:
+        """Open a conversation session over this model, with its own history."""
+        return Session(self)
+
+    def _process(
+        self,
+        input: str | list[Message],
+        context: list[Any] | None = None,
+        configuration: dict | None = None,
+        remember: bool = False,
+        keep_alive: bool = False,
+        session: Session | None = None,
+        stream: bool = False,
+        history: bool = True,
+    ) -> tuple[Any, dict]:
+        """Process input through the model, within a session's history if provided (model history otherwise, unless `history` is False)."""
+        with Logger(self._log_level) as logger:
+            logger.print(message=f"* Invoking remote model.. ({self.name}) *\n", color=Color.WHITE)
+            if not input:
+                raise ValueError("Input is required")
+
+            logger.print(prefix="Model", message="Translating input..", color=Color.GRAY)
+
+            # Extract the number of candidates to sample
+            configuration = dict(configuration or {})
+            n = int(configuration.pop("n", 1))
+            if n < 1:
+                raise ValueError(f"Invalid n value: {n} (must be a positive integer)")
+
+            # Resolve the reasoning trace policy
+            reasoning = self._resolve_reasoning_configuration(configuration)
+
+            # Convert input to messages format if string
+            input_messages = input if isinstance(input, list) else [{"role": "user", "content": input}]
+
+            # Add context if provided, pinned context blocks go first (stable prompt prefix)
+            pinned_messages, context_messages = split_context(self, context)
+            messages = context_messages + input_messages
+
+            # Add history to current messages, windowed to the token budget if configured
+            chat_history = (session.history if session else self.history) if history else []
+            if chat_history and self._history_window:
+                chat_history = self._history_window.fit(chat_history, pinned_messages + messages)
+            messages = pinned_messages + chat_history + messages
+
+            logger.print(prefix="Model", message=f"Translated input: {messages}", color=Color.GRAY, debug=True)
+
+            # Translate generation configuration
+            logger.print(prefix="Model", message="Translating inference configuration..", color=Color.GRAY)
+            generation_config = self._translate_generation_config(configuration)
+
+            logger.print(prefix="Model", message="Generating output..", color=Color.CYAN)
+
+            # Process input through the server
+            if n > 1 and self._logprobs_supported:
+                generation_config = {**generation_config, "logprobs": True}
+            try:
+                if n > 1 and self._n_supported:
+                    # Request all candidates at once, servers which support it share the prompt prefill
+                    choices = self._request_completion(messages, {**generation_config, "n": n}, stream=stream, logger=logger)["choices"]
+
+                    # Complete with concurrent single requests if the server returned fewer candidates (e.g. `n` ignored)
+                    missing = n - len(choices)
+                    if missing > 0:
+                        if len(choices) == 1:
+                            self._n_supported = False
+                        choices += [{**choice, "index": len(choices) + choice["index"]} for choice in self._request_candidates(messages, generation_config, missing)]
+                elif n > 1:
+                    choices = self._request_candidates(messages, generation_config, n, stream=stream, logger=logger)
+                else:
+                    choices = self._request_completion(messages, generation_config, stream=stream, logger=logger)["choices"]
+                if len(choices) < n:
+                    raise ValueError("[UniversalModelMixin:process] Error generating output.")
+            except ValueError:
+                logger.print(prefix="Model", message="Error generating output.", color=Color.RED)
+                raise
+
+            logger.print(prefix="Model", message="Generation complete", color=Color.GREEN)
+
+            logs = {"engine": self.engine}
+            choices = choices[:n]
+            outputs = [(choice["message"]["content"], choice["message"]["content"]) for choice in choices]
+
+            # Apply the reasoning trace policy, traces are only exposed in the logs
+            if reasoning:
+                text_filters = [self._separate_reasoning(choice["message"], reasoning) for choice in choices]
+                outputs = [apply_reasoning_policy(text_filter, reasoning["policy"], reasoning.get("summary_max_length", 500)) for text_filter in text_filters]
+                traces = [text_filter.trace for text_filter in text_filters]
+                if n > 1:
+                    logs["reasoning"] = traces
+                elif traces[0]:
+                    logs["reasoning"] = traces[0]
+
+            output, remembered = outputs[0]
+            if n > 1:
+                # Remember the most likely candidate when sampling several
+                logprobs = [self._extract_logprob(choice) for choice in choices]
+                best = max(range(n), key=lambda i: logprobs[i] if logprobs[i] is not None else float("-inf"))
+                output, remembered = [response for response, _ in outputs], outputs[best][1]
+                logs["logprobs"] = logprobs
+
+            # Update history if remember is True, context is never duplicated into history
+            if remember and history:
+                chat_history = [*chat_history, *input_messages, {"role": "assistant", "content": remembered}]
+                if session:
+                    session.history = chat_history
+                else:
+                    self.history = chat_history
+
+            logger.print(prefix="Model", message=f"Response: {output}", color=Color.GRAY, debug=True)
+
+            return output, logs
+
+    def load(self) -> None:
+        """Load model into memory based on engine type."""
+        with Logger(self._log_level) as logger:
+            logger.print(message=f"* Loading model.. ({self.name}) *", color=Color.WHITE)
+            logger.print(prefix="Model", message=f"No local model to load. Model is served remotely ({self.base_url}).", color=Color.YELLOW)
+
+    def unload(self) -> None:
+        """Unload model from memory, closing pooled connections."""
+        with Logger(self._log_level) as logger:
+            logger.print(message=f"* Unloading model.. ({self.name}) *", color=Color.WHITE)
+            logger.print(prefix="Model", message=f"No local model to unload. Model is served remotely ({self.base_url}).", color=Color.YELLOW)
+            self._http.close()
+
+    def loaded(self) -> bool:
+        """Check if model is loaded"""
+        return self.name is not None
+
+    def configuration(self) -> dict:
+        """Get model configuration"""
+        with Logger(self._log_level):
+            config = {
+                "engine": self.engine,
+                "base_url": self.base_url,
+                "model": self.name,
+                "inference_config": self._translate_generation_config(),
+            }
+            return config
+
+    def reset(self) -> None:
+        """Reset model chat history."""
+        self.history = []
@@ -0,0 +1,483 @@
+from ......core.utils.types import Compatibility, Contract
+
+
+def generate_standard_contract(name: str, description: str) -> Contract:
+    """Generate a standard contract for the model."""
+    return {
+        "name": name,
+        "description": description,
+        "methods": [
+            {
+                "name": "__init__",
+                "description": f"Initialize {name} model with specified engine and configuration",
+                "arguments": [
+                    {
+                        "name": "credentials",
+                        "type": "str | Dict",
+                        "schema": {},
+                        "description": "API key of the server (defaults to $OPENAI_API_KEY), or dictionary with api_key and extra request headers. Optional for servers without authentication",
+                        "required": False,
+                    },
+                    {
+                        "name": "verbose",
+                        "type": "bool | str",
+                        "schema": {
+                            "enum": [
+                                "DEFAULT",
+                                "NONE",
+                                "INFO",
+                                "DEBUG",
+                            ]
+                        },
+                        "description": "Verbose output",
+                        "required": False,
+                    },
+                    {
+                        "name": "configuration",
+                        "type": "Dict",
+                        "schema": {
+                            "nested": [
+                                {
+                                    "name": "base_url",
+                                    "type": "str",
+                                    "schema": {"pattern": "^https?://"},
+                                    "description": "Base URL of the OpenAI-compatible API, eg. http://localhost:8000/v1 (defaults to $OPENAI_BASE_URL, or http://localhost:8000/v1)",
+                                    "required": False,
+                                },
+                                {
+                                    "name": "model",
+                                    "type": "str",
+                                    "schema": {},
+                                    "description": "Id of the served model to use (defaults to the first model listed by the server)",
+                                    "required": False,
+                                },
+                                {
+                                    "name": "max_connections",
+                                    "type": "int",
+                                    "schema": {"pattern": "^[1-9][0-9]*$"},
+                                    "description": "Maximum number of pooled keep-alive connections, and of concurrent requests (batches, candidates)",
+                                    "required": False,
+                                },
+                                {
+                                    "name": "timeout",
+                                    "type": "float",
+                                    "schema": {"pattern": "^[0-9]+(.[0-9]+)?$"},
+                                    "description": "Request timeout, in seconds",
+                                    "required": False,
+                                },
+                                {
+                                    "name": "models_ttl",
+                                    "type": "float",
+                                    "schema": {"pattern": "^[0-9]+(.[0-9]+)?$"},
+                                    "description": "Time to live of the cached list of served models, in seconds",
+                                    "required": False,
+                                },
+                                {
+                                    "name": "history",
+                                    "type": "Dict",
+                                    "schema": {
+                                        "nested": [
+                                            {
+                                                "name": "max_tokens",
+                                                "type": "int",
+                                                "schema": {"pattern": "^[1-9][0-9]*$"},
+                                                "description": "Token budget of the prompt (history and new messages)",
+                                                "required": True,
+                                            },
+                                            {
+                                                "name": "strategy",
+                                                "type": "str",
+                                                "schema": {"pattern": "^(drop|summarize)$"},
+                                                "description": "How to handle the oldest turns outside of the budget (system messages are always kept)",
+                                                "required": False,
+                                            },
+                                            {
+                                                "name": "summary_max_length",
+                                                "type": "int",
+                                                "schema": {"pattern": "^[0-9]+$"},
+                                                "description": "Maximum length of the summary of dropped turns (summarize strategy)",
+                                                "required": False,
+                                            },
+                                        ]
+                                    },
+                                    "description": "History windowing configuration, bounding the prompt to a token budget",
+                                    "required": False,
+                                },
+                            ]
+                        },
+                        "description": "Optional configuration dictionary for the server, connections, history and other settings",
+                        "required": False,
+                    },
+                ],
+                "outputs": [
+                    {
+                        "type": "None",
+                        "schema": {},
+                        "description": "No return value",
+                        "required": True,
+                    }
+                ],
+            },
+            {
+                "name": "process",
+                "description": "Process input through the model",
+                "arguments": [
+                    {
+                        "name": "input",
+                        "type": "str | List[Message]",
+                        "schema": {
+                            "nested": [
+                                {
+                                    "name": "role",
+                                    "type": "str",
+                                    "schema": {"pattern": "^(system|user|assistant)$"},
+                                    "description": "The role of the message sender",
+                                    "required": True,
+                                },
+                                {
+                                    "name": "content",
+                                    "type": "str",
+                                    "schema": {},
+                                    "description": "The content of the message",
+                                    "required": True,
+                                },
+                            ]
+                        },
+                        "description": "Input string or list of messages in chat format",
+                        "required": True,
+                    },
+                    {
+                        "name": "context",
+                        "type": "List[Any | PinnedContext] | PinnedContext",
+                        "schema": {},
+                        "description": "Optional context items to prepend as system messages, and/or pinned context handles (see `pin_context`). Context is never remembered in history",
+                        "required": False,
+                    },
+                    {
+                        "name": "configuration",
+                        "type": "Dict",
+                        "schema": {
+                            "nested": [
+                                {
+                                    "name": "max_new_tokens",
+                                    "type": "int",
+                                    "schema": {"maxLength": 2048},
+                                    "description": "Maximum number of tokens to generate",
+                                    "required": False,
+                                },
+                                {
+                                    "name": "temperature",
+                                    "type": "float",
+                                    "schema": {"pattern": "^[0-9]+(.[0-9]+)?$"},
+                                    "description": "Sampling temperature (higher = more random)",
+                                    "required": False,
+                                },
+                                {
+                                    "name": "top_p",
+                                    "type": "float",
+                                    "schema": {"pattern": "^[0-9]+(.[0-9]+)?$"},
+                                    "description": "Nucleus sampling probability threshold",
+                                    "required": False,
+                                },
+                                {
+                                    "name": "top_k",
+                                    "type": "int",
+                                    "schema": {"pattern": "^[0-9]+$"},
+                                    "description": "Top-k sampling threshold",
+                                    "required": False,
+                                },
+                                {
+                                    "name": "do_sample",
+                                    "type": "bool",
+                                    "schema": {},
+                                    "description": "Whether to use sampling (False = greedy)",
+                                    "required": False,
+                                },
+                                {
+                                    "name": "repetition_penalty",
+                                    "type": "float",
+                                    "schema": {"pattern": "^[0-9]+(.[0-9]+)?$"},
+                                    "description": "Penalty for repeating tokens",
+                                    "required": False,
+                                },
+                                {
+                                    "name": "n",
+                                    "type": "int",
+                                    "schema": {"pattern": "^[1-9][0-9]*$"},
+                                    "description": "Number of candidates to sample from a single prompt (returns a list of candidates when greater than 1)",
+                                    "required": False,
+                                },
+                                {
+                                    "name": "reasoning",
+                                    "type": "str | Dict",
+                                    "schema": {"pattern": "^(keep|strip|summarize)$"},
+                                    "description": "Reasoning trace policy for reasoning models (keep, strip, or summarize traces before they enter history), or dictionary with policy, start_tag, end_tag and summary_max_length",
+                                    "required": False,
+                                },
+                            ]
+                        },
+                        "description": "Optional generation configuration parameters",
+                        "required": False,
+                    },
+                    {
+                        "name": "remember",
+                        "type": "bool",
+                        "schema": {},
+                        "description": "Whether to remember this interaction in history",
+                        "required": False,
+                    },
+                    {
+                        "name": "stream",
+                        "type": "bool",
+                        "schema": {},
+                        "description": "Whether to stream the output from the server, printing it as it is generated",
+                        "required": False,
+                    },
+                ],
+                "outputs": [
+                    {
+                        "type": "Tuple[str, Dict]",
+                        "schema": {
+                            "nested": [
+                                {
+                                    "name": "response",
+                                    "type": "str | List[str]",
+                                    "schema": {},
+                                    "description": "Generated text response (or list of candidate responses when n is greater than 1)",
+                                    "required": True,
+                                },
+                                {
+                                    "name": "logs",
+                                    "type": "Dict",
+                                    "schema": {
+                                        "nested": [
+                                            {
+                                                "name": "engine",
+                                                "type": "str",
+                                                "schema": {"pattern": "^openai$"},
+                                                "description": "Engine used for generation",
+                                                "required": True,
+                                            },
+                                            {
+                                                "name": "logprobs",
+                                                "type": "List[float | None]",
+                                                "schema": {},
+                                                "description": "Log-probability of each candidate response (when n is greater than 1)",
+                                                "required": False,
+                                            },
+                                            {
+                                                "name": "reasoning",
+                                                "type": "str | List[str]",
+                                                "schema": {},
+                                                "description": "Reasoning traces separated from the response (reasoning models)",
+                                                "required": False,
+                                            },
+                                        ]
+                                    },
+                                    "description": "Processing logs and metadata",
+                                    "required": True,
+                                },
+                            ]
+                        },
+                        "description": "Generated response and processing logs",
+                        "required": True,
+                    }
+                ],
+            },
+            {
+                "name": "process_batch",
+                "description": "Process independent inputs concurrently over pooled connections (up to `max_connections` requests in flight), without history",
+                "arguments": [
+                    {
+                        "name": "inputs",
+                        "type": "List[str | List[Message]]",
+                        "schema": {},
+                        "description": "Inputs to process, each as an input string or list of messages in chat format",
+                        "required": True,
+                    },
+                    {
+                        "name": "context",
+                        "type": "List[Any | PinnedContext] | PinnedContext",
+                        "schema": {},
+                        "description": "Optional context shared by all inputs (see `process`)",
+                        "required": False,
+                    },
+                    {
+                        "name": "configuration",
+                        "type": "Dict",
+                        "schema": {},
+                        "description": "Optional generation configuration parameters shared by all inputs (see `process`)",
+                        "required": False,
+                    },
+                ],
+                "outputs": [
+                    {
+                        "type": "List[Tuple[str | List[str], Dict]]",
+                        "schema": {},
+                        "description": "Generated responses and processing logs, in the order of the inputs",
+                        "required": True,
+                    }
+                ],
+            },
+            {
+                "name": "models",
+                "description": "List the models served by the server (cached for `models_ttl` seconds)",
+                "arguments": [
+                    {
+                        "name": "refresh",
+                        "type": "bool",
+                        "schema": {},
+                        "description": "Whether to bypass the cached list",
+                        "required": False,
+                    }
+                ],
+                "outputs": [
+                    {
+                        "type": "List[str]",
+                        "schema": {},
+                        "description": "Ids of the served models",
+                        "required": True,
+                    }
+                ],
+            },
+            {
+                "name": "pin_context",
+                "description": "Render context items once, and get a handle to reference them in later `process` calls. Pinned context goes first in the prompt so that it is reused as a prefix",
+                "arguments": [
+                    {
+                        "name": "items",
+                        "type": "List[Any]",
+                        "schema": {},
+                        "description": "Context items to pin as system messages",
+                        "required": True,
+                    }
+                ],
+                "outputs": [
+                    {
+                        "type": "PinnedContext",
+                        "schema": {},
+                        "description": "Pinned context handle (evict)",
+                        "required": True,
+                    }
+                ],
+            },
+            {
+                "name": "session",
+                "description": "Open a conversation session over the model, with its own history. Sessions share the loaded model and can be processed concurrently (`session.process(...)` remembers interactions and keeps the model loaded by default)",
+                "arguments": [],
+                "outputs": [
+                    {
+                        "type": "Session",
+                        "schema": {},
+                        "description": "Session handle (process, reset, evict)",
+                        "required": True,
+                    }
+                ],
+            },
+            {
+                "name": "load",
+                "description": "Load model into memory based on engine type",
+                "arguments": [],
+                "outputs": [
+                    {
+                        "type": "None",
+                        "schema": {},
+                        "description": "No return value",
+                        "required": True,
+                    }
+                ],
+            },
+            {
+                "name": "unload",
+                "description": "Unload model from memory and free resources (closes pooled connections)",
+                "arguments": [],
+                "outputs": [
+                    {
+                        "type": "None",
+                        "schema": {},
+                        "description": "No return value",
+                        "required": True,
+                    }
+                ],
+            },
+            {
+                "name": "loaded",
+                "description": "Check if model is loaded",
+                "arguments": [],
+                "outputs": [
+                    {
+                        "type": "bool",
+                        "schema": {},
+                        "description": "True if model is loaded, False otherwise",
+                        "required": True,
+                    }
+                ],
+            },
+            {
+                "name": "configuration",
+                "description": "Get a copy of the model's configuration",
+                "arguments": [],
+                "outputs": [
+                    {
+                        "type": "Dict",
+                        "schema": {},
+                        "description": "A copy of the model's configuration",
+                        "required": True,
+                    }
+                ],
+            },
+            {
+                "name": "reset",
+                "description": "Reset model chat history",
+                "arguments": [],
+                "outputs": [
+                    {
+                        "type": "None",
+                        "schema": {},
+                        "description": "No return value",
+                        "required": True,
+                    }
+                ],
+            },
+            {
+                "name": "contract",
+                "description": "Get a copy of the model's contract specification, which describes its capabilities, methods, and interfaces. This is useful for programmatically understanding the model's features and requirements.",
+                "arguments": [],
+                "outputs": [
+                    {
+                        "type": "Contract",
+                        "schema": {},
+                        "description": "A copy of the model's contract specification",
+                        "required": True,
+                    }
+                ],
+            },
+            {
+                "name": "compatibility",
+                "description": "Get a copy of the model's compatibility specifications, detailing supported engines, quantization methods, devices, memory requirements, and dependencies. This helps determine if the model can run in a given environment.",
+                "arguments": [],
+                "outputs": [
+                    {
+                        "type": "List[Compatibility]",
+                        "schema": {},
+                        "description": "A list of the model's compatibility specifications",
+                        "required": True,
+                    }
+                ],
+            },
+        ],
+    }
+
+
+def generate_standard_compatibility() -> list[Compatibility]:
+    """Generate a standard compatibility list for the model."""
+    return [
+        {
+            "engine": "openai",
+            "quantization": None,
+            "devices": ["cloud"],
+            "memory": 0.0,
+            "dependencies": [],
+            "precision": 32,
+        }
+    ]
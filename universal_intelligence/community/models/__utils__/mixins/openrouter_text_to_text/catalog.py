@@ -0,0 +1,190 @@
+"""
+Catalog of remote models: one table (`catalog.json`) instead of one package per OpenRouter model.
+
+Each model is a row of the table (module, name, description, and the configuration it overrides from the defaults).
+Listing and filtering models only reads the table, and model classes are generated on first access, by an import hook
+serving the `remote.<model>` packages (`__init__`, `model` and `test` modules) from the table, so that the import paths
+of the models are unchanged.
+
+To list the remote models from the project root run:
+   python -m universal_intelligence.community.models.__utils__.mixins.openrouter_text_to_text.catalog --search deepseek --free
+"""
+
+import argparse
+import copy
+import importlib
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import json
+import os
+import sys
+from functools import cache, lru_cache
+from typing import Any
+
+from .types import CatalogEntry
+
+CATALOG_PATH = os.path.join(os.path.dirname(__file__), "catalog.json")
+
+# Package of the remote models (e.g. universal_intelligence.community.models.remote)
+REMOTE_PACKAGE = __name__.split(".__utils__.")[0] + ".remote"
+
+_PACKAGE_SOURCE = '''"""
+This module contains implementations of Universal Intelligence models.
+"""
+
+from .model import UniversalModel
+
+__all__ = ["UniversalModel"]
+'''
+
+_MODEL_SOURCE = """from ...__utils__.mixins.openrouter_text_to_text.catalog import model_class
+
+UniversalModel = model_class({model!r})
+"""
+
+_TEST_SOURCE = '''"""
+Test script for {name} model configurations.
+
+To run this script from the project root run:
+   python -m {package}.{model}.test
+"""
+
+from ...__utils__.test import run_all_tests
+from .model import UniversalModel
+
+if __name__ == "__main__":
+    run_all_tests(UniversalModel)
+'''
+
+
+@lru_cache(maxsize=1)
+def load_catalog() -> dict[str, Any]:
+    """Load the catalog table (defaults, and models by module name)."""
+    with open(CATALOG_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _entry(model: str) -> CatalogEntry:
+    table = load_catalog()
+    row = table["models"][model]
+    return {
+        "model": model,
+        "name": row["name"],
+        "description": row["description"],
+        "reasoning": row.get("reasoning", False),
+        "inference_configuration": copy.deepcopy(row.get("inference_configuration", table["defaults"]["inference_configuration"])),
+    }
+
+
+def catalog() -> list[CatalogEntry]:
+    """Get the catalog entries of the remote models, sorted by model module name (without importing the models)."""
+    return [_entry(model) for model in sorted(load_catalog()["models"])]
+
+
+def query(search: str | None = None, reasoning: bool | None = None, free: bool | None = None) -> list[CatalogEntry]:
+    """Find remote models in the catalog (without importing the models).
+
+    Args:
+        search: Case-insensitive text to find in the module name, name or description of the models (default: any)
+        reasoning: Whether the models filter reasoning traces (default: any)
+        free: Whether the models are free (`:free` variants) (default: any)
+
+    Returns:
+        Matching entries, sorted by model module name
+    """
+    matches = []
+    for entry in catalog():
+        text = f"{entry['model']} {entry['name']} {entry['description']}".lower()
+        if search is not None and search.lower() not in text:
+            continue
+        if reasoning is not None and entry["reasoning"] != reasoning:
+            continue
+        if free is not None and entry["name"].endswith(":free") != free:
+            continue
+        matches.append(entry)
+    return matches
+
+
+@cache
+def model_class(model: str) -> type:
+    """Generate the class of a remote model from its catalog entry (once per model, so that the class is unique).
+
+    Args:
+        model: Remote model module name (e.g. deepseek_r1__free)
+    """
+    if model not in load_catalog()["models"]:
+        raise ValueError(f"[catalog:model_class] Unknown remote model: {model}")
+    from .model import CatalogModel
+
+    entry = _entry(model)
+    attributes = {
+        "__module__": f"{REMOTE_PACKAGE}.{model}.model",
+        "__qualname__": "UniversalModel",
+        "_name": entry["name"],
+        "_description": entry["description"],
+        "_inference_configuration": entry["inference_configuration"],
+    }
+    if entry["reasoning"]:
+        attributes["_reasoning_configuration"] = copy.deepcopy(load_catalog()["defaults"]["reasoning_configuration"])
+    return type("UniversalModel", (CatalogModel,), attributes)
+
+
+class RemoteModelFinder(importlib.abc.MetaPathFinder, importlib.abc.InspectLoader):
+    """Import hook serving the packages of the remote models in the catalog (`remote.<model>`, `.model` and `.test`)."""
+
+    def _split(self, fullname: str) -> tuple[str, str] | None:
+        if not fullname.startswith(f"{REMOTE_PACKAGE}."):
+            return None
+        model, _, submodule = fullname[len(REMOTE_PACKAGE) + 1 :].partition(".")
+        if model not in load_catalog()["models"] or submodule not in ("", "model", "test"):
+            return None
+        return model, submodule
+
+    def find_spec(self, fullname: str, path: Any = None, target: Any = None) -> importlib.machinery.ModuleSpec | None:
+        parts = self._split(fullname)
+        if parts is None:
+            return None
+        return importlib.util.spec_from_loader(fullname, self, is_package=not parts[1])
+
+    def is_package(self, fullname: str) -> bool:
+        parts = self._split(fullname)
+        if parts is None:
+            raise ImportError(f"[RemoteModelFinder:is_package] Unknown module: {fullname}", name=fullname)
+        return not parts[1]
+
+    def get_source(self, fullname: str) -> str:
+        parts = self._split(fullname)
+        if parts is None:
+            raise ImportError(f"[RemoteModelFinder:get_source] Unknown module: {fullname}", name=fullname)
+        model, submodule = parts
+        if submodule == "model":
+            return _MODEL_SOURCE.format(model=model)
+        if submodule == "test":
+            return _TEST_SOURCE.format(name=load_catalog()["models"][model]["name"], package=REMOTE_PACKAGE, model=model)
+        return _PACKAGE_SOURCE
+
+    def get_code(self, fullname: str) -> Any:
+        return self.source_to_code(self.get_source(fullname), f"<{fullname}>")
+
+
+def install() -> None:
+    """Install the import hook of the remote models (once per process)."""
+    if not any(isinstance(finder, RemoteModelFinder) for finder in sys.meta_path):
+        sys.meta_path.append(RemoteModelFinder())
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="List the remote models of the catalog")
+    parser.add_argument("--search", help="Text to find in the module name, name or description of the models")
+    parser.add_argument("--reasoning", action=argparse.BooleanOptionalAction, help="Only models filtering reasoning traces (or not, with --no-reasoning)")
+    parser.add_argument("--free", action=argparse.BooleanOptionalAction, help="Only free models (or paid models, with --no-free)")
+    args = parser.parse_args(argv)
+
+    for entry in query(args.search, args.reasoning, args.free):
+        reasoning = ", reasoning" if entry["reasoning"] else ""
+        print(f"{entry['model']}: {entry['name']}{reasoning}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,11 @@ import requests
 from ......community.__utils__.logger import Color, Logger, LogLevel
 from ......core.universal_model import AbstractUniversalModel
 from ......core.utils.types import Message
-from .types import InferenceConfiguration
+from ...context import PinnedContext, split_context
+from ...history import HistoryWindow
+from ...reasoning import ReasoningTraceFilter, apply_reasoning_policy, split_reasoning
+from ...session import Session
+from .types import InferenceConfiguration, ReasoningConfiguration
 
 
 class UniversalModelMixin(AbstractUniversalModel):
@@ -16,6 +20,7 @@ class UniversalModelMixin(AbstractUniversalModel):
         interface_config: dict,
         credentials: str | dict | None = None,
         verbose: bool | str = "DEFAULT",
+        configuration: dict | None = None,
     ) -> None:
         """Initialize the model with specified engine and configuration."""
         self._log_level = LogLevel.NONE
@@ -67,10 +72,18 @@ class UniversalModelMixin(AbstractUniversalModel):
             logger.print(prefix="Model", message="Setting up model configuration..")
             self._credentials = credentials
             self._inference_configuration: InferenceConfiguration = interface_config["inference_configuration"]
+            self._reasoning_configuration: ReasoningConfiguration | None = interface_config.get("reasoning_configuration")
             self.name = interface_config["name"]
             self.engine = "openrouter"
+            self._logprobs_supported = True  # until the provider rejects them (see `_request_completion()`)
 
+            self.config = configuration or {}
             self.history = []
+
+            # Window history to a token budget if configured (e.g. {"max_tokens": 4096, "strategy": "summarize"}), token counts are estimated
+            history_configuration = self.config.get("history")
+            self._history_window = HistoryWindow(**history_configuration) if history_configuration else None
+
             logger.print(prefix="Model", message=f"Initialized remote model: {self.name}", color=Color.MAGENTA)
             logger.print(prefix="Model", message=f"Device: cloud, Engine: {self.engine}\n", color=Color.MAGENTA)
 
@@ -145,8 +158,80 @@ class UniversalModelMixin(AbstractUniversalModel):
 
         return result
 
+    def _request_completion(self, messages: list[Message], generation_config: dict) -> dict:
+        """Request a chat completion from OpenRouter.
+
+        Requests for logprobs rejected by the provider (4xx) are retried without them, and logprobs are no longer
+        requested from this model once the retry succeeds.
+        """
+
+        def post(config: dict) -> requests.Response:
+            return requests.post(
+                url="https://openrouter.ai/api/v1/chat/completions",
+                headers={
+                    "Authorization": f"Bearer {self._credentials['api_key']}",
+                    "HTTP-Referer": self._credentials["http_referrer"] if "http_referrer" in self._credentials else "",
+                    "X-Title": self._credentials["x_title"] if "x_title" in self._credentials else "",
+                    "Content-Type": "application/json",
+                },
+                data=json.dumps({"model": self.name, "messages": messages, **config}),
+            )
+
+        response = post(generation_config)
+        if generation_config.get("logprobs") and 400 <= response.status_code < 500:
+            response = post({key: value for key, value in generation_config.items() if key != "logprobs"})
+            if response.status_code < 400:
+                self._logprobs_supported = False
+
+        if response.status_code >= 400:
+            raise ValueError("[UniversalModelMixin:process] Error generating output.")
+
+        return response.json()
+
+    def _extract_logprob(self, choice: dict) -> float | None:
+        """Sum the token logprobs of a completion choice, if returned by the provider."""
+        logprobs = (choice.get("logprobs") or {}).get("content")
+        if not logprobs:
+            return None
+        return sum(token["logprob"] for token in logprobs)
+
+    def _resolve_reasoning_configuration(self, configuration: dict) -> ReasoningConfiguration | None:
+        """Resolve the reasoning trace policy from the model defaults and inference configuration (in order of precedence)."""
+        reasoning = dict(self._reasoning_configuration or {})
+        override = configuration.pop("reasoning", None)
+        if isinstance(override, str):
+            reasoning["policy"] = override
+        elif isinstance(override, dict):
+            reasoning.update(override)
+        return reasoning if reasoning.get("policy") else None
+
+    def _separate_reasoning(self, message: dict, reasoning: ReasoningConfiguration) -> ReasoningTraceFilter:
+        """Separate the reasoning trace from a completion message, whether inlined in its content or returned separately by the provider."""
+        start_tag, end_tag = reasoning.get("start_tag", "<think>"), reasoning.get("end_tag", "</think>")
+        content = message["content"] or ""
+        if message.get("reasoning"):
+            content = f"{start_tag}{message['reasoning']}{end_tag}{content}"
+        return split_reasoning(content, start_tag, end_tag)
+
     def process(self, input: str | list[Message], context: list[Any] | None = None, configuration: dict | None = None, remember: bool = False, keep_alive: bool = False, stream: bool = False) -> tuple[Any, dict]:
         """Process input through the model."""
+        return self._process(input, context=context, configuration=configuration, remember=remember, keep_alive=keep_alive)
+
+    def pin_context(self, items: list[Any]) -> PinnedContext:
+        """Render context items once, and get a handle to reference them in later calls (`context=[handle, ...]`).
+
+        Pinned context goes first in the prompt, so that providers caching prompt prefixes can reuse it.
+        """
+        if not items:
+            raise ValueError("[UniversalModelMixin:pin_context] Context items are required")
+        return PinnedContext(self, items)
+
+    def session(self) -> Session:
+        """Open a conversation session over this model, with its own history."""
+        return Session(self)
+
+    def _process(self, input: str | list[Message], context: list[Any] | None = None, configuration: dict | None = None, remember: bool = False, keep_alive: bool = False, session: Session | None = None) -> tuple[Any, dict]:
+        """Process input through the model, within a session's history if provided (model history otherwise)."""
         with Logger(self._log_level) as logger:
             logger.print(message=f"* Invoking remote model.. ({self.name}) *\n", color=Color.WHITE)
             if not input:
@@ -154,16 +239,27 @@ class UniversalModelMixin(AbstractUniversalModel):
 
             logger.print(prefix="Model", message="Translating input..", color=Color.GRAY)
 
+            # Extract the number of candidates to sample
+            configuration = dict(configuration or {})
+            n = int(configuration.pop("n", 1))
+            if n < 1:
+                raise ValueError(f"Invalid n value: {n} (must be a positive integer)")
+
+            # Resolve the reasoning trace policy
+            reasoning = self._resolve_reasoning_configuration(configuration)
+
             # Convert input to messages format if string
-            messages = input if isinstance(input, list) else [{"role": "user", "content": input}]
+            input_messages = input if isinstance(input, list) else [{"role": "user", "content": input}]
 
-            # Add context if provided
-            if context:
-                messages = [{"role": "system", "content": str(ctx)} for ctx in context] + messages
+            # Add context if provided, pinned context blocks go first (stable prompt prefix)
+            pinned_messages, context_messages = split_context(self, context)
+            messages = context_messages + input_messages
 
-            # Add history to current messages
-            if self.history:
-                messages = self.history + messages
+            # Add history to current messages, windowed to the token budget if configured
+            history = session.history if session else self.history
+            if history and self._history_window:
+                history = self._history_window.fit(history, pinned_messages + messages)
+            messages = pinned_messages + history + messages
 
             logger.print(prefix="Model", message=f"Translated input: {messages}", color=Color.GRAY, debug=True)
 
@@ -174,34 +270,58 @@ class UniversalModelMixin(AbstractUniversalModel):
             logger.print(prefix="Model", message="Generating output..", color=Color.CYAN)
 
             # Process input through OpenRouter
-            response = requests.post(
-                url="https://openrouter.ai/api/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self._credentials['api_key']}",
-                    "HTTP-Referer": self._credentials["http_referrer"] if "http_referrer" in self._credentials else "",
-                    "X-Title": self._credentials["x_title"] if "x_title" in self._credentials else "",
-                    "Content-Type": "application/json",
-                },
-                data=json.dumps({"model": self.name, "messages": messages, **generation_config}),
-            )
-
-            if response.status_code >= 400:
+            if n > 1:
+                # Request all candidates at once, providers which support it share the prompt prefill
+                generation_config = {**generation_config, "n": n, **({"logprobs": True} if self._logprobs_supported else {})}
+            try:
+                choices = self._request_completion(messages, generation_config)["choices"]
+
+                # Complete with individual requests if the provider returned fewer candidates
+                while len(choices) < n:
+                    extra_choices = self._request_completion(messages, {**generation_config, "n": n - len(choices)})["choices"]
+                    if not extra_choices:
+                        raise ValueError("[UniversalModelMixin:process] Error generating output.")
+                    choices += extra_choices
+            except ValueError:
                 logger.print(prefix="Model", message="Error generating output.", color=Color.RED)
-                raise ValueError("[UniversalModelMixin:process] Error generating output.")
-
-            # Extract output from response
-            output = (response.json())["choices"][0]["message"]["content"]
+                raise
 
             logger.print(prefix="Model", message="Generating output..", color=Color.GRAY, replace_last_line=True)
             logger.print(prefix="Model", message="Generation complete", color=Color.GREEN)
 
-            # Update history if remember is True
+            logs = {"engine": self.engine}
+            choices = choices[:n]
+            outputs = [(choice["message"]["content"], choice["message"]["content"]) for choice in choices]
+
+            # Apply the reasoning trace policy, traces are only exposed in the logs
+            if reasoning:
+                text_filters = [self._separate_reasoning(choice["message"], reasoning) for choice in choices]
+                outputs = [apply_reasoning_policy(text_filter, reasoning["policy"], reasoning.get("summary_max_length", 500)) for text_filter in text_filters]
+                traces = [text_filter.trace for text_filter in text_filters]
+                if n > 1:
+                    logs["reasoning"] = traces
+                elif traces[0]:
+                    logs["reasoning"] = traces[0]
+
+            output, remembered = outputs[0]
+            if n > 1:
+                # Remember the most likely candidate when sampling several
+                logprobs = [self._extract_logprob(choice) for choice in choices]
+                best = max(range(n), key=lambda i: logprobs[i] if logprobs[i] is not None else float("-inf"))
+                output, remembered = [response for response, _ in outputs], outputs[best][1]
+                logs["logprobs"] = logprobs
+
+            # Update history if remember is True, context is never duplicated into history
             if remember:
-                self.history = [*messages, {"role": "assistant", "content": output}]
+                history = [*history, *input_messages, {"role": "assistant", "content": remembered}]
+                if session:
+                    session.history = history
+                else:
+                    self.history = history
 
-            logger.print(prefix="Model", message=f"Response: {response}", color=Color.GRAY, debug=True)
+            logger.print(prefix="Model", message=f"Response: {output}", color=Color.GRAY, debug=True)
 
-            return output, {"engine": self.engine}
+            return output, logs
 
     def load(self) -> None:
         """Load model into memory based on engine type."""
@@ -32,6 +32,47 @@ def generate_standard_contract(name: str, description: str) -> Contract:
                         "description": "Verbose output",
                         "required": False,
                     },
+                    {
+                        "name": "configuration",
+                        "type": "Dict",
+                        "schema": {
+                            "nested": [
+                                {
+                                    "name": "history",
+                                    "type": "Dict",
+                                    "schema": {
+                                        "nested": [
+                                            {
+                                                "name": "max_tokens",
+                                                "type": "int",
+                                                "schema": {"pattern": "^[1-9][0-9]*$"},
+                                                "description": "Token budget of the prompt (history and new messages)",
+                                                "required": True,
+                                            },
+                                            {
+                                                "name": "strategy",
+                                                "type": "str",
+                                                "schema": {"pattern": "^(drop|summarize)$"},
+                                                "description": "How to handle the oldest turns outside of the budget (system messages are always kept)",
+                                                "required": False,
+                                            },
+                                            {
+                                                "name": "summary_max_length",
+                                                "type": "int",
+                                                "schema": {"pattern": "^[0-9]+$"},
+                                                "description": "Maximum length of the summary of dropped turns (summarize strategy)",
+                                                "required": False,
+                                            },
+                                        ]
+                                    },
+                                    "description": "History windowing configuration, bounding the prompt to a token budget",
+                                    "required": False,
+                                },
+                            ]
+                        },
+                        "description": "Optional configuration dictionary for history and other settings",
+                        "required": False,
+                    },
                 ],
                 "outputs": [
                     {
@@ -72,9 +113,9 @@ def generate_standard_contract(name: str, description: str) -> Contract:
                     },
                     {
                         "name": "context",
-                        "type": "List[Any]",
+                        "type": "List[Any | PinnedContext] | PinnedContext",
                         "schema": {},
-                        "description": "Optional context items to prepend as system messages",
+                        "description": "Optional context items to prepend as system messages, and/or pinned context handles (see `pin_context`). Context is never remembered in history",
                         "required": False,
                     },
                     {
@@ -124,6 +165,20 @@ def generate_standard_contract(name: str, description: str) -> Contract:
                                     "description": "Penalty for repeating tokens",
                                     "required": False,
                                 },
+                                {
+                                    "name": "n",
+                                    "type": "int",
+                                    "schema": {"pattern": "^[1-9][0-9]*$"},
+                                    "description": "Number of candidates to sample from a single prompt (returns a list of candidates when greater than 1)",
+                                    "required": False,
+                                },
+                                {
+                                    "name": "reasoning",
+                                    "type": "str | Dict",
+                                    "schema": {"pattern": "^(keep|strip|summarize)$"},
+                                    "description": "Reasoning trace policy for reasoning models (keep, strip, or summarize traces before they enter history), or dictionary with policy, start_tag, end_tag and summary_max_length",
+                                    "required": False,
+                                },
                             ]
                         },
                         "description": "Optional generation configuration parameters",
@@ -144,9 +199,9 @@ def generate_standard_contract(name: str, description: str) -> Contract:
                             "nested": [
                                 {
                                     "name": "response",
-                                    "type": "str",
+                                    "type": "str | List[str]",
                                     "schema": {},
-                                    "description": "Generated text response",
+                                    "description": "Generated text response (or list of candidate responses when n is greater than 1)",
                                     "required": True,
                                 },
                                 {
@@ -161,6 +216,20 @@ def generate_standard_contract(name: str, description: str) -> Contract:
                                                 "description": "Engine used for generation",
                                                 "required": True,
                                             },
+                                            {
+                                                "name": "logprobs",
+                                                "type": "List[float | None]",
+                                                "schema": {},
+                                                "description": "Log-probability of each candidate response (when n is greater than 1)",
+                                                "required": False,
+                                            },
+                                            {
+                                                "name": "reasoning",
+                                                "type": "str | List[str]",
+                                                "schema": {},
+                                                "description": "Reasoning traces separated from the response (reasoning models)",
+                                                "required": False,
+                                            },
                                         ]
                                     },
                                     "description": "Processing logs and metadata",
@@ -173,6 +242,40 @@ def generate_standard_contract(name: str, description: str) -> Contract:
                     }
                 ],
             },
+            {
+                "name": "pin_context",
+                "description": "Render context items once, and get a handle to reference them in later `process` calls. Pinned context goes first in the prompt so that it is reused as a prefix",
+                "arguments": [
+                    {
+                        "name": "items",
+                        "type": "List[Any]",
+                        "schema": {},
+                        "description": "Context items to pin as system messages",
+                        "required": True,
+                    }
+                ],
+                "outputs": [
+                    {
+                        "type": "PinnedContext",
+                        "schema": {},
+                        "description": "Pinned context handle (evict)",
+                        "required": True,
+                    }
+                ],
+            },
+            {
+                "name": "session",
+                "description": "Open a conversation session over the model, with its own history. Sessions share the loaded model and can be processed concurrently (`session.process(...)` remembers interactions and keeps the model loaded by default)",
+                "arguments": [],
+                "outputs": [
+                    {
+                        "type": "Session",
+                        "schema": {},
+                        "description": "Session handle (process, reset, evict)",
+                        "required": True,
+                    }
+                ],
+            },
             {
                 "name": "load",
                 "description": "Load model into memory based on engine type",
@@ -0,0 +1,39 @@
+from typing import ClassVar
+
+from ......core.utils.types import Compatibility, Contract
+from .interface import UniversalModelMixin
+from .meta import generate_standard_compatibility, generate_standard_contract
+from .types import InferenceConfiguration, ReasoningConfiguration
+
+
+class CatalogModel(UniversalModelMixin):
+    """Base class of the remote models generated from the catalog (see `catalog.model_class()`)."""
+
+    _name: ClassVar[str]
+    _description: ClassVar[str]
+
+    _inference_configuration: ClassVar[InferenceConfiguration]
+
+    _reasoning_configuration: ClassVar[ReasoningConfiguration | None] = None
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize model with specified engine and configuration."""
+        interface_config = {
+            "name": self._name,
+            "inference_configuration": self._inference_configuration,
+        }
+        if self._reasoning_configuration:
+            interface_config["reasoning_configuration"] = self._reasoning_configuration
+        super().__init__(
+            interface_config=interface_config,
+            *args,
+            **kwargs,
+        )
+
+    @classmethod
+    def contract(cls) -> Contract:
+        return generate_standard_contract(cls._name, cls._description)
+
+    @classmethod
+    def compatibility(cls) -> list[Compatibility]:
+        return generate_standard_compatibility()
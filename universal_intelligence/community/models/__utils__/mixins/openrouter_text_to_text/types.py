@@ -12,3 +12,21 @@ class QuantizationSettings(TypedDict):
     min_precision: Literal["2bit", "3bit", "4bit", "5bit", "6bit", "8bit", "16bit", "32bit"] | None
     max_precision: Literal["2bit", "3bit", "4bit", "5bit", "6bit", "8bit", "16bit", "32bit"] | None
     max_memory_allocation: float | None
+
+
+class ReasoningConfiguration(TypedDict, total=False):
+    policy: Literal["keep", "strip", "summarize"]
+    start_tag: str
+    end_tag: str
+    summary_max_length: int
+
+
+# Catalog types
+
+
+class CatalogEntry(TypedDict):
+    model: str  # remote model module (e.g. deepseek_r1__free)
+    name: str  # OpenRouter model id (e.g. deepseek/deepseek-r1:free)
+    description: str
+    reasoning: bool  # whether reasoning traces are filtered (see `ReasoningConfiguration`)
+    inference_configuration: InferenceConfiguration
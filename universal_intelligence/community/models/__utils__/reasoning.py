@@ -0,0 +1,138 @@
+"""
+Shared reasoning trace utilities for Universal Models.
+
+Reasoning models emit reasoning traces (e.g. `<think>...</think>`) before their answer.
+Those are separated from the answer as the output is generated, so that a per-model
+policy can decide what is returned and remembered in history.
+"""
+
+REASONING_POLICIES = ("keep", "strip", "summarize")
+
+
+class ReasoningTraceFilter:
+    """Incrementally separate reasoning traces from generated text.
+
+    Text may be fed chunk by chunk as it is generated, tags split across chunks are
+    handled by holding back any suffix which may be the beginning of a tag.
+    """
+
+    def __init__(self, start_tag: str = "<think>", end_tag: str = "</think>") -> None:
+        self.start_tag = start_tag
+        self.end_tag = end_tag
+        self._raw: list[str] = []
+        self._answer: list[str] = []
+        self._trace: list[str] = []
+        self._pending = ""
+        self._in_trace = False
+        self._seen_tag = False
+
+    def _expected_tags(self) -> list[str]:
+        """Get the tags which may appear next in the generated text."""
+        if self._in_trace:
+            return [self.end_tag]
+        if not self._seen_tag:
+            # The chat template may have opened the trace already, in which case only the end tag is generated
+            return [self.start_tag, self.end_tag]
+        return [self.start_tag]
+
+    def _emit(self, text: str) -> None:
+        if text:
+            (self._trace if self._in_trace else self._answer).append(text)
+
+    def feed(self, text: str) -> None:
+        """Feed a chunk of generated text."""
+        self._raw.append(text)
+        self._pending += text
+
+        while True:
+            matches = [(self._pending.find(tag), tag) for tag in self._expected_tags() if tag in self._pending]
+            if not matches:
+                break
+
+            index, tag = min(matches)
+            self._emit(self._pending[:index])
+            self._pending = self._pending[index + len(tag) :]
+
+            if tag == self.end_tag and not self._in_trace:
+                # Generation started inside the trace, everything so far was reasoning
+                self._trace.extend(self._answer)
+                self._answer = []
+
+            self._in_trace = tag == self.start_tag
+            self._seen_tag = True
+
+        # Hold back a suffix which may be the beginning of a tag
+        hold = max((length for tag in self._expected_tags() for length in range(1, len(tag)) if self._pending.endswith(tag[:length])), default=0)
+        self._emit(self._pending[: len(self._pending) - hold])
+        self._pending = self._pending[len(self._pending) - hold :]
+
+    def reset(self) -> None:
+        """Discard the text fed so far (e.g. when generation is restarted)."""
+        self._raw, self._answer, self._trace = [], [], []
+        self._pending = ""
+        self._in_trace = False
+        self._seen_tag = False
+
+    def flush(self) -> None:
+        """Flush any held back text once generation is complete."""
+        self._emit(self._pending)
+        self._pending = ""
+
+    @property
+    def raw(self) -> str:
+        """Generated text, including reasoning traces."""
+        return "".join(self._raw)
+
+    @property
+    def answer(self) -> str:
+        """Generated text, without reasoning traces."""
+        return "".join(self._answer).strip()
+
+    @property
+    def trace(self) -> str:
+        """Reasoning traces found in the generated text."""
+        return "".join(self._trace).strip()
+
+
+def summarize_reasoning_trace(trace: str, max_length: int = 500) -> str:
+    """Summarize a reasoning trace by keeping its conclusion (last paragraph), capped to `max_length` characters."""
+    paragraphs = [paragraph.strip() for paragraph in trace.split("\n\n") if paragraph.strip()]
+    if not paragraphs:
+        return ""
+    conclusion = paragraphs[-1]
+    if len(conclusion) > max_length:
+        conclusion = "..." + conclusion[-max_length:]
+    return conclusion
+
+
+def split_reasoning(text: str, start_tag: str = "<think>", end_tag: str = "</think>") -> ReasoningTraceFilter:
+    """Separate reasoning traces from a fully generated text."""
+    text_filter = ReasoningTraceFilter(start_tag, end_tag)
+    text_filter.feed(text)
+    text_filter.flush()
+    return text_filter
+
+
+def apply_reasoning_policy(text_filter: ReasoningTraceFilter, policy: str, summary_max_length: int = 500) -> tuple[str, str]:
+    """Apply a reasoning trace policy to separated generated text.
+
+    Args:
+        text_filter: Filter which has been fed the generated text
+        policy: Reasoning trace policy (keep, strip, summarize)
+        summary_max_length: Maximum length of the trace summary (summarize policy)
+
+    Returns:
+        Tuple of (response, remembered) where `response` is returned to the caller and
+        `remembered` is stored in history
+    """
+    if policy not in REASONING_POLICIES:
+        raise ValueError(f"Invalid reasoning policy: {policy} (must be one of {REASONING_POLICIES})")
+
+    if policy == "keep":
+        return text_filter.raw, text_filter.raw
+
+    if policy == "summarize" and text_filter.trace:
+        summary = summarize_reasoning_trace(text_filter.trace, summary_max_length)
+        return text_filter.answer, f"{text_filter.start_tag}{summary}{text_filter.end_tag}\n\n{text_filter.answer}"
+
+    return text_filter.answer, text_filter.answer
@@ -0,0 +1,64 @@
+"""
+Test script for the separation of reasoning traces and the reasoning trace policies (see `reasoning.py`).
+
+To run this script from the project root run:
+   python -m universal_intelligence.community.models.__utils__.reasoning_test
+"""
+
+from .reasoning import ReasoningTraceFilter, apply_reasoning_policy, split_reasoning, summarize_reasoning_trace
+from .test import check
+
+TEXT = "<think>First idea.\n\nSo the answer is 4.</think>\n\nThe answer is 4."
+
+
+def run_reasoning_tests() -> None:
+    """Test separating traces from whole and streamed text, and applying the keep, strip and summarize policies."""
+    print("\033[94m" + "\n\n================================================\n## Testing reasoning traces \n================================================\n" + "\033[0m")
+
+    text_filter = split_reasoning(TEXT)
+    check("trace separated", text_filter.trace == "First idea.\n\nSo the answer is 4." and text_filter.answer == "The answer is 4.", (text_filter.trace, text_filter.answer))
+    check("raw text kept", text_filter.raw == TEXT)
+
+    # Tags split across streamed chunks are held back until complete
+    for size in (1, 2, 3, 5):
+        text_filter = ReasoningTraceFilter()
+        answers = []
+        for i in range(0, len(TEXT), size):
+            text_filter.feed(TEXT[i : i + size])
+            answers.append(text_filter.answer)
+        text_filter.flush()
+        check(f"streamed by {size} characters", text_filter.trace == split_reasoning(TEXT).trace and text_filter.answer == "The answer is 4.", (text_filter.trace, text_filter.answer))
+        check(f"no tag leaked by {size} characters", not any("<" in answer for answer in answers), answers)
+
+    # Generation may start inside the trace (opened by the chat template), or without any trace
+    text_filter = split_reasoning("Thinking it over.</think>Done.")
+    check("trace opened by the template", text_filter.trace == "Thinking it over." and text_filter.answer == "Done.", (text_filter.trace, text_filter.answer))
+    text_filter = split_reasoning("No trace a < b.")
+    check("text without trace", text_filter.answer == "No trace a < b." and not text_filter.trace, text_filter.answer)
+    text_filter = split_reasoning("[R]a[/R]b", start_tag="[R]", end_tag="[/R]")
+    check("custom tags", text_filter.trace == "a" and text_filter.answer == "b", (text_filter.trace, text_filter.answer))
+
+    # Restarted generation discards the text fed so far
+    text_filter = ReasoningTraceFilter()
+    text_filter.feed("<think>partial")
+    text_filter.reset()
+    text_filter.feed("Answer.")
+    text_filter.flush()
+    check("reset", text_filter.answer == "Answer." and not text_filter.trace and text_filter.raw == "Answer.")
+
+    # Policies decide what is returned and remembered
+    text_filter = split_reasoning(TEXT)
+    check("keep policy", apply_reasoning_policy(text_filter, "keep") == (TEXT, TEXT))
+    check("strip policy", apply_reasoning_policy(text_filter, "strip") == ("The answer is 4.", "The answer is 4."))
+    response, remembered = apply_reasoning_policy(text_filter, "summarize")
+    check("summarize policy", response == "The answer is 4." and remembered == "<think>So the answer is 4.</think>\n\nThe answer is 4.", remembered)
+    check("summary capped", summarize_reasoning_trace("a" * 20, max_length=5) == "...aaaaa")
+    try:
+        apply_reasoning_policy(text_filter, "hide")
+        check("invalid policy rejected", False)
+    except ValueError:
+        check("invalid policy rejected", True)
+
+
+if __name__ == "__main__":
+    run_reasoning_tests()
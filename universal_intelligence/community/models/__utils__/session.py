@@ -0,0 +1,63 @@
+"""
+Shared session utilities for Universal Models.
+
+A session is a conversation handle over a shared, resident model. Each session has its own
+history and (for local models) its own cached KV state, so that many conversations can be
+served by a single loaded model.
+"""
+
+import itertools
+import time
+from typing import Any
+
+from ....core.utils.types import Message
+
+_session_ids = itertools.count(1)
+
+
+class Session:
+    """Conversation handle with its own history and cached state over a shared model."""
+
+    def __init__(self, model: Any, adapter: str | None = None) -> None:
+        """Initialize a session over a model (see `model.session()`), processed with one of its adapters if provided."""
+        self.id: int = next(_session_ids)
+        self.model = model
+        self.adapter = adapter
+        self.history: list[Message] = []
+        self.last_used: float = time.monotonic()
+        self._kv: Any | None = None  # engine-specific cached KV state, managed by the model
+        self._kv_adapter: str | None = None  # adapter the KV state was computed with
+
+    def process(self, input: Any | list[Message], context: list[Any] | None = None, configuration: dict | None = None, remember: bool = True, keep_alive: bool = True) -> tuple[Any, dict]:
+        """Process input through the shared model, within this session.
+
+        Sessions remember interactions and keep the model loaded by default.
+
+        Args:
+            input: Input to process
+            context: Optional context for the model
+            configuration: Optional configuration for processing
+            remember: Whether to remember the interaction in the session history
+            keep_alive: Whether to keep the shared model loaded for faster consecutive interactions
+        Returns:
+            Tuple of (output, metadata)
+        """
+        self.touch()
+        return self.model._process(input, context=context, configuration=configuration, remember=remember, keep_alive=keep_alive, session=self)
+
+    def touch(self) -> None:
+        """Mark the session as used."""
+        self.last_used = time.monotonic()
+
+    def cached(self) -> bool:
+        """Check if the session holds cached KV state"""
+        return self._kv is not None
+
+    def evict(self) -> None:
+        """Evict the session's cached KV state (history is kept)."""
+        self._kv = None
+
+    def reset(self) -> None:
+        """Reset session chat history and cached state."""
+        self.history = []
+        self._kv = None
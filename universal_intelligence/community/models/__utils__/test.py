@@ -43,6 +43,13 @@ class ConfigurationTracker:
         print("\n")
 
 
+def check(name: str, condition: bool, details: object = "") -> None:
+    """Check a condition of a component test, raising with its details if it does not hold."""
+    if not condition:
+        raise AssertionError(f"{name} {details}")
+    print("\033[92m" + f" [PASSED] {name}" + "\033[0m")
+
+
 def test_meta_information(model_class: AbstractUniversalModel):
     """Test the meta information of the model class."""
     print("\033[94m" + "\n\n================================================\n## Testing meta information \n================================================\n" + "\033[0m")
@@ -2,8 +2,8 @@ import os
 from typing import ClassVar
 
 from .....core.utils.types import Compatibility, Contract
+from ...__utils__.mixins.hf_text_to_text.catalog import catalog_compatibility, catalog_contract, catalog_sources
 from ...__utils__.mixins.hf_text_to_text.interface import UniversalModelMixin
-from ...__utils__.mixins.hf_text_to_text.meta import generate_sources_from_yaml, generate_standard_compatibility, generate_standard_contract
 from ...__utils__.mixins.hf_text_to_text.types import ChatTemplate, InferenceConfiguration, ModelConfiguration, ProcessorConfiguration, Sources
 
 
@@ -77,7 +77,7 @@ class UniversalModel(UniversalModelMixin):
     def __init__(self, *args, **kwargs) -> None:
         """Initialize model with specified engine and configuration."""
         sources_yaml_path = os.path.join(os.path.dirname(__file__), "sources.yaml")
-        self._sources: Sources = generate_sources_from_yaml(sources_yaml_path)
+        self._sources: Sources = catalog_sources(sources_yaml_path)
         super().__init__(
             interface_config={
                 "name": self._name,
@@ -93,8 +93,8 @@ class UniversalModel(UniversalModelMixin):
 
     @classmethod
     def contract(cls) -> Contract:
-        return generate_standard_contract(cls._name, cls._description)
+        return catalog_contract(cls._name, cls._description)
 
     @classmethod
     def compatibility(cls) -> list[Compatibility]:
-        return generate_standard_compatibility(cls()._sources)
+        return catalog_compatibility(os.path.join(os.path.dirname(__file__), "sources.yaml"))
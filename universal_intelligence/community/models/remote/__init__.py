@@ -0,0 +1,26 @@
+"""
+Remote Universal Intelligence models.
+
+The OpenRouter models are served from a catalog table (see `__utils__/mixins/openrouter_text_to_text/catalog.py`): their
+packages (e.g. `remote.deepseek_r1__free`) are generated on first import, and can be listed or filtered without
+importing them with `catalog()` and `query()`.
+"""
+
+import importlib
+from typing import Any
+
+from ..__utils__.mixins.openrouter_text_to_text.catalog import catalog, install, load_catalog, query
+
+install()
+
+__all__ = ["catalog", "query"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in load_catalog()["models"]:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *load_catalog()["models"]})
@@ -1,34 +0,0 @@
-from typing import ClassVar
-
-from .....core.utils.types import Compatibility, Contract
-from ...__utils__.mixins.openrouter_text_to_text.interface import UniversalModelMixin
-from ...__utils__.mixins.openrouter_text_to_text.meta import generate_standard_compatibility, generate_standard_contract
-from ...__utils__.mixins.openrouter_text_to_text.types import InferenceConfiguration
-
-
-class UniversalModel(UniversalModelMixin):
-    _name: ClassVar[str] = "aion-labs/aion-1.0"
-    _description: ClassVar[str] = (
-        "Aion-1.0 is a multi-model system designed for high performance across various tasks, including reasoning and coding. It is built on DeepSeek-R1, augmented with additional models and techniques such as Tree of Thoughts (ToT) and Mixture of Experts (MoE). It is Aion Lab's most powerful reasoning model."
-    )
-
-    _inference_configuration: ClassVar[InferenceConfiguration] = {"openrouter": {"max_new_tokens": 2500, "temperature": 0.1}}
-
-    def __init__(self, *args, **kwargs) -> None:
-        """Initialize model with specified engine and configuration."""
-        super().__init__(
-            interface_config={
-                "name": self._name,
-                "inference_configuration": self._inference_configuration,
-            },
-            *args,
-            **kwargs,
-        )
-
-    @classmethod
-    def contract(cls) -> Contract:
-        return generate_standard_contract(cls._name, cls._description)
-
-    @classmethod
-    def compatibility(cls) -> list[Compatibility]:
-        return generate_standard_compatibility()
@@ -1,34 +0,0 @@
-from typing import ClassVar
-
-from .....core.utils.types import Compatibility, Contract
-from ...__utils__.mixins.openrouter_text_to_text.interface import UniversalModelMixin
-from ...__utils__.mixins.openrouter_text_to_text.meta import generate_standard_compatibility, generate_standard_contract
-from ...__utils__.mixins.openrouter_text_to_text.types import InferenceConfiguration
-
-
-class UniversalModel(UniversalModelMixin):
-    _name: ClassVar[str] = "aion-labs/aion-1.0-mini"
-    _description: ClassVar[str] = (
-        "Aion-1.0-Mini 32B parameter model is a distilled version of the DeepSeek-R1 model, designed for strong performance in reasoning domains such as mathematics, coding, and logic. It is a modified variant of a FuseAI model that outperforms R1-Distill-Qwen-32B and R1-Distill-Llama-70B, with benchmark results available on its [Hugging Face page](https://huggingface.co/FuseAI/FuseO1-DeepSeekR1-QwQ-SkyT1-32B-Preview), independently replicated for verification."
-    )
-
-    _inference_configuration: ClassVar[InferenceConfiguration] = {"openrouter": {"max_new_tokens": 2500, "temperature": 0.1}}
-
-    def __init__(self, *args, **kwargs) -> None:
-        """Initialize model with specified engine and configuration."""
-        super().__init__(
-            interface_config={
-                "name": self._name,
-                "inference_configuration": self._inference_configuration,
-            },
-            *args,
-            **kwargs,
-        )
-
-    @classmethod
-    def contract(cls) -> Contract:
-        return generate_standard_contract(cls._name, cls._description)
-
-    @classmethod
-    def compatibility(cls) -> list[Compatibility]:
-        return generate_standard_compatibility()
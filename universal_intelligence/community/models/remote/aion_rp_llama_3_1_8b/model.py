@@ -1,34 +0,0 @@
-from typing import ClassVar
-
-from .....core.utils.types import Compatibility, Contract
-from ...__utils__.mixins.openrouter_text_to_text.interface import UniversalModelMixin
-from ...__utils__.mixins.openrouter_text_to_text.meta import generate_standard_compatibility, generate_standard_contract
-from ...__utils__.mixins.openrouter_text_to_text.types import InferenceConfiguration
-
-
-class UniversalModel(UniversalModelMixin):
-    _name: ClassVar[str] = "aion-labs/aion-rp-llama-3.1-8b"
-    _description: ClassVar[str] = (
-        "Aion-RP-Llama-3.1-8B ranks the highest in the character evaluation portion of the RPBench-Auto benchmark, a roleplaying-specific variant of Arena-Hard-Auto, where LLMs evaluate each other's responses. It is a fine-tuned base model rather than an instruct model, designed to produce more natural and varied writing."
-    )
-
-    _inference_configuration: ClassVar[InferenceConfiguration] = {"openrouter": {"max_new_tokens": 2500, "temperature": 0.1}}
-
-    def __init__(self, *args, **kwargs) -> None:
-        """Initialize model with specified engine and configuration."""
-        super().__init__(
-            interface_config={
-                "name": self._name,
-                "inference_configuration": self._inference_configuration,
-            },
-            *args,
-            **kwargs,
-        )
-
-    @classmethod
-    def contract(cls) -> Contract:
-        return generate_standard_contract(cls._name, cls._description)
-
-    @classmethod
-    def compatibility(cls) -> list[Compatibility]:
-        return generate_standard_compatibility()
@@ -1,32 +0,0 @@
-from typing import ClassVar
-
-from .....core.utils.types import Compatibility, Contract
-from ...__utils__.mixins.openrouter_text_to_text.interface import UniversalModelMixin
-from ...__utils__.mixins.openrouter_text_to_text.meta import generate_standard_compatibility, generate_standard_contract
-from ...__utils__.mixins.openrouter_text_to_text.types import InferenceConfiguration
-
-
-class UniversalModel(UniversalModelMixin):
-    _name: ClassVar[str] = "jondurbin/airoboros-l2-70b"
-    _description: ClassVar[str] = "A Llama 2 70B fine-tune using synthetic data (the Airoboros dataset). Currently based on [jondurbin/airoboros-l2-70b](https://huggingface.co/jondurbin/airoboros-l2-70b-2.2.1), but might get updated in the future."
-
-    _inference_configuration: ClassVar[InferenceConfiguration] = {"openrouter": {"max_new_tokens": 2500, "temperature": 0.1}}
-
-    def __init__(self, *args, **kwargs) -> None:
-        """Initialize model with specified engine and configuration."""
-        super().__init__(
-            interface_config={
-                "name": self._name,
-                "inference_configuration": self._inference_configuration,
-            },
-            *args,
-            **kwargs,
-        )
-
-    @classmethod
-    def contract(cls) -> Contract:
-        return generate_standard_contract(cls._name, cls._description)
-
-    @classmethod
-    def compatibility(cls) -> list[Compatibility]:
-        return generate_standard_compatibility()
@@ -0,0 +1,34 @@
+from typing import ClassVar
+
+from .....core.utils.types import Compatibility, Contract
+from ...__utils__.mixins.openai_text_to_text.interface import UniversalModelMixin
+from ...__utils__.mixins.openai_text_to_text.meta import generate_standard_compatibility, generate_standard_contract
+from ...__utils__.mixins.openai_text_to_text.types import InferenceConfiguration
+
+
+class UniversalModel(UniversalModelMixin):
+    _name: ClassVar[str] = "openai-compatible"
+    _description: ClassVar[str] = (
+        "Any model served behind an OpenAI-compatible API (eg. vLLM, llama.cpp server, TGI, Ollama, LM Studio), such as self-hosted inference servers. The server is set with the `base_url` configuration, and the served model with `model` (defaults to the first model listed by the server)."
+    )
+
+    _inference_configuration: ClassVar[InferenceConfiguration] = {"openai": {"max_new_tokens": 2500, "temperature": 0.1}}
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize model with specified server and configuration."""
+        super().__init__(
+            interface_config={
+                "name": None,
+                "inference_configuration": self._inference_configuration,
+            },
+            *args,
+            **kwargs,
+        )
+
+    @classmethod
+    def contract(cls) -> Contract:
+        return generate_standard_contract(cls._name, cls._description)
+
+    @classmethod
+    def compatibility(cls) -> list[Compatibility]:
+        return generate_standard_compatibility()
@@ -0,0 +1,166 @@
+"""
+Test script for the OpenAI-compatible model, end to end against a local stub server.
+
+To run this script from the project root run:
+   python -m universal_intelligence.community.models.remote.openai_compatible.test
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ...__utils__.test import test_meta_information, test_model
+from .model import UniversalModel
+
+
+class StubServer(ThreadingHTTPServer):
+    """Stub OpenAI-compatible server, echoing the last message (one candidate per request, like servers without `n` support)."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.model_list_requests = 0
+        self.reject_logprobs = False  # like servers without logprobs support
+        self.reject_n = False  # like servers only supporting `n=1` (e.g. llama.cpp server)
+        self.n_requests = 0  # requests for several candidates
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def _send_json(self, data: dict) -> None:
+        body = json.dumps(data).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.path != "/v1/models":
+            self.send_error(404)
+            return
+        self.server.model_list_requests += 1
+        self._send_json({"object": "list", "data": [{"id": "stub-model", "object": "model"}]})
+
+    def do_POST(self) -> None:
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if self.path != "/v1/chat/completions" or request["model"] != "stub-model":
+            self.send_error(404)
+            return
+        if request.get("logprobs") and self.server.reject_logprobs:
+            self.send_error(400, "logprobs are not supported")
+            return
+        if request.get("n", 1) != 1:
+            self.server.n_requests += 1
+            if self.server.reject_n:
+                self.send_error(400, "only one completion choice is allowed")
+                return
+
+        with self.server.lock:
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+        time.sleep(0.2)
+        with self.server.lock:
+            self.server.in_flight -= 1
+
+        words = f"Echo: {request['messages'][-1]['content']}".split(" ")
+        logprobs = {"content": [{"token": word, "logprob": -0.5} for word in words]} if request.get("logprobs") else None
+        if not request.get("stream"):
+            self._send_json({"choices": [{"index": 0, "message": {"role": "assistant", "content": " ".join(words)}, "logprobs": logprobs, "finish_reason": "stop"}]})
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        for i, word in enumerate(words):
+            chunk = {"choices": [{"index": 0, "delta": {"content": word if i == 0 else f" {word}"}}]}
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            self.wfile.flush()
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.close_connection = True
+
+
+def run_stub_server_tests(server: StubServer) -> None:
+    """Test discovery, streaming, batching and candidate sampling against the stub server."""
+    print("\033[94m" + "\n\n================================================\n## Testing against stub server \n================================================\n" + "\033[0m")
+
+    configuration = {"base_url": server.base_url, "models_ttl": 60}
+    model = UniversalModel(configuration=configuration)
+    assert model.name == "stub-model", model.name
+
+    # Served models are cached across instances
+    requests_before = server.model_list_requests
+    UniversalModel(configuration=configuration)
+    assert server.model_list_requests == requests_before, "model list was not cached"
+    model.models(refresh=True)
+    assert server.model_list_requests == requests_before + 1, "model list was not refreshed"
+
+    # Streamed and non-streamed outputs match
+    output, _ = model.process("Hello there")
+    streamed_output, _ = model.process("Hello there", stream=True)
+    assert output == streamed_output == "Echo: Hello there", (output, streamed_output)
+
+    # Batched inputs are submitted concurrently, in order
+    server.max_in_flight = 0
+    results = model.process_batch([f"Input {i}" for i in range(4)])
+    assert [output for output, _ in results] == [f"Echo: Input {i}" for i in range(4)], results
+    assert server.max_in_flight > 1, "batch was not submitted concurrently"
+
+    # Missing candidates are requested concurrently
+    candidates, logs = model.process("Name a color", configuration={"n": 3})
+    assert len(candidates) == 3 and len(logs["logprobs"]) == 3, (candidates, logs)
+
+    # Servers rejecting logprobs are retried without them, and the first candidate is remembered
+    server.reject_logprobs = True
+    fallback_model = UniversalModel(configuration=configuration)
+    candidates, logs = fallback_model.process("Name a color", configuration={"n": 2}, remember=True)
+    assert len(candidates) == 2 and logs["logprobs"] == [None, None], (candidates, logs)
+    assert fallback_model.history[-1]["content"] == candidates[0] and not fallback_model._logprobs_supported, fallback_model.history
+    server.reject_logprobs = False
+
+    # Servers rejecting `n` are retried with concurrent single requests, and `n` is no longer requested from them
+    server.reject_n = True
+    server.max_in_flight = 0
+    single_model = UniversalModel(configuration=configuration)
+    candidates, logs = single_model.process("Name a color", configuration={"n": 3})
+    assert len(candidates) == 3 and len(logs["logprobs"]) == 3 and not single_model._n_supported, (candidates, logs)
+    assert server.max_in_flight > 1, "candidates were not requested concurrently"
+    n_requests = server.n_requests
+    candidates, _ = single_model.process("Name a color", configuration={"n": 2}, stream=True)
+    assert len(candidates) == 2 and server.n_requests == n_requests, (candidates, server.n_requests)
+    server.reject_n = False
+
+    # Sessions remember their own history
+    session = model.session()
+    session.process("First message")
+    session.process("Second message")
+    assert len(session.history) == 4 and not model.history, session.history
+
+    model.unload()
+    print("\033[92m" + "\n--------------------------------------------------\n [PASSED] Stub server checks" + "\033[0m\n--------------------------------------------------\n\n\n")
+
+
+if __name__ == "__main__":
+    test_meta_information(UniversalModel)
+
+    server = StubServer()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        test_model(UniversalModel, universal_model_config={"configuration": {"base_url": server.base_url}})
+        run_stub_server_tests(server)
+    finally:
+        server.shutdown()
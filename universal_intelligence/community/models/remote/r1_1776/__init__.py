@@ -1,7 +0,0 @@
-"""
-This module contains implementations of Universal Intelligence models.
-"""
-
-from .model import UniversalModel
-
-__all__ = ["UniversalModel"]